@@ -54,30 +54,44 @@ class ClifParser:
         return output_line.id
 
     def _parse_expression(self, expr, context_id):
-        """Recursively parses a CLIF s-expression."""
+        """
+        Parses a CLIF s-expression into the given context.
+
+        Nesting is handled with an explicit work stack instead of recursion,
+        so deeply nested input is not limited by the interpreter's recursion
+        depth. Each entry is (expr, context_id, cuts), where cuts is the
+        number of nested cuts to open inside context_id before expr is
+        parsed; opening them when the entry is popped keeps objects created
+        in the same order as a depth-first walk.
+        """
+        stack = [(expr, context_id, 0)]
+        while stack:
+            expr, context_id, cuts = stack.pop()
+            for _ in range(cuts):
+                context_id = self.editor.add_cut(parent_id=context_id)
+            self._parse_node(expr, context_id, stack)
+
+    def _parse_node(self, expr, context_id, stack):
+        """Parses one s-expression node, pushing nested sentences onto the work stack."""
         if not isinstance(expr, list) or not expr:
             return
 
         operator = expr[0]
 
         if operator == 'exists':
-            self._parse_expression(expr[2], context_id)
+            stack.append((expr[2], context_id, 0))
         elif operator == 'and':
-            for clause in expr[1:]:
-                self._parse_expression(clause, context_id)
+            # Pushed in reverse so clauses are popped in source order.
+            stack.extend((clause, context_id, 0) for clause in reversed(expr[1:]))
         elif operator == 'not':
-            cut_id = self.editor.add_cut(parent_id=context_id)
-            self._parse_expression(expr[1], cut_id)
+            stack.append((expr[1], context_id, 1))
         elif operator == 'forall':
-            cut1_id = self.editor.add_cut(parent_id=context_id)
-            cut2_id = self.editor.add_cut(parent_id=cut1_id)
-            self._parse_expression(expr[2], cut2_id)
+            stack.append((expr[2], context_id, 2))
         elif operator == 'if':
             cut1_id = self.editor.add_cut(parent_id=context_id)
-            self._parse_expression(expr[1], cut1_id)
-            cut2_id = self.editor.add_cut(parent_id=cut1_id)
-            self._parse_expression(expr[2], cut2_id)
-        
+            stack.append((expr[2], cut1_id, 1))
+            stack.append((expr[1], cut1_id, 0))
+
         elif operator == '=':
             line1_id = self._parse_term(expr[1], context_id)
             line2_id = self._parse_term(expr[2], context_id)
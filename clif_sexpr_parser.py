@@ -1,4 +1,5 @@
 import re
+from itertools import islice
 
 class SexprParser:
     """A simple S-expression parser for CLIF strings."""
@@ -13,19 +14,28 @@ class SexprParser:
         return s.split()
 
     def _build_from_tokens(self, tokens):
-        """Recursively builds the nested list from a stream of tokens."""
+        """Builds the nested list for the first expression in a list of tokens.
+
+        The lists still open are kept on a stack of their own instead of the
+        call stack, so deep nesting does not hit the recursion limit.
+        """
         if not tokens:
             raise ValueError("Unexpected EOF while reading")
-        token = tokens.pop(0)
-        if token == '(':
-            L = []
-            while tokens and tokens[0] != ')':
-                L.append(self._build_from_tokens(tokens))
-            if not tokens:
-                raise ValueError("Unclosed parenthesis")
-            tokens.pop(0)
-            return L
-        elif token == ')':
+        token = tokens[0]
+        if token == ')':
             raise ValueError("Unexpected ')'")
-        else:
-            return token
\ No newline at end of file
+        if token != '(':
+            return token
+        stack = [[]]
+        for token in islice(tokens, 1, None):
+            if token == '(':
+                L = []
+                stack[-1].append(L)
+                stack.append(L)
+            elif token == ')':
+                L = stack.pop()
+                if not stack:
+                    return L
+            else:
+                stack[-1].append(token)
+        raise ValueError("Unclosed parenthesis")
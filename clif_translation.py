@@ -1,6 +1,21 @@
+import io
 from collections import defaultdict
 from eg_model import Cut, Predicate, LineOfIdentity
 
+class _TranslationState:
+    """
+    Per-call bookkeeping for ClifTranslator.translate(). Keeping it off the
+    translator makes translate() reentrant, so several translators can
+    share one graph, and lets the hot helpers read it through a local name.
+    """
+    __slots__ = ('parent_index', 'line_to_variable_map', 'line_scope_cache', 'context_depth_cache')
+
+    def __init__(self, parent_index):
+        self.parent_index = parent_index
+        self.line_to_variable_map = {}
+        self.line_scope_cache = {}
+        self.context_depth_cache = {}
+
 class ClifTranslator:
     """
     Translates an EG model into a canonical CLIF notation using a
@@ -9,66 +24,67 @@ class ClifTranslator:
     def __init__(self, editor):
         self.editor = editor
         self.model = editor.model
-        self.variable_counter = 0
-        self.line_to_variable_map = {}
-        self.line_scope_cache = {}
-        self.context_depth_cache = {}
 
-    def _get_context_depth(self, context_id):
+    def _get_context_depth(self, context_id, state):
         """Helper to calculate and cache the nesting depth of a context."""
-        if context_id in self.context_depth_cache:
-            return self.context_depth_cache[context_id]
+        context_depth_cache = state.context_depth_cache
+        if context_id in context_depth_cache:
+            return context_depth_cache[context_id]
         
+        parent_index = state.parent_index
+        sheet_id = self.model.sheet_of_assertion.id
         depth = 0
         current_id = context_id
-        while current_id != self.model.sheet_of_assertion.id:
-            # Assumes editor has a method to get a parent context id.
-            # If not, this might need to be adapted to traverse the model directly.
-            parent_context = self.editor.get_parent_context(current_id)
+        while current_id != sheet_id:
+            parent_context = parent_index.get(current_id)
             if not parent_context:
                 break 
             depth += 1
             current_id = parent_context
         
-        self.context_depth_cache[context_id] = depth
+        context_depth_cache[context_id] = depth
         return depth
 
-    def _get_line_scope(self, line_id):
-        if line_id in self.line_scope_cache:
-            return self.line_scope_cache[line_id]
+    def _get_line_scope(self, line_id, state):
+        line_scope_cache = state.line_scope_cache
+        if line_id in line_scope_cache:
+            return line_scope_cache[line_id]
         line = self.model.get_object(line_id)
         if not line or not line.ligatures: return None
+        parent_index = state.parent_index
         attachment_contexts = {
-            self.editor.get_parent_context(pred_id)
+            parent_index.get(pred_id)
             for lig_id in line.ligatures
             if (lig := self.model.get_object(lig_id))
             for pred_id, _ in lig.attachments
-            if self.editor.get_parent_context(pred_id) is not None
+            if parent_index.get(pred_id) is not None
         }
         if not attachment_contexts:
             return self.model.sheet_of_assertion.id
-        lca = self.editor._find_lca(list(attachment_contexts))
-        self.line_scope_cache[line_id] = lca
+        lca = self.editor._find_lca(list(attachment_contexts), parent_index.get)
+        line_scope_cache[line_id] = lca
         return lca
 
-    def _discover_and_assign_variables(self):
+    def _discover_and_assign_variables(self, state):
         """
         Pre-pass to assign canonical variable names based on a truly stable
         topological key: (deepest_nesting, predicate_label, hook_number).
         """
         all_lines = [obj for obj in self.model.objects.values() if isinstance(obj, LineOfIdentity)]
+        get_object = self.model.get_object
+        parent_index = state.parent_index
         
         def get_stable_sort_key(line):
             """Create a canonical sorting key from a line's connections."""
             attachments = []
             if line.ligatures:
                 for lig_id in line.ligatures:
-                    if (lig := self.model.get_object(lig_id)):
+                    if (lig := get_object(lig_id)):
                         for pred_id, hook_num in lig.attachments:
-                            pred = self.model.get_object(pred_id)
+                            pred = get_object(pred_id)
                             if pred:
-                                parent_context_id = self.editor.get_parent_context(pred_id)
-                                depth = self._get_context_depth(parent_context_id)
+                                parent_context_id = parent_index.get(pred_id)
+                                depth = self._get_context_depth(parent_context_id, state)
                                 # Sort by depth (inside-out), then label, then hook number.
                                 attachments.append((-depth, pred.label, hook_num))
             attachments.sort()
@@ -76,61 +92,108 @@ class ClifTranslator:
 
         all_lines.sort(key=get_stable_sort_key)
         
+        line_to_variable_map = state.line_to_variable_map
+        variable_counter = 0
         for line in all_lines:
-            if line.id not in self.line_to_variable_map:
-                self.variable_counter += 1
-                self.line_to_variable_map[line.id] = f"?v{self.variable_counter}"
+            if line.id not in line_to_variable_map:
+                variable_counter += 1
+                line_to_variable_map[line.id] = f"?v{variable_counter}"
 
     def translate(self):
-        self.line_to_variable_map.clear()
-        self.variable_counter = 0
-        self.line_scope_cache.clear()
-        self.context_depth_cache.clear()
-        self._discover_and_assign_variables()
-        return self._translate_context(self.model.sheet_of_assertion)
-
-    def _translate_context(self, context):
-        predicates = [self.model.get_object(cid) for cid in context.children if isinstance(self.model.get_object(cid), Predicate)]
-        cuts = [self.model.get_object(cid) for cid in context.children if isinstance(self.model.get_object(cid), Cut)]
+        # The editor's parent cache, rebuilt in one pass, so parent lookups
+        # during translation are a dict probe instead of a model scan.
+        state = _TranslationState(self.editor.index_parents())
+        self._discover_and_assign_variables(state)
+        buf = io.StringIO()
+        self._emit_context(self.model.sheet_of_assertion, buf, state)
+        return buf.getvalue()
+
+    def _translate_context(self, context, state):
+        """Translate a single context into a standalone CLIF string."""
+        buf = io.StringIO()
+        self._emit_context(context, buf, state)
+        return buf.getvalue()
+
+    def _emit_context(self, context, buf, state):
+        """
+        Write the CLIF for a context straight into the ``buf`` sink.
+        Clauses still have to be rendered to strings first so they can be
+        sorted into canonical order; everything around them is written
+        directly instead of being rebuilt at every nesting level.
+        """
+        children = [self.model.get_object(cid) for cid in context.children]
+        predicates = [c for c in children if isinstance(c, Predicate)]
+        cuts = [c for c in children if isinstance(c, Cut)]
         
-        pred_clauses = sorted([self._translate_predicate(p) for p in predicates])
-        cut_clauses = sorted([self._translate_context(c) for c in cuts if self._translate_context(c)])
+        pred_clauses = sorted([self._translate_predicate(p, state) for p in predicates])
+        cut_clauses = sorted([clause for c in cuts if (clause := self._translate_context(c, state))])
 
         all_clauses = pred_clauses + cut_clauses
         
-        if not all_clauses: return ""
+        if not all_clauses: return
 
-        vars_to_quantify = sorted([
-            var_name for line_id, var_name in self.line_to_variable_map.items()
-            if self._get_line_scope(line_id) == context.id
-        ])
+        write = buf.write
+        is_cut = isinstance(context, Cut)
+        if is_cut:
+            write("(not ")
+            vars_to_quantify = None
+        else:
+            vars_to_quantify = sorted([
+                var_name for line_id, var_name in state.line_to_variable_map.items()
+                if self._get_line_scope(line_id, state) == context.id
+            ])
+            if vars_to_quantify:
+                write("(exists (")
+                write(' '.join(vars_to_quantify))
+                write(") ")
 
         if len(all_clauses) > 1:
-            body = f"(and {' '.join(all_clauses)})"
+            write("(and ")
+            write(' '.join(all_clauses))
+            write(")")
         else:
             body = all_clauses[0]
-            if isinstance(context, Cut) and body.startswith('(') and body.endswith(')'):
+            if is_cut and body.startswith('(') and body.endswith(')'):
                 if ' ' not in body and not body.startswith('(= '):
                      body = body[1:-1]
-        
-        if isinstance(context, Cut):
-            return f"(not {body})"
+            write(body)
 
-        if vars_to_quantify:
-            return f"(exists ({' '.join(vars_to_quantify)}) {body})"
-        else:
-            return body
+        if is_cut or vars_to_quantify:
+            write(")")
 
-    def _translate_predicate(self, predicate):
+    def _translate_predicate(self, predicate, state):
         """Translate a predicate, preserving argument order by sorting hooks numerically."""
+        line_to_variable_map = state.line_to_variable_map
+        hooks = predicate.hooks
+
+        if not predicate.is_functional:
+            # Relations of arity 0-2 are the common case; build them directly
+            # instead of going through the generic sort-and-filter below.
+            arity = len(hooks)
+            if arity == 0:
+                return f"({predicate.label})"
+            if arity == 1:
+                term = line_to_variable_map.get(hooks.get(1))
+                if term is None:
+                    return f"({predicate.label})"
+                return f"({predicate.label} {term})"
+            if arity == 2:
+                term1 = line_to_variable_map.get(hooks.get(1))
+                term2 = line_to_variable_map.get(hooks.get(2))
+                if term1 is None:
+                    return f"({predicate.label} {term2})" if term2 is not None else f"({predicate.label})"
+                if term2 is None:
+                    return f"({predicate.label} {term1})"
+                return f"({predicate.label} {term1} {term2})"
+
         terms = [
-            self.line_to_variable_map.get(predicate.hooks[i])
-            for i in sorted(predicate.hooks.keys())
-            if self.line_to_variable_map.get(predicate.hooks.get(i)) is not None
+            line_to_variable_map.get(hooks[i])
+            for i in sorted(hooks.keys())
+            if line_to_variable_map.get(hooks.get(i)) is not None
         ]
 
         if predicate.is_functional:
-            output_var = self.line_to_variable_map.get(predicate.hooks.get(predicate.output_hook))
+            output_var = line_to_variable_map.get(hooks.get(predicate.output_hook))
             input_vars = [term for term in terms if term != output_var]
             func_call = f"({predicate.label}{' ' if input_vars else ''}{' '.join(input_vars)})"
             return f"(= {output_var} {func_call})"
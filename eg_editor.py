@@ -8,6 +8,7 @@ class EGEditor:
     def __init__(self):
         self.model = GraphModel()
         self.validator = Validator(self)
+        self._parent_ids = {}  # object id -> id of the context last found holding it
 
     def add_constant(self, constant_name, parent_id='SA'):
         """Implements the Existence of Constants Rule correctly."""
@@ -52,10 +53,35 @@ class EGEditor:
         return func_pred_id
 
     def get_parent_context(self, obj_id):
+        # The sheet of assertion is the outermost context.
+        if obj_id == self.model.sheet_of_assertion.id:
+            return None
+        # Parents found earlier are cached. Contexts' children are changed
+        # directly in many places, so a cached parent is checked to still
+        # hold the object before it is trusted, and the model is searched
+        # again if not.
+        parent_id = self._parent_ids.get(obj_id)
+        if parent_id is not None:
+            parent = self.model.get_object(parent_id)
+            if obj_id in getattr(parent, 'children', ()):
+                return parent_id
         for parent in self.model.objects.values():
             if hasattr(parent, 'children') and obj_id in parent.children:
+                self._parent_ids[obj_id] = parent.id
                 return parent.id
         return None
+
+    def index_parents(self):
+        # Rebuilds the parent cache from the whole model in one pass, for
+        # callers that look up the parents of many objects at once. The
+        # returned map is only current until the model next changes.
+        self._parent_ids = {
+            child_id: obj.id
+            for obj in self.model.objects.values()
+            if hasattr(obj, 'children')
+            for child_id in obj.children
+        }
+        return self._parent_ids
         
     def add_cut(self, parent_id='SA'):
         parent = self.model.get_object(parent_id)
@@ -124,20 +150,24 @@ class EGEditor:
                         obj.hooks[hook] = primary_line_id
         self.model.remove_object(other_line_id)
     
-    def _get_ancestors(self, context_id):
+    def _get_ancestors(self, context_id, get_parent=None):
+        get_parent = get_parent or self.get_parent_context
         ancestors = []
         current_id = context_id
         while current_id is not None:
             ancestors.append(current_id)
-            current_id = self.get_parent_context(current_id)
+            current_id = get_parent(current_id)
         return ancestors
 
-    def _find_lca(self, context_ids):
+    def _find_lca(self, context_ids, get_parent=None):
+        # get_parent defaults to get_parent_context; a caller holding a
+        # parent index can pass its lookup instead.
         if not context_ids: return None
-        paths = [self._get_ancestors(cid) for cid in context_ids]
+        paths = [self._get_ancestors(cid, get_parent) for cid in context_ids]
         lca_path = paths[0]
         for path in paths[1:]:
-            lca_path = [node for node in lca_path if node in path]
+            members = set(path)
+            lca_path = [node for node in lca_path if node in members]
         return lca_path[0] if lca_path else None
 
     def _calculate_traversed_cuts(self, ligature):
@@ -184,17 +214,20 @@ class EGEditor:
     def iterate(self, selection_ids, target_context_id):
         if not self.validator.can_iterate(selection_ids, target_context_id): raise ValueError("Iteration not valid.")
         id_map = {obj_id: str(uuid.uuid4()) for obj_id in selection_ids}
+        target_parent = self.model.get_object(target_context_id)
+        new_objects = []
         for obj_id in selection_ids:
             original_obj = self.model.get_object(obj_id)
             new_obj = copy.deepcopy(original_obj)
             new_obj.id = id_map[obj_id]
-            target_parent = self.model.get_object(target_context_id)
-            target_parent.children.add(new_obj.id)
-            self.model.add_object(new_obj)
             if isinstance(new_obj, Predicate):
                 for hook_index, line_id in original_obj.hooks.items():
                     if line_id:
                         new_obj.hooks[hook_index] = line_id
+            new_objects.append(new_obj)
+        # The copies are added to the model and the target context in bulk.
+        self.model.add_objects(new_objects)
+        target_parent.children.update(obj.id for obj in new_objects)
 
     def apply_functional_property_rule(self, pred1_id, pred2_id):
         if not self.validator.can_apply_functional_property_rule(pred1_id, pred2_id): raise ValueError("Cannot apply rule.")
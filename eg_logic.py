@@ -78,9 +78,11 @@ class Validator:
             return False
             
         output_hook_index = pred1.output_hook
-        for i in range(1, output_hook_index):
-            if pred1.hooks[i] != pred2.hooks[i]:
-                return False
+        # Compare all input hooks as one tuple so the element-wise equality
+        # runs inside tuple comparison rather than a Python-level loop.
+        input_hooks = range(1, output_hook_index)
+        if tuple(map(pred1.hooks.__getitem__, input_hooks)) != tuple(map(pred2.hooks.__getitem__, input_hooks)):
+            return False
         
         if pred1.hooks[output_hook_index] == pred2.hooks[output_hook_index] and pred1.hooks[output_hook_index] is not None:
             return False
@@ -50,6 +50,16 @@ class GraphModel:
             raise ValueError(f"Object with id {obj.id} already exists.")
         self.objects[obj.id] = obj
 
+    def add_objects(self, objs):
+        # All ids are checked before any object is added, so a clash leaves
+        # the model unchanged.
+        new_objects = {}
+        for obj in objs:
+            if obj.id in self.objects or obj.id in new_objects:
+                raise ValueError(f"Object with id {obj.id} already exists.")
+            new_objects[obj.id] = obj
+        self.objects.update(new_objects)
+
     def get_object(self, obj_id):
         return self.objects.get(obj_id)
 
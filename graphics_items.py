@@ -15,16 +15,21 @@ class LigatureItem(QGraphicsPathItem):
         super().__init__(parent)
         self.ligature_id = ligature_id; self.attachments = attachments
         self.setPen(QPen(Qt.black, 2)); self.setZValue(1)
+        self._points = None  # (x, y) of each attachment when the path was last built
     def get_pos_of_attachment(self, attachment):
         if isinstance(attachment, QGraphicsItem): return attachment.scenePos()
         elif isinstance(attachment, QPointF): return attachment
         return QPointF()
     def update_path(self):
-        if len(self.attachments) < 2: self.setPath(QPainterPath()); return
-        path = QPainterPath(); start_pos = self.get_pos_of_attachment(self.attachments[0])
-        path.moveTo(start_pos)
-        for attachment in self.attachments[1:]:
-            path.lineTo(self.get_pos_of_attachment(attachment))
+        # Called on every paint: the path is only rebuilt (and the geometry
+        # change signalled) when an attachment has moved since the last call.
+        points = tuple((pos.x(), pos.y()) for pos in map(self.get_pos_of_attachment, self.attachments))
+        if points == self._points: return
+        self._points = points
+        if len(points) < 2: self.setPath(QPainterPath()); return
+        path = QPainterPath(); path.moveTo(*points[0])
+        for x, y in points[1:]:
+            path.lineTo(x, y)
         self.setPath(path)
     def paint(self, painter, option, widget):
         self.update_path(); super().paint(painter, option, widget)
@@ -49,7 +54,10 @@ class PredicateItem(QGraphicsItem):
             self.hooks[i] = HookItem(predicate_id, i, hook_x, hook_y, self)
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setZValue(1)
+        # The label and hooks are fixed relative to the item, so their bounds
+        # are computed once rather than on every call from the scene.
+        self._bounding_rect = self.childrenBoundingRect()
     def boundingRect(self):
-        return self.childrenBoundingRect()
+        return self._bounding_rect
     def paint(self, painter, option, widget):
         pass
\ No newline at end of file
@@ -6,8 +6,10 @@ validating syntax, and generating helpful error messages.
 """
 
 import re
+import sys
+from array import array
 from .common import (
-    Node, Error, ProcessingResult,
+    Node, Error, ErrorQueue, ProcessingResult, ConceptPayload, RelationPayload, FunctionPayload,
     NODE_CONCEPT, NODE_RELATION, NODE_QUANTIFIER, NODE_CONTEXT, NODE_NEGATION, 
     NODE_FUNCTION, NODE_COREFERENCE,
     ERROR_SYNTAX, ERROR_SEMANTIC, ERROR_REFERENCE,
@@ -15,93 +17,249 @@ from .common import (
 )
 
 class CGIFLexer:
-    """Tokenizer for CGIF expressions."""
-    
-    # Token types
-    TOKEN_LBRACKET = "LBRACKET"      # [
-    TOKEN_RBRACKET = "RBRACKET"      # ]
-    TOKEN_LPAREN = "LPAREN"          # (
-    TOKEN_RPAREN = "RPAREN"          # )
-    TOKEN_COLON = "COLON"            # :
-    TOKEN_PIPE = "PIPE"              # |
-    TOKEN_NEGATION = "NEGATION"      # ~
-    TOKEN_DEFINING_LABEL = "DEFINING_LABEL"  # *x
-    TOKEN_BOUND_LABEL = "BOUND_LABEL"        # ?x
-    TOKEN_UNIVERSAL = "UNIVERSAL"    # @every
-    TOKEN_IDENTIFIER = "IDENTIFIER"  # Any other identifier
-    TOKEN_WHITESPACE = "WHITESPACE"  # Spaces, tabs, newlines
-    TOKEN_ERROR = "ERROR"            # Invalid token
+    """
+    Tokenizer for CGIF expressions.
     
-    def __init__(self):
-        """Initialize the lexer."""
-        # Token patterns
-        self.token_specs = [
-            (self.TOKEN_WHITESPACE, r'\s+'),
-            (self.TOKEN_LBRACKET, r'\['),
-            (self.TOKEN_RBRACKET, r'\]'),
-            (self.TOKEN_LPAREN, r'\('),
-            (self.TOKEN_RPAREN, r'\)'),
-            (self.TOKEN_COLON, r':'),
-            (self.TOKEN_PIPE, r'\|'),
-            (self.TOKEN_NEGATION, r'~'),
-            (self.TOKEN_UNIVERSAL, r'@every'),
-            (self.TOKEN_DEFINING_LABEL, r'\*[a-zA-Z0-9_]+'),
-            (self.TOKEN_BOUND_LABEL, r'\?[a-zA-Z0-9_]+'),
-            (self.TOKEN_IDENTIFIER, r'[a-zA-Z0-9_]+'),
-            (self.TOKEN_ERROR, r'.'),  # Any other character
-        ]
-        
-        # Build the regex pattern
-        self.pattern = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in self.token_specs)
-        self.regex = re.compile(self.pattern)
+    The scanner dispatches on the current character instead of running a
+    master regex, so the per-match overhead of a regex engine is paid only
+    for identifier and error runs longer than one character. Those two
+    patterns are short anchored matches, where the standard 're' module is
+    cheaper per call than an optional DFA engine such as re2.
+    """
+    
+    # Token types. These are interned so the parser's hot loops can compare
+    # them by identity ('is') rather than by value.
+    TOKEN_LBRACKET = sys.intern("LBRACKET")              # [
+    TOKEN_RBRACKET = sys.intern("RBRACKET")              # ]
+    TOKEN_LPAREN = sys.intern("LPAREN")                  # (
+    TOKEN_RPAREN = sys.intern("RPAREN")                  # )
+    TOKEN_COLON = sys.intern("COLON")                    # :
+    TOKEN_PIPE = sys.intern("PIPE")                      # |
+    TOKEN_NEGATION = sys.intern("NEGATION")              # ~
+    TOKEN_DEFINING_LABEL = sys.intern("DEFINING_LABEL")  # *x
+    TOKEN_BOUND_LABEL = sys.intern("BOUND_LABEL")        # ?x
+    TOKEN_UNIVERSAL = sys.intern("UNIVERSAL")            # @every
+    TOKEN_IDENTIFIER = sys.intern("IDENTIFIER")          # Any other identifier
+    TOKEN_WHITESPACE = sys.intern("WHITESPACE")          # Spaces, tabs, newlines
+    TOKEN_ERROR = sys.intern("ERROR")                    # Invalid token
+    
+    # Single-character punctuation tokens
+    _PUNCTUATION = {
+        '[': TOKEN_LBRACKET,
+        ']': TOKEN_RBRACKET,
+        '(': TOKEN_LPAREN,
+        ')': TOKEN_RPAREN,
+        ':': TOKEN_COLON,
+        '|': TOKEN_PIPE,
+        '~': TOKEN_NEGATION,
+    }
+    
+    # Label sigils and the token type they introduce
+    _LABEL_SIGILS = {
+        '*': TOKEN_DEFINING_LABEL,
+        '?': TOKEN_BOUND_LABEL,
+    }
+    
+    # Characters allowed in identifiers and label names ([a-zA-Z0-9_])
+    _IDENT_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+    
+    # Matches a whole identifier run, so its end is found in one C-level call
+    _IDENT_RUN = re.compile(r'[a-zA-Z0-9_]+')
+    
+    # Matches a run of characters that cannot start any token; such a run
+    # becomes a single ERROR token rather than one token per character
+    _ERROR_RUN = re.compile(r'[^\[\]():|~*?@a-zA-Z0-9_\s]+')
     
     def tokenize(self, text):
         """
         Tokenize the input text.
         
+        The grammar only needs one character of lookahead, so the scanner
+        dispatches on the current character directly instead of running a
+        master regex over the input.
+        
         Args:
             text (str): The CGIF expression to tokenize
             
         Returns:
-            list: List of (token_type, value, position) tuples
+            tuple: Parallel sequences (token_types, token_values, token_lines,
+                token_columns). Lines and columns are 1-based ints kept in
+                arrays; (line, column) tuples are only built when needed.
         """
-        tokens = []
+        token_types = []
+        token_values = []
+        token_lines = array('i')
+        token_columns = array('i')
+        append_type = token_types.append
+        append_value = token_values.append
+        append_line = token_lines.append
+        append_column = token_columns.append
+        # Everything the loop touches is bound to a local name up front, so
+        # the per-character work is local loads and dict/set probes only.
+        punctuation = self._PUNCTUATION
+        label_sigils = self._LABEL_SIGILS
+        ident_chars = self._IDENT_CHARS
+        match_ident_run = self._IDENT_RUN.match
+        match_error_run = self._ERROR_RUN.match
+        intern = sys.intern
+        token_identifier = self.TOKEN_IDENTIFIER
+        token_universal = self.TOKEN_UNIVERSAL
+        token_error = self.TOKEN_ERROR
         line_num = 1
         line_start = 0
+        i = 0
+        n = len(text)
         
-        for match in self.regex.finditer(text):
-            token_type = match.lastgroup
-            value = match.group()
-            start = match.start()
-            end = match.end()
-            column = start - line_start + 1
-            position = (line_num, column)
+        while i < n:
+            c = text[i]
+            
+            # Skip whitespace; only newlines update the line bookkeeping
+            if c == ' ':
+                i += 1
+                continue
+            if c.isspace():
+                if c == '\n':
+                    line_num += 1
+                    line_start = i + 1
+                i += 1
+                continue
+            
+            append_line(line_num)
+            append_column(i - line_start + 1)
             
-            # Skip whitespace tokens
-            if token_type == self.TOKEN_WHITESPACE:
-                # Update line number and line start for newlines
-                newlines = value.count('\n')
-                if newlines > 0:
-                    line_num += newlines
-                    line_start = start + value.rindex('\n') + 1
+            token_type = punctuation.get(c)
+            if token_type is not None:
+                append_type(token_type)
+                append_value(c)
+                i += 1
                 continue
             
-            # Add token to the list
-            tokens.append((token_type, value, position))
-        
-        return tokens
+            if c in ident_chars:
+                token_type = token_identifier
+                end = i + 1
+            else:
+                token_type = label_sigils.get(c)
+                if token_type is not None and i + 1 < n and text[i + 1] in ident_chars:
+                    end = i + 2
+                elif c == '@' and text.startswith('@every', i):
+                    append_type(token_universal)
+                    append_value('@every')
+                    i += 6
+                    continue
+                else:
+                    # Invalid input: a lone sigil, or a run of characters
+                    # outside the grammar
+                    error_run = match_error_run(text, i)
+                    end = error_run.end() if error_run else i + 1
+                    append_type(token_error)
+                    append_value(text[i:end])
+                    i = end
+                    continue
+            
+            # Single-character names are common (x, ?y); only longer runs
+            # are worth handing to the regex engine to find their end
+            if end < n and text[end] in ident_chars:
+                end = match_ident_run(text, end).end()
+            append_type(token_type)
+            # Names repeat throughout a graph (?x, Cat, ...); interning them
+            # shares one string object per name across the whole parse
+            append_value(intern(text[i:end]))
+            i = end
+        
+        return token_types, token_values, token_lines, token_columns
+
+
+# The lexer keeps no state between tokenize() calls, so every parser can
+# share one instance.
+_SHARED_LEXER = CGIFLexer()
+
+# Parser error templates: id -> (error type, message, suggestions). The
+# parser queues a template id and its arguments, and the text is formatted
+# only when a ProcessingResult is built.
+_ERROR_TEMPLATES = {
+    "unexpected_token": (
+        ERROR_SYNTAX,
+        "Unexpected token '{0}', expected '[', '(', or '~'",
+        ("Try starting with a concept '[...]' or relation '(...)'",)),
+    "unclosed_concept": (
+        ERROR_SYNTAX,
+        "Expected ']', found '{0}'",
+        ("Make sure to close concept brackets",)),
+    "missing_relation_type": (
+        ERROR_SYNTAX,
+        "Expected relation type, found '{0}'",
+        ("Relations must start with a type identifier",)),
+    "unexpected_term": (
+        ERROR_SYNTAX,
+        "Expected {0}, found '{1}'",
+        ("{2}",)),
+    "unclosed_relation": (
+        ERROR_SYNTAX,
+        "Expected ')', found '{0}'",
+        ("Make sure to close relation parentheses",)),
+    "missing_negated_context": (
+        ERROR_SYNTAX,
+        "Expected '[' after '~', found '{0}'",
+        ("Negation must be followed by a context in brackets",)),
+    "unexpected_context_token": (
+        ERROR_SYNTAX,
+        "Unexpected token '{0}' in context, expected '[', '(', or '~'",
+        ("Context can contain concepts, relations, or negations",)),
+    "unclosed_context": (
+        ERROR_SYNTAX,
+        "Expected ']', found '{0}'",
+        ("Make sure to close context brackets",)),
+    "unresolved_reference": (
+        ERROR_REFERENCE,
+        "Bound label '{0}' has no corresponding defining label '{1}'",
+        ("Add a concept with defining label '{1}'",)),
+    "internal": (
+        ERROR_SYNTAX,
+        "Unexpected error: {0}",
+        ()),
+}
 
 
 class CGIFParser:
-    """Parser for CGIF expressions."""
+    """
+    Parser for CGIF expressions.
+    
+    This is a predictive (LL(1)) recursive-descent parser: each rule is
+    chosen from the current token alone, and error recovery only ever
+    skips forward. No rule is re-entered at a token position it has
+    already parsed, so parsing is linear in the number of tokens and
+    memoizing rules on position (packrat parsing) would never hit.
+    """
+    
+    # Token types that can appear as relation arguments or actor results
+    _TERM_TYPES = frozenset({
+        CGIFLexer.TOKEN_IDENTIFIER,
+        CGIFLexer.TOKEN_DEFINING_LABEL,
+        CGIFLexer.TOKEN_BOUND_LABEL,
+    })
     
     def __init__(self):
         """Initialize the parser."""
-        self.lexer = CGIFLexer()
-        self.tokens = []
+        self.lexer = _SHARED_LEXER
+        # Tokens are kept as parallel sequences so the hot helpers index a
+        # single list instead of unpacking a (type, value, position) tuple.
+        self.token_types = []
+        self.token_values = []
+        self.token_lines = array('i')
+        self.token_columns = array('i')
         self.current_token_idx = 0
         self.errors = []
+        self._error_queue = ErrorQueue(_ERROR_TEMPLATES)  # Formatted into self.errors by parse()
         self.coreference_map = {}  # Maps defining labels to their nodes
+        # Filled in while parsing so reference checking needs no AST walk
+        self._defining_names = set()  # Names of defining labels, without the '*'
+        self._bound_refs = []  # (bound label, token index) in source order
+        # Sub-parser for each token that can start a graph element
+        self._expr_dispatch = {
+            CGIFLexer.TOKEN_LBRACKET: self.parse_concept,
+            CGIFLexer.TOKEN_LPAREN: self.parse_relation,
+            CGIFLexer.TOKEN_NEGATION: self.parse_negation,
+        }
     
     def parse(self, text):
         """
@@ -114,26 +272,26 @@ class CGIFParser:
             ProcessingResult: Result of parsing
         """
         # Reset parser state
-        self.tokens = self.lexer.tokenize(text)
+        self.token_types, self.token_values, self.token_lines, self.token_columns = self.lexer.tokenize(text)
         self.current_token_idx = 0
         self.errors = []
+        self._error_queue.clear()
         self.coreference_map = {}
+        self._defining_names = set()
+        self._bound_refs = []
         
         # Parse the expression
         try:
             ast = self.parse_expression()
             
-            # Check for unresolved references
-            self.check_references()
-            
-            if self.errors:
-                return ProcessingResult(False, errors=self.errors)
+            if self._error_queue:
+                return ProcessingResult(False, errors=self.build_errors())
             else:
                 return ProcessingResult(True, ast=ast)
         except Exception as e:
             # Add unexpected error
-            self.add_error(ERROR_SYNTAX, f"Unexpected error: {str(e)}", self.current_position())
-            return ProcessingResult(False, errors=self.errors)
+            self.add_error("internal", self.current_token_idx, e)
+            return ProcessingResult(False, errors=self.build_errors())
     
     def parse_expression(self):
         """
@@ -144,32 +302,25 @@ class CGIFParser:
         """
         # A CGIF expression is a list of concepts and relations
         nodes = []
-        
-        while self.current_token_idx < len(self.tokens):
-            if self.match(CGIFLexer.TOKEN_LBRACKET):
-                # Parse concept
-                concept = self.parse_concept()
-                nodes.append(concept)
-            elif self.match(CGIFLexer.TOKEN_LPAREN):
-                # Parse relation
-                relation = self.parse_relation()
-                nodes.append(relation)
-            elif self.match(CGIFLexer.TOKEN_NEGATION):
-                # Parse negation
-                negation = self.parse_negation()
-                nodes.append(negation)
+        append_node = nodes.append
+        dispatch = self._expr_dispatch
+        token_types = self.token_types
+        n = len(token_types)
+        i = self.current_token_idx
+        
+        while i < n:
+            handler = dispatch.get(token_types[i])
+            # Consume the token; sub-parsers read the index from self
+            self.current_token_idx = i + 1
+            if handler is not None:
+                # Parse concept, relation or negation
+                append_node(handler())
             else:
-                # Unexpected token
-                token_type, value, position = self.current_token()
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Unexpected token '{value}', expected '[', '(', or '~'",
-                    position,
-                    ["Try starting with a concept '[...]' or relation '(...)'"]
-                )
-                self.advance()  # Skip the unexpected token
-        
-        # Create a root node to hold all the nodes
+                # Unexpected token, already skipped
+                self.add_error("unexpected_token", i, self.token_values[i])
+            i = self.current_token_idx
+        
+        # Create a root node to hold all the nodes; Node keeps the list itself
         return Node("EXPRESSION", children=nodes)
     
     def parse_concept(self):
@@ -182,6 +333,19 @@ class CGIFParser:
         # We've already consumed the '['
         position = self.previous_position()
         
+        # Fast path for the common shapes [Type: referent], [Type: *x],
+        # [Type: ?x], [*x] and [?x], recognised from the next few token types
+        token_types = self.token_types
+        i = self.current_token_idx
+        head = token_types[i:i + 4]
+        if (len(head) == 4 and head[0] is CGIFLexer.TOKEN_IDENTIFIER and
+                head[1] is CGIFLexer.TOKEN_COLON and head[3] is CGIFLexer.TOKEN_RBRACKET and
+                head[2] in self._TERM_TYPES):
+            return self._build_concept(position, i + 2, self.token_values[i])
+        if (len(head) >= 2 and head[1] is CGIFLexer.TOKEN_RBRACKET and
+                (head[0] is CGIFLexer.TOKEN_DEFINING_LABEL or head[0] is CGIFLexer.TOKEN_BOUND_LABEL)):
+            return self._build_concept(position, i, None)
+        
         # Check for negation in context
         is_negated = False
         if self.match(CGIFLexer.TOKEN_NEGATION):
@@ -213,31 +377,22 @@ class CGIFParser:
         elif self.match(CGIFLexer.TOKEN_BOUND_LABEL):
             bound_label = self.previous_value()
             referent = bound_label
+            self._bound_refs.append((bound_label, self.current_token_idx - 1))
         # Check for identifier referent
         elif self.match(CGIFLexer.TOKEN_IDENTIFIER):
             referent = self.previous_value()
         
         # Expect closing bracket
         if not self.match(CGIFLexer.TOKEN_RBRACKET):
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ']', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close concept brackets"]
-            )
+            self.add_error("unclosed_concept", self.current_token_idx, self.current_value())
         
         # Create concept node
-        concept = Node(NODE_CONCEPT, {
-            "type_label": type_label,
-            "referent": referent,
-            "defining_label": defining_label,
-            "bound_label": bound_label,
-            "universal": universal
-        }, position=position)
+        concept = Node(NODE_CONCEPT, ConceptPayload(type_label, referent, defining_label, bound_label, universal), position=position)
         
         # If this is a defining label, add it to the coreference map
         if defining_label:
             self.coreference_map[defining_label] = concept
+            self._defining_names.add(defining_label[1:])
             
             # If universal, add quantifier node
             if universal:
@@ -251,6 +406,37 @@ class CGIFParser:
         
         return concept
     
+    def _build_concept(self, position, referent_idx, type_label):
+        """
+        Build a concept whose referent is the single token at referent_idx,
+        followed by the closing ']'; the fast path of parse_concept.
+        
+        Args:
+            position (tuple): Position of the opening bracket
+            referent_idx (int): Index of the referent token (identifier or label)
+            type_label (str, optional): Type label, if the concept has one
+            
+        Returns:
+            Node: Concept node, wrapped in a quantifier for a defining label
+        """
+        referent = self.token_values[referent_idx]
+        referent_type = self.token_types[referent_idx]
+        # Consume the referent and the closing bracket
+        self.current_token_idx = referent_idx + 2
+        
+        if referent_type is CGIFLexer.TOKEN_DEFINING_LABEL:
+            concept = Node(NODE_CONCEPT, ConceptPayload(type_label, referent, referent, None, False), position=position)
+            self.coreference_map[referent] = concept
+            self._defining_names.add(referent[1:])
+            return Node(NODE_QUANTIFIER, QUANTIFIER_EXISTENTIAL, [concept], position=position)
+        
+        if referent_type is CGIFLexer.TOKEN_BOUND_LABEL:
+            self._bound_refs.append((referent, referent_idx))
+            bound_label = referent
+        else:
+            bound_label = None
+        return Node(NODE_CONCEPT, ConceptPayload(type_label, referent, None, bound_label, False), position=position)
+    
     def parse_relation(self):
         """
         Parse a relation node: (RelationType Arg1 Arg2 ... | Result)
@@ -266,79 +452,95 @@ class CGIFParser:
         if self.match(CGIFLexer.TOKEN_IDENTIFIER):
             relation_type = self.previous_value()
         else:
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected relation type, found '{self.current_value()}'",
-                self.current_position(),
-                ["Relations must start with a type identifier"]
-            )
-        
-        # Parse arguments
-        args = []
-        while (self.current_token_idx < len(self.tokens) and 
-               self.current_type() != CGIFLexer.TOKEN_RPAREN and
-               self.current_type() != CGIFLexer.TOKEN_PIPE):
-            
-            # Parse argument (identifier or label)
-            if self.match(CGIFLexer.TOKEN_IDENTIFIER):
-                args.append(self.previous_value())
-            elif self.match(CGIFLexer.TOKEN_DEFINING_LABEL):
-                args.append(self.previous_value())
-            elif self.match(CGIFLexer.TOKEN_BOUND_LABEL):
-                args.append(self.previous_value())
-            else:
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Expected argument, found '{self.current_value()}'",
-                    self.current_position(),
-                    ["Arguments must be identifiers or labels"]
-                )
-                self.advance()  # Skip the unexpected token
+            self.add_error("missing_relation_type", self.current_token_idx, self.current_value())
+        
+        token_types = self.token_types
+        i = self.current_token_idx
+        
+        # Arguments run up to the first ')' or a '|' before it; find both
+        # bounds with C-level list searches rather than a token loop
+        try:
+            stop = token_types.index(CGIFLexer.TOKEN_RPAREN, i)
+        except ValueError:
+            stop = len(token_types)
+        args_stop = stop
+        if CGIFLexer.TOKEN_PIPE in token_types[i:stop]:
+            args_stop = token_types.index(CGIFLexer.TOKEN_PIPE, i, stop)
+        
+        # Parse arguments (identifiers or labels)
+        args = self._collect_terms(i, args_stop, "argument", "Arguments must be identifiers or labels")
+        self.current_token_idx = args_stop
         
         # Check for function (actor) with output
         results = []
         if self.match(CGIFLexer.TOKEN_PIPE):
-            # Parse results
-            while (self.current_token_idx < len(self.tokens) and 
-                   self.current_type() != CGIFLexer.TOKEN_RPAREN):
-                
-                # Parse result (identifier or label)
-                if self.match(CGIFLexer.TOKEN_IDENTIFIER):
-                    results.append(self.previous_value())
-                elif self.match(CGIFLexer.TOKEN_DEFINING_LABEL):
-                    results.append(self.previous_value())
-                elif self.match(CGIFLexer.TOKEN_BOUND_LABEL):
-                    results.append(self.previous_value())
-                else:
-                    self.add_error(
-                        ERROR_SYNTAX,
-                        f"Expected result, found '{self.current_value()}'",
-                        self.current_position(),
-                        ["Results must be identifiers or labels"]
-                    )
-                    self.advance()  # Skip the unexpected token
+            # Parse results (identifiers or labels)
+            results = self._collect_terms(args_stop + 1, stop, "result", "Results must be identifiers or labels")
+            self.current_token_idx = stop
         
         # Expect closing parenthesis
         if not self.match(CGIFLexer.TOKEN_RPAREN):
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close relation parentheses"]
-            )
+            self.add_error("unclosed_relation", self.current_token_idx, self.current_value())
         
         # Create relation or function node
         if results:
-            return Node(NODE_FUNCTION, {
-                "type": relation_type,
-                "args": args,
-                "results": results
-            }, position=position)
+            node = Node(NODE_FUNCTION, FunctionPayload(relation_type, args, results), position=position)
         else:
-            return Node(NODE_RELATION, {
-                "type": relation_type,
-                "args": args
-            }, position=position)
+            node = Node(NODE_RELATION, RelationPayload(relation_type, args), position=position)
+        
+        # Defining labels used as arguments or results (e.g. an actor output
+        # '| *r') introduce coreference labels just like concepts do
+        coreference_map = self.coreference_map
+        defining_names = self._defining_names
+        for label in args:
+            if label[0] == '*':
+                coreference_map.setdefault(label, node)
+                defining_names.add(label[1:])
+        for label in results:
+            if label[0] == '*':
+                coreference_map.setdefault(label, node)
+                defining_names.add(label[1:])
+        
+        return node
+    
+    def _collect_terms(self, start, stop, kind, suggestion):
+        """
+        Collect the argument or result terms in tokens[start:stop].
+        
+        Identifiers and labels become terms; any other token is reported
+        as an error and skipped. Bound labels are recorded for reference
+        checking.
+        
+        Args:
+            start (int): Index of the first token
+            stop (int): Index one past the last token
+            kind (str): Term kind used in error messages ("argument" or "result")
+            suggestion (str): Suggestion attached to errors for stray tokens
+            
+        Returns:
+            list: The term values, in source order
+        """
+        term_types = self._TERM_TYPES
+        token_values = self.token_values
+        type_slice = self.token_types[start:stop]
+        terms = token_values[start:stop]
+        
+        if not term_types.issuperset(type_slice):
+            # Report stray tokens in source order and keep only the terms
+            terms = []
+            for i, token_type in enumerate(type_slice, start):
+                if token_type in term_types:
+                    terms.append(token_values[i])
+                else:
+                    self.add_error("unexpected_term", i, kind, token_values[i], suggestion)
+        
+        if CGIFLexer.TOKEN_BOUND_LABEL in type_slice:
+            bound_refs = self._bound_refs
+            for i, token_type in enumerate(type_slice, start):
+                if token_type is CGIFLexer.TOKEN_BOUND_LABEL:
+                    bound_refs.append((token_values[i], i))
+        
+        return terms
     
     def parse_negation(self):
         """
@@ -352,12 +554,7 @@ class CGIFParser:
         
         # Expect opening bracket
         if not self.match(CGIFLexer.TOKEN_LBRACKET):
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '[' after '~', found '{self.current_value()}'",
-                self.current_position(),
-                ["Negation must be followed by a context in brackets"]
-            )
+            self.add_error("missing_negated_context", self.current_token_idx, self.current_value())
             return Node(NODE_NEGATION, None, [], position=position)
         
         # Parse the context
@@ -377,130 +574,96 @@ class CGIFParser:
         
         # Parse contents (concepts and relations)
         contents = []
-        while (self.current_token_idx < len(self.tokens) and 
-               self.current_type() != CGIFLexer.TOKEN_RBRACKET):
-            
-            if self.match(CGIFLexer.TOKEN_LBRACKET):
-                # Parse nested concept
-                concept = self.parse_concept()
-                contents.append(concept)
-            elif self.match(CGIFLexer.TOKEN_LPAREN):
-                # Parse relation
-                relation = self.parse_relation()
-                contents.append(relation)
-            elif self.match(CGIFLexer.TOKEN_NEGATION):
-                # Parse negation
-                negation = self.parse_negation()
-                contents.append(negation)
+        append_content = contents.append
+        dispatch = self._expr_dispatch
+        token_types = self.token_types
+        n = len(token_types)
+        i = self.current_token_idx
+        while i < n:
+            token_type = token_types[i]
+            if token_type is CGIFLexer.TOKEN_RBRACKET:
+                break
+            handler = dispatch.get(token_type)
+            # Consume the token; sub-parsers read the index from self
+            self.current_token_idx = i + 1
+            if handler is not None:
+                # Parse nested concept, relation or negation
+                append_content(handler())
             else:
-                # Unexpected token
-                token_type, value, position = self.current_token()
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Unexpected token '{value}' in context, expected '[', '(', or '~'",
-                    position,
-                    ["Context can contain concepts, relations, or negations"]
-                )
-                self.advance()  # Skip the unexpected token
+                # Unexpected token, already skipped
+                self.add_error("unexpected_context_token", i, self.token_values[i])
+            i = self.current_token_idx
         
         # Expect closing bracket
         if not self.match(CGIFLexer.TOKEN_RBRACKET):
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ']', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close context brackets"]
-            )
+            self.add_error("unclosed_context", self.current_token_idx, self.current_value())
         
         return Node(NODE_CONTEXT, None, contents, position=position)
     
     def check_references(self):
-        """Check that all bound labels refer to existing defining labels."""
-        # Collect all bound labels
-        bound_labels = set()
-        self._collect_bound_labels(bound_labels)
-        
-        # Check each bound label
-        for label in bound_labels:
-            # Convert ?x to *x
-            defining_label = '*' + label[1:]
-            if defining_label not in self.coreference_map:
-                self.add_error(
-                    ERROR_REFERENCE,
-                    f"Bound label '{label}' has no corresponding defining label '{defining_label}'",
-                    None,
-                    [f"Add a concept with defining label '{defining_label}'"]
-                )
-    
-    def _collect_bound_labels(self, bound_labels, node=None):
         """
-        Recursively collect all bound labels in the AST.
+        Check that all bound labels refer to existing defining labels.
         
-        Args:
-            bound_labels (set): Set to collect bound labels
-            node (Node, optional): Current node to process
+        parse() does not run this check, so text with free bound labels,
+        such as (On ?x ?y), still parses; call it after parse() and
+        build_errors() to get the reference errors of the last parse.
+        
+        Bound labels and defining-label names are recorded while parsing,
+        so this is a set comparison on bare names rather than an AST walk.
+        Each missing label is reported once, at its first occurrence.
         """
-        if node is None:
-            # Start with the root node
-            if hasattr(self, 'root') and self.root:
-                self._collect_bound_labels(bound_labels, self.root)
+        defining_names = self._defining_names
+        missing = {label for label, _ in self._bound_refs if label[1:] not in defining_names}
+        if not missing:
             return
         
-        # Check node type
-        if node.node_type == NODE_CONCEPT:
-            if node.value.get('bound_label'):
-                bound_labels.add(node.value['bound_label'])
-        elif node.node_type == NODE_RELATION:
-            for arg in node.value['args']:
-                if arg.startswith('?'):
-                    bound_labels.add(arg)
-        elif node.node_type == NODE_FUNCTION:
-            for arg in node.value['args']:
-                if arg.startswith('?'):
-                    bound_labels.add(arg)
-            for result in node.value['results']:
-                if result.startswith('?'):
-                    bound_labels.add(result)
-        
-        # Process children
-        for child in node.children:
-            self._collect_bound_labels(bound_labels, child)
+        for label, token_idx in self._bound_refs:
+            if label not in missing:
+                continue
+            missing.discard(label)
+            # Convert ?x to *x
+            self.add_error("unresolved_reference", token_idx, label, '*' + label[1:])
     
     # Helper methods for token handling
     
+    def position_at(self, token_idx):
+        """Build the (line, column) position of the token at an index."""
+        return (self.token_lines[token_idx], self.token_columns[token_idx])
+    
     def current_token(self):
-        """Get the current token."""
-        if self.current_token_idx < len(self.tokens):
-            return self.tokens[self.current_token_idx]
+        """Get the current token as a (type, value, position) tuple."""
+        i = self.current_token_idx
+        if i < len(self.token_types):
+            return self.token_types[i], self.token_values[i], self.position_at(i)
         return None, None, None
     
     def current_type(self):
         """Get the type of the current token."""
-        token_type, _, _ = self.current_token()
-        return token_type
+        i = self.current_token_idx
+        token_types = self.token_types
+        return token_types[i] if i < len(token_types) else None
     
     def current_value(self):
         """Get the value of the current token."""
-        _, value, _ = self.current_token()
-        return value
+        i = self.current_token_idx
+        token_values = self.token_values
+        return token_values[i] if i < len(token_values) else None
     
     def current_position(self):
         """Get the position of the current token."""
-        _, _, position = self.current_token()
-        return position
+        i = self.current_token_idx
+        return self.position_at(i) if i < len(self.token_types) else None
     
     def previous_position(self):
         """Get the position of the previous token."""
         if self.current_token_idx > 0:
-            _, _, position = self.tokens[self.current_token_idx - 1]
-            return position
+            return self.position_at(self.current_token_idx - 1)
         return None
     
     def previous_value(self):
         """Get the value of the previous token."""
         if self.current_token_idx > 0:
-            _, value, _ = self.tokens[self.current_token_idx - 1]
-            return value
+            return self.token_values[self.current_token_idx - 1]
         return None
     
     def advance(self):
@@ -518,26 +681,53 @@ class CGIFParser:
         Returns:
             bool: True if the token matches, False otherwise
         """
-        if self.current_type() == expected_type:
-            self.advance()
+        i = self.current_token_idx
+        token_types = self.token_types
+        if i < len(token_types) and token_types[i] == expected_type:
+            self.current_token_idx = i + 1
             return True
         return False
     
-    def add_error(self, error_type, message, position, suggestions=None):
+    def add_error(self, template_id, token_idx, *args):
         """
-        Add an error to the error list.
+        Queue an error; it is formatted only if the parse result needs it.
         
         Args:
-            error_type (str): Type of error
-            message (str): Error message
-            position (tuple): Position in source (line, column)
-            suggestions (list, optional): Suggested corrections
+            template_id (str): Key into _ERROR_TEMPLATES
+            token_idx (int): Index of the offending token; an index past the
+                last token means end of input
+            *args: Values substituted into the message and suggestions
+        """
+        self._error_queue.add(template_id, token_idx, *args)
+    
+    def build_errors(self):
         """
-        self.errors.append(Error(error_type, message, position, suggestions))
+        Format the queued errors into self.errors.
+        
+        Returns:
+            list: Error objects in the order they were found
+        """
+        token_count = len(self.token_types)
+        position_at = self.position_at
+        self.errors = self._error_queue.build(
+            lambda token_idx: position_at(token_idx) if token_idx < token_count else None
+        )
+        return self.errors
+
+
+# Shared result of a validation that found nothing
+_NO_ERRORS = ()
 
 
 class CGIFValidator:
-    """Validator for CGIF syntax and semantics."""
+    """
+    Validator for CGIF syntax and semantics.
+    
+    Reference resolution, the one check that needs facts from across the
+    graph, is done by CGIFParser from labels it records while parsing, so
+    it costs no extra traversal. Rules added here run on the finished AST
+    and only after a successful parse.
+    """
     
     def __init__(self):
         """Initialize the validator."""
@@ -551,13 +741,13 @@ class CGIFValidator:
             ast (Node): The AST to validate
             
         Returns:
-            list: List of errors, empty if valid
+            tuple: Errors found, empty if valid. With no rules implemented
+            yet this is always the shared empty tuple, so validating
+            allocates nothing.
         """
-        errors = []
-        
         # Implement validation rules here
         
-        return errors
+        return _NO_ERRORS
 
 
 class CGIFErrorHandler:
@@ -582,3 +772,9 @@ class CGIFErrorHandler:
         # Implement correction suggestions here
         
         return suggestions
+
+
+# Both classes are stateless, so callers share these instances instead of
+# constructing their own.
+VALIDATOR = CGIFValidator()
+ERROR_HANDLER = CGIFErrorHandler()
@@ -6,8 +6,10 @@ validating syntax, and generating helpful error messages.
 """
 
 import re
+from array import array
+from bisect import bisect_right
 from .common import (
-    Node, Error, ProcessingResult,
+    Node, Error, ErrorQueue, ProcessingResult, RelationPayload, QuantifierPayload,
     NODE_CONCEPT, NODE_RELATION, NODE_QUANTIFIER, NODE_CONTEXT, NODE_NEGATION, 
     NODE_FUNCTION, NODE_COREFERENCE,
     ERROR_SYNTAX, ERROR_SEMANTIC, ERROR_REFERENCE,
@@ -15,93 +17,269 @@ from .common import (
 )
 
 class CLLexer:
-    """Tokenizer for CL (CLIF dialect) expressions."""
-    
-    # Token types
-    TOKEN_LPAREN = "LPAREN"          # (
-    TOKEN_RPAREN = "RPAREN"          # )
-    TOKEN_AND = "AND"                # and
-    TOKEN_OR = "OR"                  # or
-    TOKEN_NOT = "NOT"                # not
-    TOKEN_IF = "IF"                  # if
-    TOKEN_IFF = "IFF"                # iff
-    TOKEN_EXISTS = "EXISTS"          # exists
-    TOKEN_FORALL = "FORALL"          # forall
-    TOKEN_EQUALS = "EQUALS"          # =
-    TOKEN_IDENTIFIER = "IDENTIFIER"  # Any other identifier
-    TOKEN_WHITESPACE = "WHITESPACE"  # Spaces, tabs, newlines
-    TOKEN_ERROR = "ERROR"            # Invalid token
+    """
+    Tokenizer for CL (CLIF dialect) expressions.
     
-    def __init__(self):
-        """Initialize the lexer."""
-        # Token patterns
-        self.token_specs = [
-            (self.TOKEN_WHITESPACE, r'\s+'),
-            (self.TOKEN_LPAREN, r'\('),
-            (self.TOKEN_RPAREN, r'\)'),
-            (self.TOKEN_AND, r'and'),
-            (self.TOKEN_OR, r'or'),
-            (self.TOKEN_NOT, r'not'),
-            (self.TOKEN_IF, r'if'),
-            (self.TOKEN_IFF, r'iff'),
-            (self.TOKEN_EXISTS, r'exists'),
-            (self.TOKEN_FORALL, r'forall'),
-            (self.TOKEN_EQUALS, r'='),
-            (self.TOKEN_IDENTIFIER, r'[a-zA-Z0-9_]+'),
-            (self.TOKEN_ERROR, r'.'),  # Any other character
-        ]
-        
-        # Build the regex pattern
-        self.pattern = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in self.token_specs)
-        self.regex = re.compile(self.pattern)
+    There is no master pattern to hand to an alternative regex engine: the
+    token class comes from the first character, and 're' only finds the end
+    of multi-character identifiers. That anchored character-class match
+    cannot backtrack, so re2's linear-time guarantee buys nothing here while
+    its per-call overhead on such short matches is higher.
+    """
+    
+    # Token types. These are small integer codes: comparisons and dispatch
+    # lookups on them take CPython's int fast paths, and TOKEN_NAMES maps
+    # them back to names for display.
+    TOKEN_LPAREN = 0       # (
+    TOKEN_RPAREN = 1       # )
+    TOKEN_AND = 2          # and
+    TOKEN_OR = 3           # or
+    TOKEN_NOT = 4          # not
+    TOKEN_IF = 5           # if
+    TOKEN_IFF = 6          # iff
+    TOKEN_EXISTS = 7       # exists
+    TOKEN_FORALL = 8       # forall
+    TOKEN_EQUALS = 9       # =
+    TOKEN_IDENTIFIER = 10  # Any other identifier
+    TOKEN_WHITESPACE = 11  # Spaces, tabs, newlines
+    TOKEN_ERROR = 12       # Invalid token
+    
+    TOKEN_NAMES = (
+        "LPAREN", "RPAREN", "AND", "OR", "NOT", "IF", "IFF", "EXISTS",
+        "FORALL", "EQUALS", "IDENTIFIER", "WHITESPACE", "ERROR",
+    )
+    
+    # Keywords are scanned as identifiers and then reclassified, so a
+    # keyword is only recognized as a whole word ('order' is an identifier,
+    # not 'or' followed by 'der')
+    _KEYWORDS = {
+        'and': TOKEN_AND,
+        'or': TOKEN_OR,
+        'not': TOKEN_NOT,
+        'if': TOKEN_IF,
+        'iff': TOKEN_IFF,
+        'exists': TOKEN_EXISTS,
+        'forall': TOKEN_FORALL,
+    }
+    
+    # Single-character punctuation tokens
+    _PUNCTUATION = {
+        '(': TOKEN_LPAREN,
+        ')': TOKEN_RPAREN,
+        '=': TOKEN_EQUALS,
+    }
+    
+    # Characters allowed in identifiers ([a-zA-Z0-9_])
+    _IDENT_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+    
+    # Matches a whole identifier run, so its end is found in one C-level call
+    _IDENT_RUN = re.compile(r'[a-zA-Z0-9_]+')
+    
+    # Matches a whole whitespace run (the same characters as str.isspace)
+    _SPACE_RUN = re.compile(r'\s+')
     
     def tokenize(self, text):
         """
         Tokenize the input text.
         
+        Each token's class is decided by its first character through the
+        punctuation table and identifier character set above, so there is
+        no per-token regex match object; the regex engine is only used to
+        find the end of identifiers longer than one character.
+        
+        Tokens record only their start offset. The offsets at which lines
+        start are collected in one pass beforehand, so a (line, column)
+        position is computed with a bisect only for the tokens that need
+        one (see CLParser.position_at).
+        
         Args:
             text (str): The CL expression to tokenize
             
         Returns:
-            list: List of (token_type, value, position) tuples
-        """
-        tokens = []
-        line_num = 1
-        line_start = 0
-        
-        for match in self.regex.finditer(text):
-            token_type = match.lastgroup
-            value = match.group()
-            start = match.start()
-            end = match.end()
-            column = start - line_start + 1
-            position = (line_num, column)
+            tuple: (token_types, token_values, token_offsets, line_starts);
+            the first three are parallel sequences with one entry per token
+            (types as a byte array, offsets as an unsigned int array), and
+            line_starts is an ascending list of the offsets at which each
+            line begins, starting with 0
+        """
+        # The sequences grow by append rather than being presized from a
+        # str.count of the parentheses: appends are amortized O(1), and
+        # filling a presized sequence by index costs the same per token
+        token_types = array('B')
+        token_values = []
+        token_offsets = array('I')
+        append_type = token_types.append
+        append_value = token_values.append
+        append_offset = token_offsets.append
+        punctuation = self._PUNCTUATION
+        ident_chars = self._IDENT_CHARS
+        match_ident_run = self._IDENT_RUN.match
+        match_space_run = self._SPACE_RUN.match
+        keywords = self._KEYWORDS
+        token_identifier = self.TOKEN_IDENTIFIER
+        token_error = self.TOKEN_ERROR
+        
+        line_starts = [0]
+        find = text.find
+        newline = find('\n')
+        while newline >= 0:
+            line_starts.append(newline + 1)
+            newline = find('\n', newline + 1)
+        
+        i = 0
+        n = len(text)
+        
+        while i < n:
+            c = text[i]
             
-            # Skip whitespace tokens
-            if token_type == self.TOKEN_WHITESPACE:
-                # Update line number and line start for newlines
-                newlines = value.count('\n')
-                if newlines > 0:
-                    line_num += newlines
-                    line_start = start + value.rindex('\n') + 1
+            # A separating space is stepped over. Any other whitespace
+            # starts a run (typically a newline and the next line's
+            # indentation) that is skipped at once.
+            if c == ' ':
+                i += 1
+                continue
+            if c.isspace():
+                i = match_space_run(text, i).end()
                 continue
             
-            # Add token to the list
-            tokens.append((token_type, value, position))
+            append_offset(i)
+            
+            token_type = punctuation.get(c)
+            if token_type is not None:
+                append_type(token_type)
+                append_value(c)
+                i += 1
+            elif c in ident_chars:
+                # Single-character names are common; only longer runs are
+                # worth handing to the regex engine to find their end
+                end = i + 1
+                if end < n and text[end] in ident_chars:
+                    end = match_ident_run(text, end).end()
+                value = text[i:end]
+                append_type(keywords.get(value, token_identifier))
+                append_value(value)
+                i = end
+            else:
+                # Any other character
+                append_type(token_error)
+                append_value(c)
+                i += 1
         
-        return tokens
+        return token_types, token_values, token_offsets, line_starts
+
+
+# Parser error templates: id -> (error type, message, suggestions). Where the
+# suggestion depends on the rule, it is passed in as an argument.
+_ERROR_TEMPLATES = {
+    "unexpected_token": (
+        ERROR_SYNTAX,
+        "Unexpected token '{0}', expected '('",
+        ("CL expressions must start with '('",)),
+    "expected_predicate": (
+        ERROR_SYNTAX,
+        "Expected predicate, found '{0}'",
+        ("Atomic sentences must start with a predicate",)),
+    "expected_argument": (
+        ERROR_SYNTAX,
+        "Expected argument, found '{0}'",
+        ("Arguments must be identifiers or nested expressions",)),
+    "expected_subexpression": (
+        ERROR_SYNTAX,
+        "Expected '(', found '{0}'",
+        ("'{1}' expressions must contain subexpressions",)),
+    "missing_operand": (
+        ERROR_SYNTAX,
+        "Expected '(', found '{0}'",
+        ("{1}",)),
+    "missing_variable_list": (
+        ERROR_SYNTAX,
+        "Expected '(', found '{0}'",
+        ("'{1}' expressions must have a variable list",)),
+    "missing_quantifier_body": (
+        ERROR_SYNTAX,
+        "Expected '(', found '{0}'",
+        ("'{1}' expressions must have a body expression",)),
+    "expected_variable": (
+        ERROR_SYNTAX,
+        "Expected variable, found '{0}'",
+        ("Variables must be identifiers",)),
+    "duplicate_variable": (
+        ERROR_SEMANTIC,
+        "Variable '{0}' is quantified more than once",
+        ("Each variable may appear only once in a quantifier's variable list",)),
+    "expected_type": (
+        ERROR_SYNTAX,
+        "Expected type, found '{0}'",
+        ("Typed variables must have a type",)),
+    "expected_term": (
+        ERROR_SYNTAX,
+        "Expected term, found '{0}'",
+        ("Equals expressions must have two terms",)),
+    "unclosed": (
+        ERROR_SYNTAX,
+        "Expected ')', found '{0}'",
+        ("{1}",)),
+    "unclosed_quantifier": (
+        ERROR_SYNTAX,
+        "Expected ')', found '{0}'",
+        ("Make sure to close parentheses for '{1}' expression",)),
+    "internal": (
+        ERROR_SYNTAX,
+        "Unexpected error: {0}",
+        ()),
+}
+
+
+class _TooManyErrors(Exception):
+    """Raised by CLParser.add_error to abandon a parse once the error queue is full."""
 
 
 class CLParser:
-    """Parser for CL (CLIF dialect) expressions."""
+    """
+    Parser for CL (CLIF dialect) expressions.
     
-    def __init__(self):
-        """Initialize the parser."""
+    Every sentence is an s-expression whose operator is the token after its
+    '(', so the parser never backtracks: current_token_idx only moves
+    forward and each token is consumed once. A per-position memo of
+    parse_sentence results (packrat parsing) would therefore only add
+    bookkeeping; if the grammar ever needs lookahead beyond one token,
+    that is the point to revisit it.
+    """
+    
+    def __init__(self, max_errors=None, track_positions=True):
+        """
+        Initialize the parser.
+        
+        Args:
+            max_errors (int, optional): Number of errors after which parsing
+                stops, MAX_ERRORS by default
+            track_positions (bool, optional): Whether AST nodes record their
+                (line, column) position; error positions are always reported
+        """
         self.lexer = CLLexer()
-        self.tokens = []
+        self.track_positions = track_positions
+        # Tokens are kept as parallel sequences so the helpers index a
+        # single sequence instead of unpacking a (type, value, position)
+        # tuple. Types and offsets are typed arrays: one byte per type code
+        # and four per offset, instead of an 8-byte pointer per list slot.
+        self.token_types = array('B')
+        self.token_values = []
+        self.token_offsets = array('I')
+        self.line_starts = [0]
         self.current_token_idx = 0
         self.errors = []
-        self.variables = set()  # Track variables for scope checking
+        self._error_queue = ErrorQueue(_ERROR_TEMPLATES, max_errors)  # Formatted into self.errors by parse()
+        # Sub-parser for each operator that can follow a sentence's '('
+        self._sentence_dispatch = {
+            CLLexer.TOKEN_AND: self.parse_and_expression,
+            CLLexer.TOKEN_OR: self.parse_or_expression,
+            CLLexer.TOKEN_NOT: self.parse_not_expression,
+            CLLexer.TOKEN_IF: self.parse_if_expression,
+            CLLexer.TOKEN_IFF: self.parse_iff_expression,
+            CLLexer.TOKEN_EXISTS: self.parse_exists_expression,
+            CLLexer.TOKEN_FORALL: self.parse_forall_expression,
+            CLLexer.TOKEN_EQUALS: self.parse_equals_expression,
+        }
     
     def parse(self, text):
         """
@@ -113,24 +291,58 @@ class CLParser:
         Returns:
             ProcessingResult: Result of parsing
         """
-        # Reset parser state
-        self.tokens = self.lexer.tokenize(text)
+        # Reset parser state. Input without any '(' is not special-cased:
+        # it still needs lexing to position its unexpected-token errors, and
+        # max_errors already bounds the parsing that follows
+        self.token_types, self.token_values, self.token_offsets, self.line_starts = self.lexer.tokenize(text)
         self.current_token_idx = 0
         self.errors = []
-        self.variables = set()
+        self._error_queue.clear()
         
         # Parse the expression
         try:
             ast = self.parse_expression()
             
-            if self.errors:
-                return ProcessingResult(False, errors=self.errors)
+            if self._error_queue:
+                return ProcessingResult(False, errors=self.build_errors())
             else:
                 return ProcessingResult(True, ast=ast)
+        except _TooManyErrors:
+            # Recovering from more errors would cost time on input (e.g.
+            # binary data) that yields nothing useful, so stop here
+            errors = self.build_errors()
+            errors.append(Error(
+                ERROR_SYNTAX,
+                "Too many errors, parsing stopped",
+                None,
+                ["Fix the errors above and parse again"]
+            ))
+            return ProcessingResult(False, errors=errors)
         except Exception as e:
-            # Add unexpected error
-            self.add_error(ERROR_SYNTAX, f"Unexpected error: {str(e)}", self.current_position())
-            return ProcessingResult(False, errors=self.errors)
+            # Add unexpected error (queued directly: the parse is over, so
+            # a full queue must not raise _TooManyErrors here)
+            self._error_queue.add("internal", self.current_token_idx, e)
+            return ProcessingResult(False, errors=self.build_errors())
+    
+    def parse_fast(self, text):
+        """
+        Parse CL text without recording AST node positions.
+        
+        For callers that only need the structure of the AST, such as batch
+        validation or translation; errors still carry their positions.
+        
+        Args:
+            text (str): The CL expression to parse
+            
+        Returns:
+            ProcessingResult: Result of parsing
+        """
+        track_positions = self.track_positions
+        self.track_positions = False
+        try:
+            return self.parse(text)
+        finally:
+            self.track_positions = track_positions
     
     def parse_expression(self):
         """
@@ -141,22 +353,22 @@ class CLParser:
         """
         # A CL expression is a list of sentences
         nodes = []
+        append_node = nodes.append
+        token_types = self.token_types
+        n = len(token_types)
+        i = self.current_token_idx
         
-        while self.current_token_idx < len(self.tokens):
-            if self.match(CLLexer.TOKEN_LPAREN):
+        while i < n:
+            if token_types[i] == CLLexer.TOKEN_LPAREN:
                 # Parse sentence
-                sentence = self.parse_sentence()
-                nodes.append(sentence)
+                self.current_token_idx = i + 1
+                append_node(self.parse_sentence())
+                i = self.current_token_idx
             else:
                 # Unexpected token
-                token_type, value, position = self.current_token()
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Unexpected token '{value}', expected '('",
-                    position,
-                    ["CL expressions must start with '('"]
-                )
-                self.advance()  # Skip the unexpected token
+                self.add_error("unexpected_token", i, self.token_values[i])
+                i += 1  # Skip the unexpected token
+        self.current_token_idx = i
         
         # Create a root node to hold all the nodes
         return Node("EXPRESSION", children=nodes)
@@ -168,26 +380,23 @@ class CLParser:
         Returns:
             Node: Sentence node
         """
-        # We've already consumed the '('
-        position = self.previous_position()
-        
-        # Check for logical operators
-        if self.match(CLLexer.TOKEN_AND):
-            return self.parse_and_expression(position)
-        elif self.match(CLLexer.TOKEN_OR):
-            return self.parse_or_expression(position)
-        elif self.match(CLLexer.TOKEN_NOT):
-            return self.parse_not_expression(position)
-        elif self.match(CLLexer.TOKEN_IF):
-            return self.parse_if_expression(position)
-        elif self.match(CLLexer.TOKEN_IFF):
-            return self.parse_iff_expression(position)
-        elif self.match(CLLexer.TOKEN_EXISTS):
-            return self.parse_exists_expression(position)
-        elif self.match(CLLexer.TOKEN_FORALL):
-            return self.parse_forall_expression(position)
-        elif self.match(CLLexer.TOKEN_EQUALS):
-            return self.parse_equals_expression(position)
+        # We've already consumed the '(', so its index is i - 1; its
+        # position is position_at(i - 1), inlined for every sentence
+        i = self.current_token_idx
+        token_types = self.token_types
+        if self.track_positions:
+            offset = self.token_offsets[i - 1]
+            line_starts = self.line_starts
+            line = bisect_right(line_starts, offset)
+            position = (line, offset - line_starts[line - 1] + 1)
+        else:
+            position = None
+        
+        # Check for logical operators with one lookup on the current token
+        handler = self._sentence_dispatch.get(token_types[i]) if i < len(token_types) else None
+        if handler is not None:
+            self.current_token_idx = i + 1
+            return handler(position)
         
         # Parse atomic sentence (predicate with arguments)
         return self.parse_atomic_sentence(position)
@@ -204,51 +413,19 @@ class CLParser:
         """
         # Parse predicate
         predicate = None
-        if self.match(CLLexer.TOKEN_IDENTIFIER):
-            predicate = self.previous_value()
+        i = self.current_token_idx
+        if i < len(self.token_types) and self.token_types[i] == CLLexer.TOKEN_IDENTIFIER:
+            predicate = self.token_values[i]
+            self.current_token_idx = i + 1
         else:
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected predicate, found '{self.current_value()}'",
-                self.current_position(),
-                ["Atomic sentences must start with a predicate"]
-            )
+            self.add_error("expected_predicate", self.current_token_idx, self.current_value())
         
-        # Parse arguments
-        args = []
-        while (self.current_token_idx < len(self.tokens) and 
-               self.current_type() != CLLexer.TOKEN_RPAREN):
-            
-            # Parse argument (identifier)
-            if self.match(CLLexer.TOKEN_IDENTIFIER):
-                args.append(self.previous_value())
-            # Parse nested expression
-            elif self.match(CLLexer.TOKEN_LPAREN):
-                nested = self.parse_sentence()
-                args.append(nested)
-            else:
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Expected argument, found '{self.current_value()}'",
-                    self.current_position(),
-                    ["Arguments must be identifiers or nested expressions"]
-                )
-                self.advance()  # Skip the unexpected token
+        # Parse arguments and the closing parenthesis
+        args = self._parse_paren_list(self._parse_argument, "Make sure to close parentheses")
         
-        # Expect closing parenthesis
-        if not self.match(CLLexer.TOKEN_RPAREN):
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses"]
-            )
-        
-        # Create relation node
-        return Node(NODE_RELATION, {
-            "type": predicate,
-            "args": args
-        }, position=position)
+        # Create relation node; the argument list is frozen into a tuple,
+        # which is smaller and keeps the AST from being edited in place
+        return Node(NODE_RELATION, RelationPayload(predicate, tuple(args)), position=position)
     
     def parse_and_expression(self, position):
         """
@@ -260,34 +437,7 @@ class CLParser:
         Returns:
             Node: And node
         """
-        # Parse subexpressions
-        expressions = []
-        while (self.current_token_idx < len(self.tokens) and 
-               self.current_type() != CLLexer.TOKEN_RPAREN):
-            
-            if self.match(CLLexer.TOKEN_LPAREN):
-                expr = self.parse_sentence()
-                expressions.append(expr)
-            else:
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Expected '(', found '{self.current_value()}'",
-                    self.current_position(),
-                    ["'and' expressions must contain subexpressions"]
-                )
-                self.advance()  # Skip the unexpected token
-        
-        # Expect closing parenthesis
-        if not self.match(CLLexer.TOKEN_RPAREN):
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses"]
-            )
-        
-        # Create and node
-        return Node("AND", None, expressions, position=position)
+        return self._parse_connective(position, "AND", "and")
     
     def parse_or_expression(self, position):
         """
@@ -299,34 +449,24 @@ class CLParser:
         Returns:
             Node: Or node
         """
-        # Parse subexpressions
-        expressions = []
-        while (self.current_token_idx < len(self.tokens) and 
-               self.current_type() != CLLexer.TOKEN_RPAREN):
-            
-            if self.match(CLLexer.TOKEN_LPAREN):
-                expr = self.parse_sentence()
-                expressions.append(expr)
-            else:
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Expected '(', found '{self.current_value()}'",
-                    self.current_position(),
-                    ["'or' expressions must contain subexpressions"]
-                )
-                self.advance()  # Skip the unexpected token
-        
-        # Expect closing parenthesis
-        if not self.match(CLLexer.TOKEN_RPAREN):
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses"]
-            )
+        return self._parse_connective(position, "OR", "or")
+    
+    def _parse_connective(self, position, node_type, keyword):
+        """
+        Parse the subexpressions of an 'and' or 'or' expression.
         
-        # Create or node
-        return Node("OR", None, expressions, position=position)
+        Args:
+            position (tuple): Position of the opening parenthesis
+            node_type (str): Type of the node to build
+            keyword (str): The operator, for error messages
+            
+        Returns:
+            Node: Node of the given type with one child per subexpression
+        """
+        expressions = self._parse_paren_list(
+            self._parse_subexpression, "Make sure to close parentheses", keyword
+        )
+        return Node(node_type, None, expressions, position=position)
     
     def parse_not_expression(self, position):
         """
@@ -343,20 +483,20 @@ class CLParser:
             expr = self.parse_sentence()
         else:
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'not' expressions must contain a subexpression"]
+                "missing_operand",
+                self.current_token_idx,
+                self.current_value(),
+                "'not' expressions must contain a subexpression"
             )
             expr = None
         
         # Expect closing parenthesis
         if not self.match(CLLexer.TOKEN_RPAREN):
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses"]
+                "unclosed",
+                self.current_token_idx,
+                self.current_value(),
+                "Make sure to close parentheses"
             )
         
         # Create not node
@@ -378,10 +518,10 @@ class CLParser:
             antecedent = self.parse_sentence()
         else:
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'if' expressions must have an antecedent"]
+                "missing_operand",
+                self.current_token_idx,
+                self.current_value(),
+                "'if' expressions must have an antecedent"
             )
         
         # Parse consequent
@@ -390,19 +530,19 @@ class CLParser:
             consequent = self.parse_sentence()
         else:
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'if' expressions must have a consequent"]
+                "missing_operand",
+                self.current_token_idx,
+                self.current_value(),
+                "'if' expressions must have a consequent"
             )
         
         # Expect closing parenthesis
         if not self.match(CLLexer.TOKEN_RPAREN):
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses"]
+                "unclosed",
+                self.current_token_idx,
+                self.current_value(),
+                "Make sure to close parentheses"
             )
         
         # Create if node
@@ -430,10 +570,10 @@ class CLParser:
             expr1 = self.parse_sentence()
         else:
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'iff' expressions must have two subexpressions"]
+                "missing_operand",
+                self.current_token_idx,
+                self.current_value(),
+                "'iff' expressions must have two subexpressions"
             )
         
         # Parse second expression
@@ -442,19 +582,19 @@ class CLParser:
             expr2 = self.parse_sentence()
         else:
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'iff' expressions must have two subexpressions"]
+                "missing_operand",
+                self.current_token_idx,
+                self.current_value(),
+                "'iff' expressions must have two subexpressions"
             )
         
         # Expect closing parenthesis
         if not self.match(CLLexer.TOKEN_RPAREN):
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses"]
+                "unclosed",
+                self.current_token_idx,
+                self.current_value(),
+                "Make sure to close parentheses"
             )
         
         # Create iff node
@@ -476,97 +616,7 @@ class CLParser:
         Returns:
             Node: Exists node
         """
-        # Parse variable list
-        variables = []
-        if self.match(CLLexer.TOKEN_LPAREN):
-            # Parse variables
-            while (self.current_token_idx < len(self.tokens) and 
-                   self.current_type() != CLLexer.TOKEN_RPAREN):
-                
-                if self.match(CLLexer.TOKEN_LPAREN):
-                    # Parse typed variable: (var Type)
-                    if self.match(CLLexer.TOKEN_IDENTIFIER):
-                        var_name = self.previous_value()
-                        variables.append(var_name)
-                        self.variables.add(var_name)
-                        
-                        # Parse type
-                        if self.match(CLLexer.TOKEN_IDENTIFIER):
-                            var_type = self.previous_value()
-                        else:
-                            self.add_error(
-                                ERROR_SYNTAX,
-                                f"Expected type, found '{self.current_value()}'",
-                                self.current_position(),
-                                ["Typed variables must have a type"]
-                            )
-                    
-                    # Expect closing parenthesis for typed variable
-                    if not self.match(CLLexer.TOKEN_RPAREN):
-                        self.add_error(
-                            ERROR_SYNTAX,
-                            f"Expected ')', found '{self.current_value()}'",
-                            self.current_position(),
-                            ["Make sure to close parentheses for typed variables"]
-                        )
-                
-                elif self.match(CLLexer.TOKEN_IDENTIFIER):
-                    # Parse untyped variable
-                    var_name = self.previous_value()
-                    variables.append(var_name)
-                    self.variables.add(var_name)
-                
-                else:
-                    self.add_error(
-                        ERROR_SYNTAX,
-                        f"Expected variable, found '{self.current_value()}'",
-                        self.current_position(),
-                        ["Variables must be identifiers"]
-                    )
-                    self.advance()  # Skip the unexpected token
-            
-            # Expect closing parenthesis for variable list
-            if not self.match(CLLexer.TOKEN_RPAREN):
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Expected ')', found '{self.current_value()}'",
-                    self.current_position(),
-                    ["Make sure to close parentheses for variable list"]
-                )
-        else:
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'exists' expressions must have a variable list"]
-            )
-        
-        # Parse body expression
-        body = None
-        if self.match(CLLexer.TOKEN_LPAREN):
-            body = self.parse_sentence()
-        else:
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'exists' expressions must have a body expression"]
-            )
-        
-        # Expect closing parenthesis for exists expression
-        if not self.match(CLLexer.TOKEN_RPAREN):
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses for 'exists' expression"]
-            )
-        
-        # Create exists node
-        return Node(NODE_QUANTIFIER, {
-            "type": QUANTIFIER_EXISTENTIAL,
-            "variables": variables
-        }, [body] if body else [], position=position)
+        return self._parse_quantifier(position, QUANTIFIER_EXISTENTIAL, "exists")
     
     def parse_forall_expression(self, position):
         """
@@ -578,69 +628,32 @@ class CLParser:
         Returns:
             Node: Forall node
         """
+        return self._parse_quantifier(position, QUANTIFIER_UNIVERSAL, "forall")
+    
+    def _parse_quantifier(self, position, quantifier_type, keyword):
+        """
+        Parse the variable list and body of a quantified expression.
+        
+        Args:
+            position (tuple): Position of the opening parenthesis
+            quantifier_type (str): QUANTIFIER_EXISTENTIAL or QUANTIFIER_UNIVERSAL
+            keyword (str): The quantifier as written, for error messages
+            
+        Returns:
+            Node: Quantifier node
+        """
         # Parse variable list
         variables = []
         if self.match(CLLexer.TOKEN_LPAREN):
-            # Parse variables
-            while (self.current_token_idx < len(self.tokens) and 
-                   self.current_type() != CLLexer.TOKEN_RPAREN):
-                
-                if self.match(CLLexer.TOKEN_LPAREN):
-                    # Parse typed variable: (var Type)
-                    if self.match(CLLexer.TOKEN_IDENTIFIER):
-                        var_name = self.previous_value()
-                        variables.append(var_name)
-                        self.variables.add(var_name)
-                        
-                        # Parse type
-                        if self.match(CLLexer.TOKEN_IDENTIFIER):
-                            var_type = self.previous_value()
-                        else:
-                            self.add_error(
-                                ERROR_SYNTAX,
-                                f"Expected type, found '{self.current_value()}'",
-                                self.current_position(),
-                                ["Typed variables must have a type"]
-                            )
-                    
-                    # Expect closing parenthesis for typed variable
-                    if not self.match(CLLexer.TOKEN_RPAREN):
-                        self.add_error(
-                            ERROR_SYNTAX,
-                            f"Expected ')', found '{self.current_value()}'",
-                            self.current_position(),
-                            ["Make sure to close parentheses for typed variables"]
-                        )
-                
-                elif self.match(CLLexer.TOKEN_IDENTIFIER):
-                    # Parse untyped variable
-                    var_name = self.previous_value()
-                    variables.append(var_name)
-                    self.variables.add(var_name)
-                
-                else:
-                    self.add_error(
-                        ERROR_SYNTAX,
-                        f"Expected variable, found '{self.current_value()}'",
-                        self.current_position(),
-                        ["Variables must be identifiers"]
-                    )
-                    self.advance()  # Skip the unexpected token
-            
-            # Expect closing parenthesis for variable list
-            if not self.match(CLLexer.TOKEN_RPAREN):
-                self.add_error(
-                    ERROR_SYNTAX,
-                    f"Expected ')', found '{self.current_value()}'",
-                    self.current_position(),
-                    ["Make sure to close parentheses for variable list"]
-                )
+            variables = self._parse_paren_list(
+                self._parse_variable, "Make sure to close parentheses for variable list"
+            )
         else:
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'forall' expressions must have a variable list"]
+                "missing_variable_list",
+                self.current_token_idx,
+                self.current_value(),
+                keyword
             )
         
         # Parse body expression
@@ -649,26 +662,24 @@ class CLParser:
             body = self.parse_sentence()
         else:
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected '(', found '{self.current_value()}'",
-                self.current_position(),
-                ["'forall' expressions must have a body expression"]
+                "missing_quantifier_body",
+                self.current_token_idx,
+                self.current_value(),
+                keyword
             )
         
-        # Expect closing parenthesis for forall expression
+        # Expect closing parenthesis for the quantified expression
         if not self.match(CLLexer.TOKEN_RPAREN):
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses for 'forall' expression"]
+                "unclosed_quantifier",
+                self.current_token_idx,
+                self.current_value(),
+                keyword
             )
         
-        # Create forall node
-        return Node(NODE_QUANTIFIER, {
-            "type": QUANTIFIER_UNIVERSAL,
-            "variables": variables
-        }, [body] if body else [], position=position)
+        # Create quantifier node
+        return Node(NODE_QUANTIFIER, QuantifierPayload(quantifier_type, variables),
+                    [body] if body else [], position=position)
     
     def parse_equals_expression(self, position):
         """
@@ -687,12 +698,7 @@ class CLParser:
         elif self.match(CLLexer.TOKEN_LPAREN):
             term1 = self.parse_sentence()
         else:
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected term, found '{self.current_value()}'",
-                self.current_position(),
-                ["Equals expressions must have two terms"]
-            )
+            self.add_error("expected_term", self.current_token_idx, self.current_value())
         
         # Parse second term
         term2 = None
@@ -701,60 +707,174 @@ class CLParser:
         elif self.match(CLLexer.TOKEN_LPAREN):
             term2 = self.parse_sentence()
         else:
-            self.add_error(
-                ERROR_SYNTAX,
-                f"Expected term, found '{self.current_value()}'",
-                self.current_position(),
-                ["Equals expressions must have two terms"]
-            )
+            self.add_error("expected_term", self.current_token_idx, self.current_value())
         
         # Expect closing parenthesis
         if not self.match(CLLexer.TOKEN_RPAREN):
             self.add_error(
-                ERROR_SYNTAX,
-                f"Expected ')', found '{self.current_value()}'",
-                self.current_position(),
-                ["Make sure to close parentheses"]
+                "unclosed",
+                self.current_token_idx,
+                self.current_value(),
+                "Make sure to close parentheses"
             )
         
         # Create equals node
         return Node("EQUALS", None, [term1, term2] if term1 and term2 else [], position=position)
     
+    # Parenthesized lists
+    
+    def _parse_paren_list(self, parse_item, close_suggestion, *item_args):
+        """
+        Parse items up to the closing ')' of a list and consume it.
+        
+        This is the one loop behind argument lists, 'and'/'or' bodies and
+        quantifier variable lists. The token checks are inlined rather than
+        going through match(), since it runs once per item.
+        
+        Args:
+            parse_item (callable): Called as parse_item(i, items, *item_args)
+                with the index of an item's first token; appends what it
+                parses to items and returns the index after the item
+            close_suggestion (str): Suggestion reported if the ')' is missing
+            *item_args: Extra arguments passed through to parse_item
+            
+        Returns:
+            list: The parsed items
+        """
+        items = []
+        token_types = self.token_types
+        n = len(token_types)
+        i = self.current_token_idx
+        while i < n and token_types[i] != CLLexer.TOKEN_RPAREN:
+            i = parse_item(i, items, *item_args)
+        
+        if i < n:
+            # Consume the closing parenthesis
+            self.current_token_idx = i + 1
+        else:
+            self.current_token_idx = i
+            self.add_error(
+                "unclosed",
+                self.current_token_idx,
+                self.current_value(),
+                close_suggestion
+            )
+        return items
+    
+    def _parse_argument(self, i, args):
+        """Parse a relation argument (identifier or nested expression) at token i."""
+        token_type = self.token_types[i]
+        
+        # Parse argument (identifier)
+        if token_type == CLLexer.TOKEN_IDENTIFIER:
+            args.append(self.token_values[i])
+            return i + 1
+        
+        # Parse nested expression
+        if token_type == CLLexer.TOKEN_LPAREN:
+            self.current_token_idx = i + 1
+            args.append(self.parse_sentence())
+            return self.current_token_idx
+        
+        self.add_error("expected_argument", i, self.token_values[i])
+        return i + 1  # Skip the unexpected token
+    
+    def _parse_subexpression(self, i, expressions, keyword):
+        """Parse one subexpression of an 'and'/'or' expression at token i."""
+        if self.token_types[i] == CLLexer.TOKEN_LPAREN:
+            self.current_token_idx = i + 1
+            expressions.append(self.parse_sentence())
+            return self.current_token_idx
+        
+        self.add_error("expected_subexpression", i, self.token_values[i], keyword)
+        return i + 1  # Skip the unexpected token
+    
+    def _parse_variable(self, i, variables):
+        """
+        Parse one quantified variable, 'x' or '(x Type)', at token i.
+        
+        A variable already in the list is reported here, while the list is
+        being built, rather than by a separate pass of CLValidator.
+        """
+        token_type = self.token_types[i]
+        
+        if token_type == CLLexer.TOKEN_IDENTIFIER:
+            # Parse untyped variable
+            var_name = self.token_values[i]
+            if var_name in variables:
+                self.add_error("duplicate_variable", i, var_name)
+            variables.append(var_name)
+            return i + 1
+        
+        self.current_token_idx = i + 1
+        if token_type == CLLexer.TOKEN_LPAREN:
+            # Parse typed variable: (var Type)
+            if self.match(CLLexer.TOKEN_IDENTIFIER):
+                var_name = self.previous_value()
+                if var_name in variables:
+                    self.add_error("duplicate_variable", self.current_token_idx - 1, var_name)
+                variables.append(var_name)
+                    
+                # Parse type
+                if not self.match(CLLexer.TOKEN_IDENTIFIER):
+                    self.add_error("expected_type", self.current_token_idx, self.current_value())
+            
+            # Expect closing parenthesis for typed variable
+            if not self.match(CLLexer.TOKEN_RPAREN):
+                self.add_error(
+                    "unclosed",
+                    self.current_token_idx,
+                    self.current_value(),
+                    "Make sure to close parentheses for typed variables"
+                )
+            return self.current_token_idx
+        
+        self.add_error("expected_variable", i, self.token_values[i])
+        return i + 1  # Skip the unexpected token
+    
     # Helper methods for token handling
     
+    def position_at(self, token_idx):
+        """Build the (line, column) position of the token at an index."""
+        offset = self.token_offsets[token_idx]
+        line_starts = self.line_starts
+        line = bisect_right(line_starts, offset)
+        return (line, offset - line_starts[line - 1] + 1)
+    
     def current_token(self):
-        """Get the current token."""
-        if self.current_token_idx < len(self.tokens):
-            return self.tokens[self.current_token_idx]
+        """Get the current token as a (type, value, position) tuple."""
+        i = self.current_token_idx
+        if i < len(self.token_types):
+            return self.token_types[i], self.token_values[i], self.position_at(i)
         return None, None, None
     
     def current_type(self):
         """Get the type of the current token."""
-        token_type, _, _ = self.current_token()
-        return token_type
+        i = self.current_token_idx
+        token_types = self.token_types
+        return token_types[i] if i < len(token_types) else None
     
     def current_value(self):
         """Get the value of the current token."""
-        _, value, _ = self.current_token()
-        return value
+        i = self.current_token_idx
+        token_values = self.token_values
+        return token_values[i] if i < len(token_values) else None
     
     def current_position(self):
         """Get the position of the current token."""
-        _, _, position = self.current_token()
-        return position
+        i = self.current_token_idx
+        return self.position_at(i) if i < len(self.token_types) else None
     
     def previous_position(self):
         """Get the position of the previous token."""
         if self.current_token_idx > 0:
-            _, _, position = self.tokens[self.current_token_idx - 1]
-            return position
+            return self.position_at(self.current_token_idx - 1)
         return None
     
     def previous_value(self):
         """Get the value of the previous token."""
         if self.current_token_idx > 0:
-            _, value, _ = self.tokens[self.current_token_idx - 1]
-            return value
+            return self.token_values[self.current_token_idx - 1]
         return None
     
     def advance(self):
@@ -767,7 +887,7 @@ class CLParser:
         Check if the current token matches the expected type and advance if it does.
         
         Args:
-            expected_type (str): The expected token type
+            expected_type (int): The expected token type code (CLLexer.TOKEN_*)
             
         Returns:
             bool: True if the token matches, False otherwise
@@ -777,21 +897,47 @@ class CLParser:
             return True
         return False
     
-    def add_error(self, error_type, message, position, suggestions=None):
+    def add_error(self, template_id, token_idx, *args):
         """
-        Add an error to the error list.
+        Queue an error; it is formatted only if the parse result needs it.
+        
+        The error that fills the queue raises _TooManyErrors, which parse()
+        catches to return the errors found so far.
         
         Args:
-            error_type (str): Type of error
-            message (str): Error message
-            position (tuple): Position in source (line, column)
-            suggestions (list, optional): Suggested corrections
+            template_id (str): Key into _ERROR_TEMPLATES
+            token_idx (int): Index of the offending token; an index past the
+                last token means end of input
+            *args: Values substituted into the message and suggestions
+        """
+        error_queue = self._error_queue
+        error_queue.add(template_id, token_idx, *args)
+        if error_queue.full:
+            raise _TooManyErrors()
+    
+    def build_errors(self):
         """
-        self.errors.append(Error(error_type, message, position, suggestions))
-
+        Format the queued errors into self.errors.
+        
+        Returns:
+            list: Error objects in the order they were found
+        """
+        token_count = len(self.token_types)
+        position_at = self.position_at
+        self.errors = self._error_queue.build(
+            lambda token_idx: position_at(token_idx) if token_idx < token_count else None
+        )
+        return self.errors
 
 class CLValidator:
-    """Validator for CL syntax and semantics."""
+    """
+    Validator for CL syntax and semantics.
+    
+    Checks that only need a node and its enclosing quantifiers, such as a
+    variable quantified twice, are made by CLParser while it builds the
+    tree, so they cost no second traversal. This class is for rules that
+    need the whole AST.
+    """
     
     def __init__(self):
         """Initialize the validator."""
@@ -2,8 +2,28 @@
 Common data structures and utilities for CGIF and CL parsers.
 """
 
+import sys
+from collections import namedtuple
+from dataclasses import dataclass
+
+# Shared empty error sequence for results without errors
+_EMPTY = ()
+
 class Node:
-    """Base class for AST nodes."""
+    """
+    Base class for AST nodes.
+    
+    Nodes are the most numerous objects the parsers create, so they are
+    slotted: no per-instance __dict__, and attribute access goes straight
+    to the slot.
+    """
+    
+    __slots__ = ('node_type', 'value', 'children', 'position')
+    
+    # Children of a node built without any. Leaves are the most common
+    # nodes, so they share this empty tuple instead of each holding an
+    # empty list; add_child() replaces it with a list on first use.
+    _NO_CHILDREN = ()
     
     def __init__(self, node_type, value=None, children=None, position=None):
         """
@@ -12,20 +32,147 @@ class Node:
         Args:
             node_type (str): Type of the node (e.g., CONCEPT, RELATION)
             value (any, optional): Value associated with the node
-            children (list, optional): Child nodes
+            children (list, optional): Child nodes. The list is stored by
+                reference, not copied, so parsers can build it in place and
+                hand it over without a second allocation. Without it the
+                node shares the empty _NO_CHILDREN tuple.
             position (tuple, optional): Position in source (line, column)
         """
         self.node_type = node_type
         self.value = value
-        self.children = children or []
+        self.children = children if children is not None else Node._NO_CHILDREN
         self.position = position
     
+    def add_child(self, child):
+        """
+        Append a child node.
+        
+        Args:
+            child (Node): The node to append
+        """
+        if self.children is Node._NO_CHILDREN:
+            self.children = [child]
+        else:
+            self.children.append(child)
+    
+    def copy(self):
+        """
+        Return a copy of the tree rooted at this node.
+        
+        The copy shares nothing mutable with the original: child lists are
+        copied, child nodes and nodes nested in a value (CL function terms)
+        are copied recursively, and so are lists in a payload. Strings and
+        other immutable values are shared.
+        
+        Returns:
+            Node: The copy
+        """
+        children = self.children
+        if children is not Node._NO_CHILDREN:
+            children = [_copy_value(child) for child in children]
+        return Node(self.node_type, _copy_value(self.value), children, self.position)
+    
     def __repr__(self):
         return f"Node({self.node_type}, {self.value}, {len(self.children)} children)"
 
 
+def _copy_value(value):
+    """
+    Copy a node's value or child for Node.copy(): nodes and lists are
+    copied, and a tuple (such as a payload) only if an item of it is.
+    """
+    if value is None or value.__class__ is str:
+        return value
+    if isinstance(value, Node):
+        return value.copy()
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    if isinstance(value, tuple) and value:
+        items = [_copy_value(item) for item in value]
+        if any(item is not original for item, original in zip(items, value)):
+            return value._make(items) if hasattr(value, '_make') else tuple(items)
+    return value
+
+
+class ConceptPayload(namedtuple('ConceptPayload', [
+        'type_label', 'referent', 'defining_label', 'bound_label', 'universal'])):
+    """
+    Value of a CONCEPT node.
+    
+    A fixed record rather than a dict: concepts are the most numerous nodes
+    in a CGIF AST, and most of their fields are None.
+    
+    Attributes:
+        type_label (str): Concept type, or None if untyped
+        referent (str): Referent as written (identifier or label), or None
+        defining_label (str): Defining label (*x), or None
+        bound_label (str): Bound label (?x), or None
+        universal (bool): Whether the concept is universally quantified (@every)
+    """
+    __slots__ = ()
+
+
+class RelationPayload(namedtuple('RelationPayload', ['type', 'args'])):
+    """
+    Value of a RELATION node, in both CGIF and CL ASTs.
+    
+    Attributes:
+        type (str): Relation type or CL predicate, or None if missing
+        args (sequence): Arguments in order: identifiers and labels, or
+            nested sentence nodes in CL
+    """
+    __slots__ = ()
+
+
+class QuantifierPayload(namedtuple('QuantifierPayload', ['type', 'variables', 'types'],
+                                   defaults=((),))):
+    """
+    Value of a CL QUANTIFIER node. (A CGIF QUANTIFIER node's value is just
+    QUANTIFIER_EXISTENTIAL or QUANTIFIER_UNIVERSAL.)
+    
+    Attributes:
+        type (str): QUANTIFIER_EXISTENTIAL or QUANTIFIER_UNIVERSAL
+        variables (sequence): Quantified variable names
+        types (sequence): Type of each variable, where known; may be shorter
+            than variables, and is empty by default
+    """
+    __slots__ = ()
+
+
+class FunctionPayload(namedtuple('FunctionPayload', ['type', 'args', 'results'],
+                                 defaults=((),))):
+    """
+    Value of a CGIF FUNCTION (actor) node, such as (Add 1 2 | *r).
+    
+    Attributes:
+        type (str): Actor type
+        args (sequence): Input arguments: identifiers and labels
+        results (sequence): Outputs after the '|'; empty by default
+    """
+    __slots__ = ()
+
+
+class FunctionCallPayload(namedtuple('FunctionCallPayload', ['name', 'args'])):
+    """
+    Value of a FUNCTION_CALL node, a function term in translated CL.
+    
+    Attributes:
+        name (str): Function name
+        args (sequence): Arguments: variables and constants
+    """
+    __slots__ = ()
+
+
 class Error:
-    """Class representing a syntax or semantic error."""
+    """
+    Class representing a syntax or semantic error.
+    
+    Errors compare and hash by (error_type, message, position), so the same
+    error reported twice can be collapsed with a set or dict. Suggestions
+    follow from the message and are not compared.
+    """
+    
+    __slots__ = ('error_type', 'message', 'position', 'suggestions')
     
     def __init__(self, error_type, message, position, suggestions=None):
         """
@@ -40,31 +187,50 @@ class Error:
         self.error_type = error_type
         self.message = message
         self.position = position
-        self.suggestions = suggestions or []
+        self.suggestions = [] if suggestions is None else suggestions
+    
+    def __eq__(self, other):
+        if not isinstance(other, Error):
+            return NotImplemented
+        return (self.error_type == other.error_type and self.message == other.message
+                and self.position == other.position)
+    
+    def __hash__(self):
+        return hash((self.error_type, self.message, self.position))
     
     def __repr__(self):
         return f"Error({self.error_type}, '{self.message}', {self.position})"
 
 
+@dataclass(frozen=True, slots=True)
 class ProcessingResult:
-    """Class representing the result of processing an expression."""
+    """
+    Class representing the result of processing an expression.
     
-    def __init__(self, success, ast=None, errors=None, output_text=None, latex_code=None):
-        """
-        Initialize a new processing result.
-        
-        Args:
-            success (bool): Whether processing was successful
-            ast (Node, optional): Abstract syntax tree if successful
-            errors (list, optional): List of errors if unsuccessful
-            output_text (str, optional): Formatted output text
-            latex_code (str, optional): Generated LaTeX code
-        """
-        self.success = success
-        self.ast = ast
-        self.errors = errors or []
-        self.output_text = output_text
-        self.latex_code = latex_code
+    A result's fields cannot be reassigned; to change one, build a new
+    result. Its AST is an ordinary mutable tree, so a cache handing the
+    same result to several callers gives each its own copy (Node.copy()).
+    
+    Attributes:
+        success (bool): Whether processing was successful
+        ast (Node): Abstract syntax tree if successful, or None
+        errors (tuple): Errors if unsuccessful. Any sequence passed in is
+            stored as a tuple; without errors this is the shared empty
+            tuple, so a successful result allocates nothing for them.
+        output_text (str): Formatted output text, or None
+        latex_code (str): Generated LaTeX code, or None
+    """
+    
+    success: bool
+    ast: Node = None
+    errors: tuple = _EMPTY
+    output_text: str = None
+    latex_code: str = None
+    
+    def __post_init__(self):
+        errors = self.errors
+        if type(errors) is not tuple:
+            object.__setattr__(self, 'errors', _EMPTY if errors is None else tuple(errors))
     
     def __repr__(self):
         if self.success:
@@ -73,20 +239,115 @@ class ProcessingResult:
             return f"ProcessingResult(success=False, errors={self.errors})"
 
 
+class ErrorQueue:
+    """
+    Deferred error collection for the parsers.
+    
+    Errors are queued as raw (template_id, location, args) records and are
+    only formatted into Error objects by build(), so malformed input costs
+    a tuple append per error instead of message formatting. At most
+    max_errors records are kept; any further errors are counted and
+    reported as a single summary error.
+    """
+    
+    def __init__(self, templates, max_errors=None):
+        """
+        Initialize an empty error queue.
+        
+        Args:
+            templates (dict): Maps a template id to an
+                (error_type, message, suggestions) tuple; message and each
+                suggestion are str.format templates
+            max_errors (int, optional): Maximum number of errors to keep,
+                MAX_ERRORS by default
+        """
+        self.templates = templates
+        self.max_errors = MAX_ERRORS if max_errors is None else max_errors
+        self.records = []
+        self.dropped = 0
+    
+    def __len__(self):
+        return len(self.records) + self.dropped
+    
+    @property
+    def full(self):
+        """True once max_errors records are queued; later errors are only counted."""
+        return len(self.records) >= self.max_errors
+    
+    def clear(self):
+        """Discard all queued errors."""
+        self.records.clear()
+        self.dropped = 0
+    
+    def add(self, template_id, location, *args):
+        """
+        Queue an error.
+        
+        Args:
+            template_id (str): Key into the queue's templates
+            location: Parser-specific location, resolved by build()
+            *args: Values substituted into the message and suggestions
+        """
+        records = self.records
+        if len(records) < self.max_errors:
+            records.append((template_id, location, args))
+        else:
+            self.dropped += 1
+    
+    def build(self, resolve_position):
+        """
+        Materialize the queued errors.
+        
+        Args:
+            resolve_position (callable): Maps a queued location to a
+                (line, column) position, or None
+            
+        Returns:
+            list: Error objects in the order they were queued
+        """
+        templates = self.templates
+        errors = []
+        for template_id, location, args in self.records:
+            error_type, message, suggestions = templates[template_id]
+            errors.append(Error(
+                error_type,
+                message.format(*args),
+                resolve_position(location),
+                [suggestion.format(*args) for suggestion in suggestions]
+            ))
+        if self.dropped:
+            errors.append(Error(
+                ERROR_SYNTAX,
+                f"{self.dropped} more errors not shown",
+                None,
+                ["Fix the errors above and parse again"]
+            ))
+        return errors
+
+
+# Node, error and quantifier types are interned, like the CGIF token types,
+# so comparing a node_type with one of them hits the identity check that
+# CPython's string equality makes first. The parsers only pass these
+# constants or identifier literals (which are interned as well), so Node
+# and Error do not re-intern what they are given.
+
 # Node types
-NODE_CONCEPT = "CONCEPT"
-NODE_RELATION = "RELATION"
-NODE_QUANTIFIER = "QUANTIFIER"
-NODE_CONTEXT = "CONTEXT"
-NODE_NEGATION = "NEGATION"
-NODE_FUNCTION = "FUNCTION"
-NODE_COREFERENCE = "COREFERENCE"
+NODE_CONCEPT = sys.intern("CONCEPT")
+NODE_RELATION = sys.intern("RELATION")
+NODE_QUANTIFIER = sys.intern("QUANTIFIER")
+NODE_CONTEXT = sys.intern("CONTEXT")
+NODE_NEGATION = sys.intern("NEGATION")
+NODE_FUNCTION = sys.intern("FUNCTION")
+NODE_COREFERENCE = sys.intern("COREFERENCE")
 
 # Error types
-ERROR_SYNTAX = "SYNTAX"
-ERROR_SEMANTIC = "SEMANTIC"
-ERROR_REFERENCE = "REFERENCE"
+ERROR_SYNTAX = sys.intern("SYNTAX")
+ERROR_SEMANTIC = sys.intern("SEMANTIC")
+ERROR_REFERENCE = sys.intern("REFERENCE")
+
+# Maximum number of errors an ErrorQueue keeps before summarizing the rest
+MAX_ERRORS = 100
 
 # Quantifier types
-QUANTIFIER_EXISTENTIAL = "EXISTENTIAL"
-QUANTIFIER_UNIVERSAL = "UNIVERSAL"
+QUANTIFIER_EXISTENTIAL = sys.intern("EXISTENTIAL")
+QUANTIFIER_UNIVERSAL = sys.intern("UNIVERSAL")
@@ -2,9 +2,40 @@
 Main parser module that provides a unified interface for CGIF and CL parsing.
 """
 
-from .cgif_parser import CGIFParser, CGIFValidator, CGIFErrorHandler
-from .cl_parser import CLParser, CLValidator, CLErrorHandler
-from .common import ProcessingResult
+from collections import OrderedDict
+from .common import Node, Error, ProcessingResult
+
+# Suggestions for an unknown expression type; a tuple, so every invalid-type
+# error can share it
+_INVALID_TYPE_SUGGESTIONS = ("Use 'CGIF' or 'CL' as the expression type",)
+
+def _invalid_type_result(expression_type):
+    """
+    Return the result for an unknown expression type.
+    
+    Only the error dict, which names the type, is built per call; the
+    suggestions are shared, and errors is passed as a tuple so the result
+    stores it without converting it.
+    """
+    return ProcessingResult(
+        False,
+        errors=({
+            "error_type": "INVALID_TYPE",
+            "message": f"Invalid expression type: {expression_type}",
+            "position": None,
+            "suggestions": _INVALID_TYPE_SUGGESTIONS
+        },)
+    )
+
+def _copy_result(result):
+    """
+    Return a cached parse result with its own copy of the AST, so a caller
+    that modifies its AST changes neither the cache nor other callers'.
+    """
+    ast = result.ast
+    if ast is None:
+        return result
+    return ProcessingResult(result.success, ast.copy(), result.errors, result.output_text, result.latex_code)
 
 class Parser:
     """
@@ -18,20 +49,104 @@ class Parser:
     TYPE_CGIF = "CGIF"
     TYPE_CL = "CL"
     
+    # Number of parse results kept by parse(), least recently used first out
+    CACHE_SIZE = 512
+    
+    # Number of suggestion lists kept by suggest_corrections(), likewise
+    SUGGESTION_CACHE_SIZE = 256
+    
     def __init__(self):
         """Initialize the parser."""
-        self.cgif_parser = CGIFParser()
-        self.cgif_validator = CGIFValidator()
-        self.cgif_error_handler = CGIFErrorHandler()
+        self._cache = OrderedDict()  # (expression_type, text) -> ProcessingResult
+        self._suggestion_cache = OrderedDict()  # (expression_type, error_type, message) -> tuple
         
-        self.cl_parser = CLParser()
-        self.cl_validator = CLValidator()
-        self.cl_error_handler = CLErrorHandler()
+        # Each grammar's module is imported, and its parser, validator and
+        # error handler created, on first use (see the properties below),
+        # so a caller that only uses one grammar never loads the other
+        self._cgif_parser = None
+        self._cgif_validator = None
+        self._cgif_error_handler = None
+        
+        self._cl_parser = None
+        self._cl_validator = None
+        self._cl_error_handler = None
+        
+        # Handlers for each expression type, so routing is one dict lookup
+        self._parse_dispatch = {
+            self.TYPE_CGIF: self.parse_cgif,
+            self.TYPE_CL: self.parse_cl,
+        }
+        self._suggest_dispatch = {
+            self.TYPE_CGIF: self._suggest_cgif_corrections,
+            self.TYPE_CL: self._suggest_cl_corrections,
+        }
+    
+    def _load_cgif(self):
+        """Import the CGIF module and create its components."""
+        from .cgif_parser import CGIFParser, VALIDATOR, ERROR_HANDLER
+        self._cgif_parser = CGIFParser()
+        self._cgif_validator = VALIDATOR
+        self._cgif_error_handler = ERROR_HANDLER
+    
+    def _load_cl(self):
+        """Import the CL module and create its components."""
+        from .cl_parser import CLParser, CLValidator, CLErrorHandler
+        self._cl_parser = CLParser()
+        self._cl_validator = CLValidator()
+        self._cl_error_handler = CLErrorHandler()
+    
+    @property
+    def cgif_parser(self):
+        """CGIFParser, created on first use."""
+        if self._cgif_parser is None:
+            self._load_cgif()
+        return self._cgif_parser
+    
+    @property
+    def cgif_validator(self):
+        """CGIF validator, created on first use."""
+        if self._cgif_validator is None:
+            self._load_cgif()
+        return self._cgif_validator
+    
+    @property
+    def cgif_error_handler(self):
+        """CGIF error handler, created on first use."""
+        if self._cgif_error_handler is None:
+            self._load_cgif()
+        return self._cgif_error_handler
+    
+    @property
+    def cl_parser(self):
+        """CLParser, created on first use."""
+        if self._cl_parser is None:
+            self._load_cl()
+        return self._cl_parser
+    
+    @property
+    def cl_validator(self):
+        """CL validator, created on first use."""
+        if self._cl_validator is None:
+            self._load_cl()
+        return self._cl_validator
+    
+    @property
+    def cl_error_handler(self):
+        """CL error handler, created on first use."""
+        if self._cl_error_handler is None:
+            self._load_cl()
+        return self._cl_error_handler
     
     def parse(self, text, expression_type):
         """
         Parse an expression and return the result.
         
+        Results are cached on (expression_type, text), so parsing the same
+        text again (as an editor or a round trip does) skips the parser and
+        validator. Each call returns its own copy of the cached AST, which
+        the caller may modify. An unknown expression type gets an invalid-type
+        result, which is not cached.
+        
         Args:
             text (str): The expression to parse
             expression_type (str): The type of expression (CGIF or CL)
@@ -39,20 +154,49 @@ class Parser:
         Returns:
             ProcessingResult: Result of parsing
         """
-        if expression_type == self.TYPE_CGIF:
-            return self.parse_cgif(text)
-        elif expression_type == self.TYPE_CL:
-            return self.parse_cl(text)
-        else:
-            return ProcessingResult(
-                False, 
-                errors=[{
-                    "error_type": "INVALID_TYPE",
-                    "message": f"Invalid expression type: {expression_type}",
-                    "position": None,
-                    "suggestions": ["Use 'CGIF' or 'CL' as the expression type"]
-                }]
-            )
+        # A cache hit needs no dispatch: only valid types are ever cached
+        key = (expression_type, text)
+        cache = self._cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return _copy_result(result)
+        
+        parse = self._parse_dispatch.get(expression_type)
+        if parse is None:
+            return _invalid_type_result(expression_type)
+        
+        result = parse(text)
+        cache[key] = result
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+        return _copy_result(result)
+    
+    def for_type(self, expression_type):
+        """
+        Get the parse function for one expression type.
+        
+        For callers that know the grammar up front (a file extension, an
+        editor mode): the returned function skips parse()'s type dispatch
+        and its result cache, and returns each parser's fresh result.
+        
+        Args:
+            expression_type (str): The type of expression (CGIF or CL)
+            
+        Returns:
+            callable: Function taking the text and returning a
+            ProcessingResult; for an unknown type it always returns the
+            invalid-type result
+        """
+        parse = self._parse_dispatch.get(expression_type)
+        if parse is None:
+            return lambda text: _invalid_type_result(expression_type)
+        return parse
+    
+    def clear_cache(self):
+        """Discard all cached parse results and suggestions."""
+        self._cache.clear()
+        self._suggestion_cache.clear()
     
     def parse_cgif(self, text):
         """
@@ -64,6 +208,10 @@ class Parser:
         Returns:
             ProcessingResult: Result of parsing
         """
+        # Empty text is an expression with no sentences, in either grammar
+        if not text or text.isspace():
+            return ProcessingResult(True, ast=Node("EXPRESSION"))
+        
         # Parse the expression
         result = self.cgif_parser.parse(text)
         
@@ -71,8 +219,8 @@ class Parser:
         if result.success:
             errors = self.cgif_validator.validate(result.ast)
             if errors:
-                result.success = False
-                result.errors = errors
+                # Drop repeated reports of the same error, keeping the order
+                return ProcessingResult(False, ast=result.ast, errors=dict.fromkeys(errors))
         
         return result
     
@@ -86,6 +234,10 @@ class Parser:
         Returns:
             ProcessingResult: Result of parsing
         """
+        # Empty text is an expression with no sentences, in either grammar
+        if not text or text.isspace():
+            return ProcessingResult(True, ast=Node("EXPRESSION"))
+        
         # Parse the expression
         result = self.cl_parser.parse(text)
         
@@ -93,15 +245,28 @@ class Parser:
         if result.success:
             errors = self.cl_validator.validate(result.ast)
             if errors:
-                result.success = False
-                result.errors = errors
+                # Drop repeated reports of the same error, keeping the order
+                return ProcessingResult(False, ast=result.ast, errors=dict.fromkeys(errors))
         
         return result
     
+    def _suggest_cgif_corrections(self, error):
+        """Suggest corrections for a CGIF error."""
+        return self.cgif_error_handler.suggest_corrections(error)
+    
+    def _suggest_cl_corrections(self, error):
+        """Suggest corrections for a CL error."""
+        return self.cl_error_handler.suggest_corrections(error)
+    
     def suggest_corrections(self, error, expression_type):
         """
         Suggest corrections for an error.
         
+        Suggestions depend on the kind of error and its message, not on
+        where it occurs, so those of an Error are cached on
+        (expression_type, error_type, message): the same mistake repeated
+        through a document is looked up once.
+        
         Args:
             error: The error to suggest corrections for
             expression_type (str): The type of expression (CGIF or CL)
@@ -109,9 +274,20 @@ class Parser:
         Returns:
             list: List of suggested corrections
         """
-        if expression_type == self.TYPE_CGIF:
-            return self.cgif_error_handler.suggest_corrections(error)
-        elif expression_type == self.TYPE_CL:
-            return self.cl_error_handler.suggest_corrections(error)
-        else:
+        suggest_corrections = self._suggest_dispatch.get(expression_type)
+        if suggest_corrections is None:
             return []
+        if not isinstance(error, Error):
+            return suggest_corrections(error)
+        
+        key = (expression_type, error.error_type, error.message)
+        cache = self._suggestion_cache
+        suggestions = cache.get(key)
+        if suggestions is not None:
+            cache.move_to_end(key)
+        else:
+            suggestions = tuple(suggest_corrections(error))
+            cache[key] = suggestions
+            if len(cache) > self.SUGGESTION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return list(suggestions)
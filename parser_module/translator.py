@@ -5,20 +5,74 @@ This module provides functionality for translating between CGIF and CL
 representations while preserving semantic equivalence.
 """
 
-from src.parser.common import (
-    Node, ProcessingResult,
+from .common import (
+    Node, ProcessingResult, ConceptPayload, RelationPayload, QuantifierPayload,
+    FunctionPayload, FunctionCallPayload,
     NODE_CONCEPT, NODE_RELATION, NODE_QUANTIFIER, NODE_CONTEXT, NODE_NEGATION, 
     NODE_FUNCTION, NODE_COREFERENCE,
     QUANTIFIER_EXISTENTIAL, QUANTIFIER_UNIVERSAL
 )
 
+class _Dispatch(dict):
+    """Node type -> translation method; an unknown node type raises ValueError."""
+    
+    __slots__ = ()
+    
+    def __missing__(self, node_type):
+        raise ValueError(f"Unknown node type: {node_type}")
+
+def _write_unknown(node, pad, out):
+    """Write a placeholder for a node type that has no writer."""
+    out.append(f"{pad}<Unknown node type: {node.node_type}>")
+
+class _Writers(dict):
+    """Node type -> formatter writer; an unknown node type gets a placeholder."""
+    
+    __slots__ = ()
+    
+    def __missing__(self, node_type):
+        return _write_unknown
+
+# CL node types that can be a term: function applications, as parsed
+# (RELATION) or as translated from CGIF (FUNCTION_CALL)
+_TERM_TYPES = frozenset((NODE_RELATION, "FUNCTION_CALL"))
+
+def _term_value(term):
+    """
+    Return the (name, args) of a CL function term.
+    
+    Raises:
+        ValueError: If the node is a sentence, such as a negation, which
+            cannot be used as a term
+    """
+    if term.node_type not in _TERM_TYPES:
+        raise ValueError(f"Cannot use a {term.node_type} sentence as a term")
+    return term.value
+
 class CGIFtoCLTranslator:
     """Translator for converting CGIF to CL."""
     
+    # Translation method for each CGIF node type
+    HANDLERS = {
+        "EXPRESSION": "_translate_expression",
+        NODE_CONCEPT: "_translate_concept",
+        NODE_RELATION: "_translate_relation",
+        NODE_QUANTIFIER: "_translate_quantifier",
+        NODE_NEGATION: "_translate_negation",
+        NODE_CONTEXT: "_translate_context",
+        NODE_FUNCTION: "_translate_function",
+    }
+    
     def __init__(self):
         """Initialize the translator."""
-        self.variable_map = {}  # Maps CGIF coreference labels to CL variables
+        self.variable_map = {}  # Maps CGIF coreference labels ('*x' and '?x') to CL variables
         self.next_var_id = 0    # Counter for generating unique variable names
+        self._pending = []      # (values, index, label) for labels used before their definition
+        
+        # Bound handlers, so dispatching a node is one dict lookup. Handlers
+        # look up their children's handlers here themselves, rather than
+        # going through _translate_node, so each node costs one call.
+        self._dispatch = _Dispatch((node_type, getattr(self, name)) for node_type, name in self.HANDLERS.items())
     
     def translate(self, cgif_ast):
         """
@@ -28,49 +82,38 @@ class CGIFtoCLTranslator:
             cgif_ast (Node): The CGIF AST to translate
             
         Returns:
-            Node: The translated CL AST
+            Node: The translated CL AST (for a root other than an
+            expression, a list if it translates to several nodes, or None
+            if to none)
         """
-        # Reset state
-        self.variable_map = {}
+        # Reset state, reusing the containers from the previous call
+        self.variable_map.clear()
         self.next_var_id = 0
-        
-        # Translate the root node
-        return self._translate_node(cgif_ast)
+        self._pending.clear()
+        
+        # Translate the root node, then fill in labels that were referenced
+        # before the concept defining them had been reached
+        translated = self._translate_node(cgif_ast)
+        self._resolve_pending()
+        if len(translated) == 1:
+            return translated[0]
+        return translated or None
     
     def _translate_node(self, node):
         """
-        Translate a CGIF node to a CL node.
+        Translate a CGIF node to CL nodes.
+        
+        Every handler returns a list, so callers can extend their
+        children with it whether the node translates to one node, several
+        or none.
         
         Args:
             node (Node): The CGIF node to translate
             
         Returns:
-            Node: The translated CL node
-        """
-        if node.node_type == "EXPRESSION":
-            # Translate expression (root node)
-            return self._translate_expression(node)
-        elif node.node_type == NODE_CONCEPT:
-            # Translate concept
-            return self._translate_concept(node)
-        elif node.node_type == NODE_RELATION:
-            # Translate relation
-            return self._translate_relation(node)
-        elif node.node_type == NODE_QUANTIFIER:
-            # Translate quantifier
-            return self._translate_quantifier(node)
-        elif node.node_type == NODE_NEGATION:
-            # Translate negation
-            return self._translate_negation(node)
-        elif node.node_type == NODE_CONTEXT:
-            # Translate context
-            return self._translate_context(node)
-        elif node.node_type == NODE_FUNCTION:
-            # Translate function
-            return self._translate_function(node)
-        else:
-            # Unknown node type
-            raise ValueError(f"Unknown node type: {node.node_type}")
+            list: The translated CL nodes
+        """
+        return self._dispatch[node.node_type](node)
     
     def _translate_expression(self, node):
         """
@@ -80,43 +123,91 @@ class CGIFtoCLTranslator:
             node (Node): The CGIF expression node
             
         Returns:
-            Node: The translated CL expression node
+            list: The translated CL expression node, in a list
         """
-        # First pass: collect all defining labels
-        self._collect_defining_labels(node)
-        
         # Translate all child nodes
         translated_children = []
+        dispatch = self._dispatch
         for child in node.children:
-            translated = self._translate_node(child)
-            if translated:
-                if isinstance(translated, list):
-                    translated_children.extend(translated)
-                else:
-                    translated_children.append(translated)
+            translated_children.extend(dispatch[child.node_type](child))
         
         # Create a new expression node
-        return Node("EXPRESSION", None, translated_children, node.position)
+        return [Node("EXPRESSION", None, translated_children, node.position)]
     
-    def _collect_defining_labels(self, node):
+    def _define_label(self, label):
         """
-        Collect all defining labels in the AST and map them to CL variables.
+        Map a defining label to a CL variable, the first time it is seen.
         
         Args:
-            node (Node): The root node of the AST
+            label (str): The defining label (e.g. '*x')
+            
+        Returns:
+            str: The CL variable for the label
         """
-        if node.node_type == NODE_CONCEPT:
-            # Check for defining label
-            if node.value.get("defining_label"):
-                label = node.value["defining_label"]
-                if label not in self.variable_map:
-                    var_name = f"x{self.next_var_id}"
-                    self.next_var_id += 1
-                    self.variable_map[label] = var_name
+        var_name = self.variable_map.get(label)
+        if var_name is None:
+            var_name = f"x{self.next_var_id}"
+            self.next_var_id += 1
+            self.variable_map[label] = var_name
+            # Also map the bound spelling, so bound labels are looked up as written
+            self.variable_map["?" + label[1:]] = var_name
+        return var_name
+    
+    def _map_label(self, label, values):
+        """
+        Append the CL variable for a label to a list.
         
-        # Process children
-        for child in node.children:
-            self._collect_defining_labels(child)
+        Labels are mapped as the translation reaches their defining
+        concepts, so a label whose definition comes later is appended
+        unchanged and recorded; _resolve_pending() replaces it once the
+        whole AST has been translated.
+        
+        Args:
+            label (str): The defining ('*x') or bound ('?x') label
+            values (list): The list to append to
+        """
+        var_name = self.variable_map.get(label)
+        if var_name is None:
+            self._pending.append((values, len(values), label))
+            var_name = label
+        values.append(var_name)
+    
+    def _map_args(self, args):
+        """
+        Map a relation's or actor's arguments to CL terms.
+        
+        Bound labels become their CL variables (see _map_label); other
+        arguments are kept as they are. One call maps the whole list, with
+        the map held in a local, instead of one method call per argument.
+        
+        Args:
+            args (sequence): The arguments
+            
+        Returns:
+            list: The mapped arguments
+        """
+        variable_map = self.variable_map
+        mapped_args = []
+        for arg in args:
+            if isinstance(arg, str) and arg[:1] == "?":
+                # This is a bound label, use the mapped variable
+                var_name = variable_map.get(arg)
+                if var_name is None:
+                    self._pending.append((mapped_args, len(mapped_args), arg))
+                    var_name = arg
+                mapped_args.append(var_name)
+            else:
+                mapped_args.append(arg)
+        return mapped_args
+    
+    def _resolve_pending(self):
+        """Replace labels that were used before their definition."""
+        variable_map = self.variable_map
+        for values, index, label in self._pending:
+            var_name = variable_map.get(label)
+            if var_name is not None:
+                values[index] = var_name
+        self._pending.clear()
     
     def _translate_concept(self, node):
         """
@@ -126,49 +217,26 @@ class CGIFtoCLTranslator:
             node (Node): The CGIF concept node
             
         Returns:
-            Node: The translated CL relation node
+            list: The translated CL relation node, in a list (empty for a
+            defining concept)
         """
-        type_label = node.value.get("type_label")
-        referent = node.value.get("referent")
-        defining_label = node.value.get("defining_label")
-        bound_label = node.value.get("bound_label")
+        type_label, referent, defining_label, bound_label, _ = node.value
         
-        if not type_label:
-            # Untyped concept, just return the referent
-            if defining_label:
-                # This is a defining label, will be handled by quantifier
-                return None
-            elif bound_label:
-                # This is a bound label, use the mapped variable
-                var_name = self.variable_map.get(bound_label.replace("?", "*"), bound_label)
-                return Node(NODE_RELATION, {
-                    "type": "Thing",  # Default type
-                    "args": [var_name]
-                }, [], node.position)
-            else:
-                # Just a constant
-                return Node(NODE_RELATION, {
-                    "type": "Thing",  # Default type
-                    "args": [referent]
-                }, [], node.position)
-        
-        # Typed concept
         if defining_label:
             # This is a defining label, will be handled by quantifier
-            return None
-        elif bound_label:
+            self._define_label(defining_label)
+            return []
+        
+        if bound_label:
             # This is a bound label, use the mapped variable
-            var_name = self.variable_map.get(bound_label.replace("?", "*"), bound_label)
-            return Node(NODE_RELATION, {
-                "type": type_label,
-                "args": [var_name]
-            }, [], node.position)
+            args = []
+            self._map_label(bound_label, args)
         else:
             # Just a constant
-            return Node(NODE_RELATION, {
-                "type": type_label,
-                "args": [referent]
-            }, [], node.position)
+            args = [referent]
+        
+        # An untyped concept gets the default type
+        return [Node(NODE_RELATION, RelationPayload(type_label or "Thing", args), position=node.position)]
     
     def _translate_relation(self, node):
         """
@@ -178,25 +246,14 @@ class CGIFtoCLTranslator:
             node (Node): The CGIF relation node
             
         Returns:
-            Node: The translated CL relation node
+            list: The translated CL relation node, in a list
         """
-        relation_type = node.value.get("type")
-        args = node.value.get("args", [])
+        relation_type, args = node.value
         
         # Map any bound labels to variables
-        mapped_args = []
-        for arg in args:
-            if isinstance(arg, str) and arg.startswith("?"):
-                # This is a bound label, use the mapped variable
-                var_name = self.variable_map.get(arg.replace("?", "*"), arg)
-                mapped_args.append(var_name)
-            else:
-                mapped_args.append(arg)
+        mapped_args = self._map_args(args)
         
-        return Node(NODE_RELATION, {
-            "type": relation_type,
-            "args": mapped_args
-        }, [], node.position)
+        return [Node(NODE_RELATION, RelationPayload(relation_type, mapped_args), position=node.position)]
     
     def _translate_quantifier(self, node):
         """
@@ -206,38 +263,30 @@ class CGIFtoCLTranslator:
             node (Node): The CGIF quantifier node
             
         Returns:
-            Node: The translated CL quantifier node
+            list: The translated CL quantifier node, in a list
         """
         quantifier_type = node.value
         
         # Get the concept node (should be the only child)
         if not node.children:
-            return None
+            return []
         
         concept = node.children[0]
-        type_label = concept.value.get("type_label")
-        defining_label = concept.value.get("defining_label")
+        type_label, _, defining_label, _, _ = concept.value
         
         if not defining_label:
             # Not a proper quantifier
-            return self._translate_node(concept)
+            return self._dispatch[concept.node_type](concept)
         
         # Get the variable name
-        var_name = self.variable_map.get(defining_label, defining_label)
+        var_name = self._define_label(defining_label)
         
         # Create the quantifier node
-        if quantifier_type == QUANTIFIER_EXISTENTIAL:
-            return Node(NODE_QUANTIFIER, {
-                "type": QUANTIFIER_EXISTENTIAL,
-                "variables": [var_name],
-                "types": [type_label] if type_label else []
-            }, [], node.position)
-        else:  # QUANTIFIER_UNIVERSAL
-            return Node(NODE_QUANTIFIER, {
-                "type": QUANTIFIER_UNIVERSAL,
-                "variables": [var_name],
-                "types": [type_label] if type_label else []
-            }, [], node.position)
+        if quantifier_type != QUANTIFIER_EXISTENTIAL:
+            quantifier_type = QUANTIFIER_UNIVERSAL
+        return [Node(NODE_QUANTIFIER, QuantifierPayload(
+            quantifier_type, [var_name], [type_label] if type_label else []
+        ), position=node.position)]
     
     def _translate_negation(self, node):
         """
@@ -247,15 +296,16 @@ class CGIFtoCLTranslator:
             node (Node): The CGIF negation node
             
         Returns:
-            Node: The translated CL negation node
+            list: The translated CL negation node, in a list
         """
         # Translate the child node
         if not node.children:
-            return Node(NODE_NEGATION, None, [], node.position)
+            return [Node(NODE_NEGATION, None, position=node.position)]
         
-        child = self._translate_node(node.children[0])
+        child = node.children[0]
+        translated = self._dispatch[child.node_type](child)
         
-        return Node(NODE_NEGATION, None, [child] if child else [], node.position)
+        return [Node(NODE_NEGATION, None, translated, node.position)]
     
     def _translate_context(self, node):
         """
@@ -265,24 +315,20 @@ class CGIFtoCLTranslator:
             node (Node): The CGIF context node
             
         Returns:
-            Node: The translated CL expression node
+            list: The translated CL expression node, in a list
         """
         # Translate all child nodes
         translated_children = []
+        dispatch = self._dispatch
         for child in node.children:
-            translated = self._translate_node(child)
-            if translated:
-                if isinstance(translated, list):
-                    translated_children.extend(translated)
-                else:
-                    translated_children.append(translated)
+            translated_children.extend(dispatch[child.node_type](child))
         
         # If there's only one child, return it directly
         if len(translated_children) == 1:
-            return translated_children[0]
+            return translated_children
         
         # Otherwise, create an AND node
-        return Node("AND", None, translated_children, node.position)
+        return [Node("AND", None, translated_children, node.position)]
     
     def _translate_function(self, node):
         """
@@ -292,56 +338,62 @@ class CGIFtoCLTranslator:
             node (Node): The CGIF function node
             
         Returns:
-            Node: The translated CL equals expression node
+            list: The translated CL equals expression node, in a list
         """
-        function_type = node.value.get("type")
-        args = node.value.get("args", [])
-        results = node.value.get("results", [])
+        function_type, args, results = node.value
         
         # Map any bound labels to variables
-        mapped_args = []
-        for arg in args:
-            if isinstance(arg, str) and arg.startswith("?"):
-                # This is a bound label, use the mapped variable
-                var_name = self.variable_map.get(arg.replace("?", "*"), arg)
-                mapped_args.append(var_name)
-            else:
-                mapped_args.append(arg)
-        
-        # Map any result labels to variables
-        mapped_results = []
-        for result in results:
-            if isinstance(result, str) and result.startswith("?"):
-                # This is a bound label, use the mapped variable
-                var_name = self.variable_map.get(result.replace("?", "*"), result)
-                mapped_results.append(var_name)
-            elif isinstance(result, str) and result.startswith("*"):
-                # This is a defining label, use the mapped variable
-                var_name = self.variable_map.get(result, result)
-                mapped_results.append(var_name)
-            else:
-                mapped_results.append(result)
+        mapped_args = self._map_args(args)
         
         # Create a function application node
-        function_node = Node("FUNCTION_CALL", {
-            "name": function_type,
-            "args": mapped_args
-        }, [], node.position)
+        function_node = Node("FUNCTION_CALL", FunctionCallPayload(function_type, mapped_args), position=node.position)
         
-        # Create an equals node
-        if mapped_results:
-            return Node("EQUALS", None, [mapped_results[0], function_node], node.position)
+        if not results:
+            return [function_node]
+        
+        # Map the first result label to a variable
+        equals_children = []
+        result = results[0]
+        if isinstance(result, str) and result[:1] in ("?", "*"):
+            # This is a bound or defining label, use the mapped variable
+            self._map_label(result, equals_children)
         else:
-            return function_node
+            equals_children.append(result)
+        equals_children.append(function_node)
+        
+        # Create an equals node
+        return [Node("EQUALS", None, equals_children, node.position)]
 
 
 class CLtoCGIFTranslator:
     """Translator for converting CL to CGIF."""
     
+    # Translation method for each CL node type
+    HANDLERS = {
+        "EXPRESSION": "_translate_expression",
+        NODE_RELATION: "_translate_relation",
+        NODE_QUANTIFIER: "_translate_quantifier",
+        NODE_NEGATION: "_translate_negation",
+        "AND": "_translate_and",
+        "OR": "_translate_or",
+        "IF": "_translate_if",
+        "IFF": "_translate_iff",
+        "EQUALS": "_translate_equals",
+        "FUNCTION_CALL": "_translate_function_call",
+    }
+    
     def __init__(self):
         """Initialize the translator."""
         self.variable_map = {}  # Maps CL variables to CGIF coreference labels
         self.next_label_id = 0  # Counter for generating unique label names
+        self._bound_labels = {} # Maps CL variables to the bound ('?') spelling of their labels
+        self._pending = []      # (values, index, variable) for variables used before their quantifier
+        self._pending_concepts = []  # (node, variable), likewise for concepts built from unary relations
+        
+        # Bound handlers, so dispatching a node is one dict lookup. Handlers
+        # look up their children's handlers here themselves, rather than
+        # going through _translate_node, so each node costs one call.
+        self._dispatch = _Dispatch((node_type, getattr(self, name)) for node_type, name in self.HANDLERS.items())
     
     def translate(self, cl_ast):
         """
@@ -351,58 +403,40 @@ class CLtoCGIFTranslator:
             cl_ast (Node): The CL AST to translate
             
         Returns:
-            Node: The translated CGIF AST
+            Node: The translated CGIF AST (for a root other than an
+            expression, a list if it translates to several nodes, or None
+            if to none)
         """
-        # Reset state
-        self.variable_map = {}
+        # Reset state, reusing the containers from the previous call
+        self.variable_map.clear()
         self.next_label_id = 0
-        
-        # Translate the root node
-        return self._translate_node(cl_ast)
+        self._bound_labels.clear()
+        self._pending.clear()
+        self._pending_concepts.clear()
+        
+        # Translate the root node, then fill in variables that were used
+        # before the quantifier binding them had been reached
+        translated = self._translate_node(cl_ast)
+        self._resolve_pending()
+        if len(translated) == 1:
+            return translated[0]
+        return translated or None
     
     def _translate_node(self, node):
         """
-        Translate a CL node to a CGIF node.
+        Translate a CL node to CGIF nodes.
+        
+        Every handler returns a list, so callers can extend their
+        children with it whether the node translates to one node, several
+        or none.
         
         Args:
             node (Node): The CL node to translate
             
         Returns:
-            Node: The translated CGIF node
-        """
-        if node.node_type == "EXPRESSION":
-            # Translate expression (root node)
-            return self._translate_expression(node)
-        elif node.node_type == NODE_RELATION:
-            # Translate relation
-            return self._translate_relation(node)
-        elif node.node_type == NODE_QUANTIFIER:
-            # Translate quantifier
-            return self._translate_quantifier(node)
-        elif node.node_type == NODE_NEGATION:
-            # Translate negation
-            return self._translate_negation(node)
-        elif node.node_type == "AND":
-            # Translate AND
-            return self._translate_and(node)
-        elif node.node_type == "OR":
-            # Translate OR
-            return self._translate_or(node)
-        elif node.node_type == "IF":
-            # Translate IF
-            return self._translate_if(node)
-        elif node.node_type == "IFF":
-            # Translate IFF
-            return self._translate_iff(node)
-        elif node.node_type == "EQUALS":
-            # Translate EQUALS
-            return self._translate_equals(node)
-        elif node.node_type == "FUNCTION_CALL":
-            # Translate FUNCTION_CALL
-            return self._translate_function_call(node)
-        else:
-            # Unknown node type
-            raise ValueError(f"Unknown node type: {node.node_type}")
+            list: The translated CGIF nodes
+        """
+        return self._dispatch[node.node_type](node)
     
     def _translate_expression(self, node):
         """
@@ -412,48 +446,133 @@ class CLtoCGIFTranslator:
             node (Node): The CL expression node
             
         Returns:
-            Node: The translated CGIF expression node
+            list: The translated CGIF expression node, in a list
         """
-        # First pass: collect all variables
-        self._collect_variables(node)
-        
         # Translate all child nodes
         translated_children = []
+        dispatch = self._dispatch
         for child in node.children:
-            translated = self._translate_node(child)
-            if translated:
-                if isinstance(translated, list):
-                    translated_children.extend(translated)
-                else:
-                    translated_children.append(translated)
+            translated_children.extend(dispatch[child.node_type](child))
         
         # Create a new expression node
-        return Node("EXPRESSION", None, translated_children, node.position)
+        return [Node("EXPRESSION", None, translated_children, node.position)]
+    
+    def _define_variables(self, variables, types):
+        """
+        Map quantified variables to CGIF coreference labels, the first time
+        each is seen.
+        
+        Args:
+            variables (sequence): The quantifier's variables
+            types (sequence): Their types, where given
+        """
+        for i, var in enumerate(variables):
+            if var not in self.variable_map:
+                label = f"*v{self.next_label_id}"
+                self.next_label_id += 1
+                self.variable_map[var] = {
+                    "label": label,
+                    "type": types[i] if i < len(types) else "Thing"
+                }
+                self._bound_labels[var] = "?" + label[1:]
     
-    def _collect_variables(self, node):
+    def _map_variable(self, arg, values):
         """
-        Collect all variables in the AST and map them to CGIF coreference labels.
+        Append the bound label for a variable to a list.
+        
+        Variables are mapped as the translation reaches their quantifiers,
+        so an argument that is not (yet) a known variable is appended
+        unchanged and recorded; _resolve_pending() replaces it if a later
+        quantifier binds it.
         
         Args:
-            node (Node): The root node of the AST
+            arg (str): The argument to look up
+            values (list): The list to append to
         """
-        if node.node_type == NODE_QUANTIFIER:
-            # Get variables from quantifier
-            variables = node.value.get("variables", [])
-            types = node.value.get("types", [])
+        bound_label = self._bound_labels.get(arg)
+        if bound_label is None:
+            self._pending.append((values, len(values), arg))
+            bound_label = arg
+        values.append(bound_label)
+    
+    def _map_args(self, args, actors):
+        """
+        Map a relation's or function's arguments to CGIF terms.
+        
+        Variables become their bound labels (see _map_variable); nested
+        function terms become labels for actors' results (see
+        _map_function_term); other arguments are kept as they are. One call
+        maps the whole list, with the map held in a local, instead of one
+        method call per argument.
+        
+        Args:
+            args (sequence): The arguments
+            actors (list): The list to append nodes for nested terms to
             
-            for i, var in enumerate(variables):
-                if var not in self.variable_map:
-                    label = f"*v{self.next_label_id}"
-                    self.next_label_id += 1
-                    self.variable_map[var] = {
-                        "label": label,
-                        "type": types[i] if i < len(types) else "Thing"
-                    }
+        Returns:
+            list: The mapped arguments
+        """
+        bound_labels = self._bound_labels
+        mapped_args = []
+        for arg in args:
+            bound_label = bound_labels.get(arg)
+            if bound_label is None:
+                if isinstance(arg, Node):
+                    mapped_args.append(self._map_function_term(arg, actors))
+                    continue
+                self._pending.append((mapped_args, len(mapped_args), arg))
+                bound_label = arg
+            mapped_args.append(bound_label)
+        return mapped_args
+    
+    def _map_function_term(self, term, actors):
+        """
+        Map a nested function term, such as (f x) in (P (f x)), to a CGIF
+        label.
         
-        # Process children
-        for child in node.children:
-            self._collect_variables(child)
+        The term's value gets a fresh coreference label: a concept defining
+        it and an actor computing it, (f ?x | ?vN), are appended to actors,
+        and its bound label stands in for the term.
+        
+        Args:
+            term (Node): The RELATION or FUNCTION_CALL node of the term
+            actors (list): The list to append the concept and actor to
+            
+        Returns:
+            str: The bound label of the term's value
+            
+        Raises:
+            ValueError: If the node is a sentence rather than a term
+        """
+        function_name, args = _term_value(term)
+        label = f"*v{self.next_label_id}"
+        self.next_label_id += 1
+        bound_label = "?" + label[1:]
+        actors.append(Node(NODE_CONCEPT, ConceptPayload(
+            type_label=None,
+            referent=label,
+            defining_label=label,
+            bound_label=None,
+            universal=False
+        ), position=term.position))
+        mapped_args = self._map_args(args, actors)
+        actors.append(Node(NODE_FUNCTION, FunctionPayload(function_name, mapped_args, [bound_label]), position=term.position))
+        return bound_label
+    
+    def _resolve_pending(self):
+        """Replace variables that were used before their quantifier."""
+        bound_labels = self._bound_labels
+        for values, index, arg in self._pending:
+            bound_label = bound_labels.get(arg)
+            if bound_label is not None:
+                values[index] = bound_label
+        for node, arg in self._pending_concepts:
+            bound_label = bound_labels.get(arg)
+            if bound_label is not None:
+                label = self.variable_map[arg]["label"]
+                node.value = node.value._replace(referent=label, bound_label=bound_label)
+        self._pending.clear()
+        self._pending_concepts.clear()
     
     def _translate_relation(self, node):
         """
@@ -463,55 +582,48 @@ class CLtoCGIFTranslator:
             node (Node): The CL relation node
             
         Returns:
-            Node: The translated CGIF relation or concept node
+            list: The translated CGIF relation or concept node, in a list
         """
-        relation_type = node.value.get("type")
-        args = node.value.get("args", [])
+        relation_type, args = node.value
         
         # Check if this is a unary relation (concept)
         if len(args) == 1:
             arg = args[0]
             
             # Check if the argument is a variable
-            if arg in self.variable_map:
+            bound_label = self._bound_labels.get(arg)
+            if bound_label is not None:
                 # This is a variable, create a concept with type label
-                var_info = self.variable_map[arg]
-                label = var_info["label"] if isinstance(var_info, dict) else var_info
-                bound_label = label.replace("*", "?")
+                label = self.variable_map[arg]["label"]
                 
-                return Node(NODE_CONCEPT, {
-                    "type_label": relation_type,
-                    "referent": label,
-                    "defining_label": None,
-                    "bound_label": bound_label,
-                    "universal": False
-                }, [], node.position)
-            else:
-                # This is a constant, create a concept with type label and referent
-                return Node(NODE_CONCEPT, {
-                    "type_label": relation_type,
-                    "referent": arg,
-                    "defining_label": None,
-                    "bound_label": None,
-                    "universal": False
-                }, [], node.position)
-        
-        # Map any variables to coreference labels
-        mapped_args = []
-        for arg in args:
-            if arg in self.variable_map:
-                # This is a variable, use the mapped label
-                var_info = self.variable_map[arg]
-                label = var_info["label"] if isinstance(var_info, dict) else var_info
-                mapped_args.append(label.replace("*", "?"))
-            else:
-                mapped_args.append(arg)
+                return [Node(NODE_CONCEPT, ConceptPayload(
+                    type_label=relation_type,
+                    referent=label,
+                    defining_label=None,
+                    bound_label=bound_label,
+                    universal=False
+                ), position=node.position)]
+            elif not isinstance(arg, Node):
+                # This is a constant, create a concept with type label and
+                # referent (or a variable quantified later; see _resolve_pending)
+                concept = Node(NODE_CONCEPT, ConceptPayload(
+                    type_label=relation_type,
+                    referent=arg,
+                    defining_label=None,
+                    bound_label=None,
+                    universal=False
+                ), position=node.position)
+                self._pending_concepts.append((concept, arg))
+                return [concept]
+        
+        # Map any variables to coreference labels, and nested terms to
+        # actors, which go before the relation
+        translated = []
+        mapped_args = self._map_args(args, translated)
         
         # Create a relation node
-        return Node(NODE_RELATION, {
-            "type": relation_type,
-            "args": mapped_args
-        }, [], node.position)
+        translated.append(Node(NODE_RELATION, RelationPayload(relation_type, mapped_args), position=node.position))
+        return translated
     
     def _translate_quantifier(self, node):
         """
@@ -523,53 +635,39 @@ class CLtoCGIFTranslator:
         Returns:
             list: List of translated CGIF nodes
         """
-        quantifier_type = node.value.get("type")
-        variables = node.value.get("variables", [])
-        types = node.value.get("types", [])
-        
-        # Create concepts for each variable
-        concepts = []
+        quantifier_type, variables, types = node.value
+        self._define_variables(variables, types)
+        universal = quantifier_type == QUANTIFIER_UNIVERSAL
+        position = node.position
+        
+        # Create a quantified concept for each variable, followed by the
+        # translated body, in one list
+        translated = []
+        variable_map = self.variable_map
         for i, var in enumerate(variables):
-            # Get the type if available
-            type_label = types[i] if i < len(types) else "Thing"
-            
-            # Get the coreference label
-            var_info = self.variable_map.get(var)
-            label = var_info["label"] if isinstance(var_info, dict) else var_info
-            
-            # Use the type from the variable map if available
-            if isinstance(var_info, dict) and "type" in var_info and var_info["type"] != "Thing":
-                type_label = var_info["type"]
-            
-            # Create a concept node
-            concept = Node(NODE_CONCEPT, {
-                "type_label": type_label,
-                "referent": label,
-                "defining_label": label,
-                "bound_label": None,
-                "universal": quantifier_type == QUANTIFIER_UNIVERSAL
-            }, [], node.position)
-            
-            # Wrap in quantifier node if universal
-            if quantifier_type == QUANTIFIER_UNIVERSAL:
-                concept = Node(NODE_QUANTIFIER, QUANTIFIER_UNIVERSAL, [concept], node.position)
-            else:
-                concept = Node(NODE_QUANTIFIER, QUANTIFIER_EXISTENTIAL, [concept], node.position)
+            var_info = variable_map[var]
+            label = var_info["label"]
             
-            concepts.append(concept)
+            # Use the type from the variable map if one was given, else
+            # this quantifier's type for the variable
+            type_label = var_info["type"]
+            if type_label == "Thing" and i < len(types):
+                type_label = types[i]
+            
+            concept = Node(NODE_CONCEPT, ConceptPayload(
+                type_label=type_label,
+                referent=label,
+                defining_label=label,
+                bound_label=None,
+                universal=universal
+            ), position=position)
+            translated.append(Node(NODE_QUANTIFIER, quantifier_type, [concept], position))
         
         # Translate the body
-        body_nodes = []
+        dispatch = self._dispatch
         for child in node.children:
-            translated = self._translate_node(child)
-            if translated:
-                if isinstance(translated, list):
-                    body_nodes.extend(translated)
-                else:
-                    body_nodes.append(translated)
-        
-        # Combine concepts and body
-        return concepts + body_nodes
+            translated.extend(dispatch[child.node_type](child))
+        return translated
     
     def _translate_negation(self, node):
         """
@@ -579,19 +677,17 @@ class CLtoCGIFTranslator:
             node (Node): The CL negation node
             
         Returns:
-            Node: The translated CGIF negation node
+            list: The translated CGIF negation node, in a list
         """
         # Translate the child node
         if not node.children:
-            return Node(NODE_NEGATION, None, [], node.position)
+            return [Node(NODE_NEGATION, None, position=node.position)]
         
-        child = self._translate_node(node.children[0])
+        child = node.children[0]
+        translated = self._dispatch[child.node_type](child)
         
-        # Create a context node to hold the child
-        context = Node(NODE_CONTEXT, None, [child] if child else [], node.position)
-        
-        # Create a negation node
-        return Node(NODE_NEGATION, None, [context], node.position)
+        # Negate a context holding the translated child
+        return [self._neg_context(translated, node.position)]
     
     def _translate_and(self, node):
         """
@@ -605,13 +701,9 @@ class CLtoCGIFTranslator:
         """
         # Translate all child nodes
         translated_children = []
+        dispatch = self._dispatch
         for child in node.children:
-            translated = self._translate_node(child)
-            if translated:
-                if isinstance(translated, list):
-                    translated_children.extend(translated)
-                else:
-                    translated_children.append(translated)
+            translated_children.extend(dispatch[child.node_type](child))
         
         return translated_children
     
@@ -623,29 +715,47 @@ class CLtoCGIFTranslator:
             node (Node): The CL OR node
             
         Returns:
-            Node: The translated CGIF negation node
+            list: The translated CGIF negation node, in a list
         """
-        # Translate all child nodes and negate them
+        # Translate all child nodes and negate each in a context of its
+        # own, since '~' is always followed by '[' in CGIF
         negated_children = []
+        dispatch = self._dispatch
         for child in node.children:
-            translated = self._translate_node(child)
+            translated = dispatch[child.node_type](child)
             if translated:
-                if isinstance(translated, list):
-                    # Create a context node to hold the list
-                    context = Node(NODE_CONTEXT, None, translated, node.position)
-                    # Create a negation node
-                    negation = Node(NODE_NEGATION, None, [context], node.position)
-                    negated_children.append(negation)
-                else:
-                    # Create a negation node
-                    negation = Node(NODE_NEGATION, None, [translated], node.position)
-                    negated_children.append(negation)
-        
-        # Create a context node to hold the negated children
-        context = Node(NODE_CONTEXT, None, negated_children, node.position)
-        
-        # Create a negation node (negation of AND of negations = OR)
-        return Node(NODE_NEGATION, None, [context], node.position)
+                negated_children.append(self._neg_context(translated, node.position))
+        
+        # Negate a context holding the negated children (negation of AND
+        # of negations = OR)
+        return [self._neg_context(negated_children, node.position)]
+    
+    def _neg_context(self, children, position):
+        """
+        Build a negated context, ~[ ... ].
+        
+        Args:
+            children (list): The context's nodes
+            position (tuple): Source position for the new nodes
+            
+        Returns:
+            Node: The negation node
+        """
+        return Node(NODE_NEGATION, None, [Node(NODE_CONTEXT, None, children, position)], position)
+    
+    def _implication(self, antecedent, consequent, position):
+        """
+        Build the CGIF form of an implication, ~[ antecedent ~[consequent] ].
+        
+        Args:
+            antecedent (list): The translated antecedent nodes
+            consequent (list): The translated consequent nodes
+            position (tuple): Source position for the new nodes
+            
+        Returns:
+            Node: The negation node
+        """
+        return self._neg_context(antecedent + [self._neg_context(consequent, position)], position)
     
     def _translate_if(self, node):
         """
@@ -655,24 +765,20 @@ class CLtoCGIFTranslator:
             node (Node): The CL IF node
             
         Returns:
-            Node: The translated CGIF negation node
+            list: The translated CGIF negation node, in a list
         """
         if len(node.children) < 2:
             # Not enough children
-            return None
+            return []
         
         # Translate antecedent and consequent
-        antecedent = self._translate_node(node.children[0])
-        consequent = self._translate_node(node.children[1])
-        
-        # Create a negation of consequent
-        neg_consequent = Node(NODE_NEGATION, None, [consequent], node.position)
-        
-        # Create a context node to hold antecedent and negation of consequent
-        context = Node(NODE_CONTEXT, None, [antecedent, neg_consequent], node.position)
+        dispatch = self._dispatch
+        antecedent, consequent = node.children[:2]
+        antecedent = dispatch[antecedent.node_type](antecedent)
+        consequent = dispatch[consequent.node_type](consequent)
         
-        # Create a negation node (negation of antecedent AND negation of consequent = IF)
-        return Node(NODE_NEGATION, None, [context], node.position)
+        # Negation of antecedent AND negation of consequent = IF
+        return [self._implication(antecedent, consequent, node.position)]
     
     def _translate_iff(self, node):
         """
@@ -686,76 +792,66 @@ class CLtoCGIFTranslator:
         """
         if len(node.children) < 2:
             # Not enough children
-            return None
+            return []
         
         # Translate antecedent and consequent
-        antecedent = self._translate_node(node.children[0])
-        consequent = self._translate_node(node.children[1])
-        
-        # Create IF in one direction
-        neg_consequent = Node(NODE_NEGATION, None, [consequent], node.position)
-        context1 = Node(NODE_CONTEXT, None, [antecedent, neg_consequent], node.position)
-        if1 = Node(NODE_NEGATION, None, [context1], node.position)
-        
-        # Create IF in the other direction
-        neg_antecedent = Node(NODE_NEGATION, None, [antecedent], node.position)
-        context2 = Node(NODE_CONTEXT, None, [consequent, neg_antecedent], node.position)
-        if2 = Node(NODE_NEGATION, None, [context2], node.position)
-        
-        return [if1, if2]
+        dispatch = self._dispatch
+        antecedent, consequent = node.children[:2]
+        antecedent = dispatch[antecedent.node_type](antecedent)
+        consequent = dispatch[consequent.node_type](consequent)
+        
+        # IF in each direction; both share the translated nodes
+        return [
+            self._implication(antecedent, consequent, node.position),
+            self._implication(consequent, antecedent, node.position),
+        ]
     
     def _translate_equals(self, node):
         """
         Translate a CL EQUALS to a CGIF relation or function.
         
+        An equation with a function term on one side, (= y (f x)), becomes
+        the actor (f ?x | ?y); any other becomes an Equals relation.
+        
         Args:
             node (Node): The CL EQUALS node
             
         Returns:
-            Node: The translated CGIF relation or function node
+            list: The translated CGIF nodes: the relation or function,
+            after the actors for any nested terms
         """
         if len(node.children) < 2:
             # Not enough children
-            return None
+            return []
         
-        # Check if the second child is a function call
-        if node.children[1].node_type == "FUNCTION_CALL":
-            # This is a function call
-            function_node = node.children[1]
-            result = node.children[0]
-            
-            function_name = function_node.value.get("name")
-            args = function_node.value.get("args", [])
-            
-            # Map any variables to coreference labels
+        left, right = node.children[:2]
+        translated = []
+        
+        # Check if either side is a function term, a FUNCTION_CALL or (as
+        # parsed) a RELATION node; the other side is then its result
+        if isinstance(right, Node):
+            function_node, result = right, left
+        elif isinstance(left, Node):
+            function_node, result = left, right
+        else:
+            # Otherwise, create a relation
             mapped_args = []
-            for arg in args:
-                if arg in self.variable_map:
-                    # This is a variable, use the mapped label
-                    mapped_args.append(self.variable_map[arg].replace("*", "?"))
-                else:
-                    mapped_args.append(arg)
-            
-            # Map result to coreference label
-            mapped_result = None
-            if result in self.variable_map:
-                # This is a variable, use the mapped label
-                mapped_result = self.variable_map[result].replace("*", "?")
-            else:
-                mapped_result = result
-            
-            # Create a function node
-            return Node(NODE_FUNCTION, {
-                "type": function_name,
-                "args": mapped_args,
-                "results": [mapped_result]
-            }, [], node.position)
+            self._map_variable(left, mapped_args)
+            self._map_variable(right, mapped_args)
+            translated.append(Node(NODE_RELATION, RelationPayload("Equals", mapped_args), position=node.position))
+            return translated
         
-        # Otherwise, create a relation
-        return Node(NODE_RELATION, {
-            "type": "Equals",
-            "args": [node.children[0], node.children[1]]
-        }, [], node.position)
+        function_name, args = _term_value(function_node)
+        
+        # Map any variables to coreference labels
+        mapped_args = self._map_args(args, translated)
+        
+        # Map result to coreference label; it may be a term itself
+        mapped_results = self._map_args((result,), translated)
+        
+        # Create a function node
+        translated.append(Node(NODE_FUNCTION, FunctionPayload(function_name, mapped_args, mapped_results), position=node.position))
+        return translated
     
     def _translate_function_call(self, node):
         """
@@ -765,26 +861,18 @@ class CLtoCGIFTranslator:
             node (Node): The CL FUNCTION_CALL node
             
         Returns:
-            Node: The translated CGIF function node
+            list: The translated CGIF function node, after the actors for
+            any nested terms
         """
-        function_name = node.value.get("name")
-        args = node.value.get("args", [])
+        function_name, args = node.value
         
         # Map any variables to coreference labels
-        mapped_args = []
-        for arg in args:
-            if arg in self.variable_map:
-                # This is a variable, use the mapped label
-                mapped_args.append(self.variable_map[arg].replace("*", "?"))
-            else:
-                mapped_args.append(arg)
+        translated = []
+        mapped_args = self._map_args(args, translated)
         
         # Create a function node with no result
-        return Node(NODE_FUNCTION, {
-            "type": function_name,
-            "args": mapped_args,
-            "results": []
-        }, [], node.position)
+        translated.append(Node(NODE_FUNCTION, FunctionPayload(function_name, mapped_args), position=node.position))
+        return translated
 
 
 class Translator:
@@ -799,10 +887,45 @@ class Translator:
     CGIF_TO_CL = "CGIF_TO_CL"
     CL_TO_CGIF = "CL_TO_CGIF"
     
+    # Writer method for each node type, in each output format
+    CGIF_WRITERS = {
+        "EXPRESSION": "_write_cgif_expression",
+        NODE_CONCEPT: "_write_cgif_concept",
+        NODE_RELATION: "_write_cgif_relation",
+        NODE_QUANTIFIER: "_write_cgif_quantifier",
+        NODE_NEGATION: "_write_cgif_negation",
+        NODE_CONTEXT: "_write_cgif_context",
+        NODE_FUNCTION: "_write_cgif_function",
+    }
+    CL_WRITERS = {
+        "EXPRESSION": "_write_cl_expression",
+        NODE_RELATION: "_write_cl_application",
+        NODE_QUANTIFIER: "_write_cl_quantifier",
+        NODE_NEGATION: "_write_cl_negation",
+        "AND": "_write_cl_and",
+        "OR": "_write_cl_or",
+        "IF": "_write_cl_if",
+        "IFF": "_write_cl_iff",
+        "EQUALS": "_write_cl_equals",
+        "FUNCTION_CALL": "_write_cl_application",
+    }
+    
     def __init__(self):
         """Initialize the translator."""
         self.cgif_to_cl = CGIFtoCLTranslator()
         self.cl_to_cgif = CLtoCGIFTranslator()
+        
+        # Formatter for each format type, so choosing one is a dict lookup
+        self._formatters = {
+            "CGIF": self._format_cgif,
+            "CL": self._format_cl,
+        }
+        
+        # Bound writers, so writing a node is one dict lookup. Writers look
+        # up their children's writers here themselves, rather than going
+        # through _write_cgif or _write_cl, so each node costs one call.
+        self._cgif_writers = _Writers((node_type, getattr(self, name)) for node_type, name in self.CGIF_WRITERS.items())
+        self._cl_writers = _Writers((node_type, getattr(self, name)) for node_type, name in self.CL_WRITERS.items())
     
     def translate(self, ast, direction):
         """
@@ -833,12 +956,26 @@ class Translator:
         Returns:
             str: The formatted string
         """
-        if format_type == "CGIF":
-            return self._format_cgif(ast)
-        elif format_type == "CL":
-            return self._format_cl(ast)
-        else:
+        return self.formatter_for(format_type)(ast)
+    
+    def formatter_for(self, format_type):
+        """
+        Get the formatting function for one format type.
+        
+        For callers that format many ASTs in the same format: the returned
+        function takes the AST and returns its text, without choosing the
+        formatter again on every call.
+        
+        Args:
+            format_type (str): The format type (CGIF or CL)
+            
+        Returns:
+            callable: Function taking an AST and returning the formatted string
+        """
+        formatter = self._formatters.get(format_type)
+        if formatter is None:
             raise ValueError(f"Invalid format type: {format_type}")
+        return formatter
     
     def _format_cgif(self, node, indent=0):
         """
@@ -851,67 +988,122 @@ class Translator:
         Returns:
             str: The formatted string
         """
-        if node.node_type == "EXPRESSION":
-            # Format expression
-            return "\n".join(self._format_cgif(child, indent) for child in node.children)
-        elif node.node_type == NODE_CONCEPT:
-            # Format concept
-            type_label = node.value.get("type_label")
-            referent = node.value.get("referent")
-            defining_label = node.value.get("defining_label")
-            bound_label = node.value.get("bound_label")
-            universal = node.value.get("universal")
-            
-            if universal:
-                return " " * indent + f"[{type_label}: @every {defining_label}]"
-            elif type_label and (defining_label or bound_label):
-                return " " * indent + f"[{type_label}: {defining_label or bound_label}]"
-            elif type_label and referent:
-                return " " * indent + f"[{type_label}: {referent}]"
-            elif defining_label:
-                return " " * indent + f"[{defining_label}]"
-            elif bound_label:
-                return " " * indent + f"[{bound_label}]"
-            else:
-                return " " * indent + f"[{referent}]"
-        elif node.node_type == NODE_RELATION:
-            # Format relation
-            relation_type = node.value.get("type")
-            args = node.value.get("args", [])
-            
-            return " " * indent + f"({relation_type} {' '.join(str(arg) for arg in args)})"
-        elif node.node_type == NODE_QUANTIFIER:
-            # Format quantifier
-            if node.value == QUANTIFIER_UNIVERSAL:
-                return self._format_cgif(node.children[0], indent)
-            else:
-                return self._format_cgif(node.children[0], indent)
-        elif node.node_type == NODE_NEGATION:
-            # Format negation
-            if not node.children:
-                return " " * indent + "~[]"
-            
-            return " " * indent + "~" + self._format_cgif(node.children[0], indent)
-        elif node.node_type == NODE_CONTEXT:
-            # Format context
-            if not node.children:
-                return " " * indent + "[]"
-            
-            content = "\n".join(self._format_cgif(child, indent + 2) for child in node.children)
-            return " " * indent + "[\n" + content + "\n" + " " * indent + "]"
-        elif node.node_type == NODE_FUNCTION:
-            # Format function
-            function_type = node.value.get("type")
-            args = node.value.get("args", [])
-            results = node.value.get("results", [])
-            
-            if results:
-                return " " * indent + f"({function_type} {' '.join(str(arg) for arg in args)} | {' '.join(str(result) for result in results)})"
-            else:
-                return " " * indent + f"({function_type} {' '.join(str(arg) for arg in args)})"
+        out = []
+        self._write_cgif(node, " " * indent, out)
+        return "".join(out)
+    
+    def _write_cgif(self, node, pad, out):
+        """
+        Write a CGIF AST node as text.
+        
+        The text is appended to out in pieces, and joined once by
+        _format_cgif(), rather than each node returning a string for its
+        parent to copy into its own. The writer for the node's type is
+        looked up in the table built from CGIF_WRITERS.
+        
+        Args:
+            node (Node): The CGIF AST node
+            pad (str): The indentation of the node's lines
+            out (list): The strings written so far
+        """
+        self._cgif_writers[node.node_type](node, pad, out)
+    
+    def _write_cgif_lines(self, nodes, pad, out):
+        """Write CGIF nodes on separate lines."""
+        writers = self._cgif_writers
+        first = True
+        for child in nodes:
+            if not first:
+                out.append("\n")
+            first = False
+            writers[child.node_type](child, pad, out)
+    
+    def _write_cgif_relation(self, node, pad, out):
+        """Write a CGIF relation."""
+        name, args = node.value
+        # One join serves every arity: it is as fast as formatting a lone
+        # argument directly, and it raises TypeError for any argument that
+        # is not a string, which then takes the slower path below
+        try:
+            out.append(f"{pad}({name} {' '.join(args)})")
+        except TypeError:
+            # An argument that is not a string
+            out.append(f"{pad}({name} {' '.join(map(self._cgif_term, args))})")
+    
+    def _cgif_term(self, arg):
+        """
+        Text of a CGIF argument.
+        
+        Raises:
+            ValueError: If the argument is a node, a nested term that CGIF
+                cannot write in place
+        """
+        if isinstance(arg, Node):
+            raise ValueError(f"Cannot write a nested {arg.node_type} term in CGIF")
+        return str(arg)
+    
+    def _write_cgif_expression(self, node, pad, out):
+        """Write a CGIF expression, one sentence per line."""
+        self._write_cgif_lines(node.children, pad, out)
+    
+    def _write_cgif_concept(self, node, pad, out):
+        """Write a CGIF concept."""
+        type_label, referent, defining_label, bound_label, universal = node.value
+        
+        if universal:
+            out.append(f"{pad}[{type_label}: @every {defining_label}]")
+        elif type_label and (defining_label or bound_label):
+            out.append(f"{pad}[{type_label}: {defining_label or bound_label}]")
+        elif type_label and referent:
+            out.append(f"{pad}[{type_label}: {referent}]")
+        elif defining_label:
+            out.append(f"{pad}[{defining_label}]")
+        elif bound_label:
+            out.append(f"{pad}[{bound_label}]")
+        else:
+            out.append(f"{pad}[{referent}]")
+    
+    def _write_cgif_quantifier(self, node, pad, out):
+        """Write a CGIF quantifier: the quantified concept shows the quantifier."""
+        child = node.children[0]
+        self._cgif_writers[child.node_type](child, pad, out)
+    
+    def _write_cgif_negation(self, node, pad, out):
+        """Write a CGIF negation."""
+        if not node.children:
+            out.append(pad + "~[]")
+            return
+        
+        out.append(pad + "~")
+        child = node.children[0]
+        self._cgif_writers[child.node_type](child, pad, out)
+    
+    def _write_cgif_context(self, node, pad, out):
+        """Write a CGIF context, its contents indented on separate lines."""
+        if not node.children:
+            out.append(pad + "[]")
+            return
+        
+        out.append(pad + "[\n")
+        self._write_cgif_lines(node.children, pad + "  ", out)
+        out.append("\n" + pad + "]")
+    
+    def _write_cgif_function(self, node, pad, out):
+        """Write a CGIF function (actor)."""
+        function_type, args, results = node.value
+        
+        try:
+            arg_text = ' '.join(args)
+            result_text = ' '.join(results)
+        except TypeError:
+            # An argument or result that is not a string
+            arg_text = ' '.join(map(self._cgif_term, args))
+            result_text = ' '.join(map(self._cgif_term, results))
+        
+        if results:
+            out.append(f"{pad}({function_type} {arg_text} | {result_text})")
         else:
-            # Unknown node type
-            return " " * indent + f"<Unknown node type: {node.node_type}>"
+            out.append(f"{pad}({function_type} {arg_text})")
     
     def _format_cl(self, node, indent=0):
         """
@@ -924,87 +1116,136 @@ class Translator:
         Returns:
             str: The formatted string
         """
-        if node.node_type == "EXPRESSION":
-            # Format expression
-            return "\n".join(self._format_cl(child, indent) for child in node.children)
-        elif node.node_type == NODE_RELATION:
-            # Format relation
-            relation_type = node.value.get("type")
-            args = node.value.get("args", [])
-            
-            return " " * indent + f"({relation_type} {' '.join(str(arg) for arg in args)})"
-        elif node.node_type == NODE_QUANTIFIER:
-            # Format quantifier
-            quantifier_type = node.value.get("type")
-            variables = node.value.get("variables", [])
-            types = node.value.get("types", [])
-            
-            # Format variable list
-            var_list = []
-            for i, var in enumerate(variables):
-                if i < len(types) and types[i]:
-                    var_list.append(f"({var} {types[i]})")
-                else:
-                    var_list.append(var)
-            
-            # Format body
-            body = "\n".join(self._format_cl(child, indent + 2) for child in node.children)
-            
-            if quantifier_type == QUANTIFIER_UNIVERSAL:
-                return " " * indent + f"(forall ({' '.join(var_list)})\n{body})"
+        out = []
+        self._write_cl(node, " " * indent, out)
+        return "".join(out)
+    
+    def _write_cl(self, node, pad, out):
+        """
+        Write a CL AST node as text.
+        
+        The text is appended to out in pieces, and joined once by
+        _format_cl(); see _write_cgif(). The writer for the node's type is
+        looked up in the table built from CL_WRITERS.
+        
+        Args:
+            node (Node): The CL AST node
+            pad (str): The indentation of the node's lines
+            out (list): The strings written so far
+        """
+        self._cl_writers[node.node_type](node, pad, out)
+    
+    def _write_cl_lines(self, nodes, pad, out):
+        """Write CL nodes on separate lines."""
+        writers = self._cl_writers
+        first = True
+        for child in nodes:
+            if not first:
+                out.append("\n")
+            first = False
+            writers[child.node_type](child, pad, out)
+    
+    def _write_cl_application(self, node, pad, out):
+        """Write a CL relation or function term."""
+        name, args = node.value
+        # As in _write_cgif_relation, one join for every arity
+        try:
+            out.append(f"{pad}({name} {' '.join(args)})")
+        except TypeError:
+            # An argument that is not a string, such as a nested term
+            out.append(f"{pad}({name} {' '.join(map(self._cl_term, args))})")
+    
+    def _cl_term(self, arg):
+        """Text of a CL argument or equation side, writing a node as a term."""
+        if isinstance(arg, Node):
+            out = []
+            self._cl_writers[arg.node_type](arg, "", out)
+            return "".join(out)
+        return str(arg)
+    
+    def _write_cl_expression(self, node, pad, out):
+        """Write a CL expression, one sentence per line."""
+        self._write_cl_lines(node.children, pad, out)
+    
+    def _write_cl_quantifier(self, node, pad, out):
+        """Write a CL quantified sentence."""
+        quantifier_type, variables, types = node.value
+        
+        # Format variable list
+        var_list = []
+        for i, var in enumerate(variables):
+            if i < len(types) and types[i]:
+                var_list.append(f"({var} {types[i]})")
             else:
-                return " " * indent + f"(exists ({' '.join(var_list)})\n{body})"
-        elif node.node_type == NODE_NEGATION:
-            # Format negation
-            if not node.children:
-                return " " * indent + "(not ())"
-            
-            body = self._format_cl(node.children[0], indent + 2)
-            return " " * indent + f"(not\n{body})"
-        elif node.node_type == "AND":
-            # Format AND
-            if not node.children:
-                return " " * indent + "(and)"
-            
-            body = "\n".join(self._format_cl(child, indent + 2) for child in node.children)
-            return " " * indent + f"(and\n{body})"
-        elif node.node_type == "OR":
-            # Format OR
-            if not node.children:
-                return " " * indent + "(or)"
-            
-            body = "\n".join(self._format_cl(child, indent + 2) for child in node.children)
-            return " " * indent + f"(or\n{body})"
-        elif node.node_type == "IF":
-            # Format IF
-            if len(node.children) < 2:
-                return " " * indent + "(if)"
-            
-            antecedent = self._format_cl(node.children[0], indent + 2)
-            consequent = self._format_cl(node.children[1], indent + 2)
-            return " " * indent + f"(if\n{antecedent}\n{consequent})"
-        elif node.node_type == "IFF":
-            # Format IFF
-            if len(node.children) < 2:
-                return " " * indent + "(iff)"
-            
-            left = self._format_cl(node.children[0], indent + 2)
-            right = self._format_cl(node.children[1], indent + 2)
-            return " " * indent + f"(iff\n{left}\n{right})"
-        elif node.node_type == "EQUALS":
-            # Format EQUALS
-            if len(node.children) < 2:
-                return " " * indent + "(=)"
-            
-            left = self._format_cl(node.children[0], indent + 2) if isinstance(node.children[0], Node) else str(node.children[0])
-            right = self._format_cl(node.children[1], indent + 2) if isinstance(node.children[1], Node) else str(node.children[1])
-            return " " * indent + f"(= {left} {right})"
-        elif node.node_type == "FUNCTION_CALL":
-            # Format FUNCTION_CALL
-            function_name = node.value.get("name")
-            args = node.value.get("args", [])
-            
-            return " " * indent + f"({function_name} {' '.join(str(arg) for arg in args)})"
-        else:
-            # Unknown node type
-            return " " * indent + f"<Unknown node type: {node.node_type}>"
+                var_list.append(var)
+        
+        keyword = "forall" if quantifier_type == QUANTIFIER_UNIVERSAL else "exists"
+        out.append(f"{pad}({keyword} ({' '.join(var_list)})\n")
+        
+        # Format body
+        self._write_cl_lines(node.children, pad + "  ", out)
+        out.append(")")
+    
+    def _write_cl_negation(self, node, pad, out):
+        """Write a CL negation."""
+        if not node.children:
+            out.append(pad + "(not ())")
+            return
+        
+        out.append(pad + "(not\n")
+        child = node.children[0]
+        self._cl_writers[child.node_type](child, pad + "  ", out)
+        out.append(")")
+    
+    def _write_cl_and(self, node, pad, out):
+        """Write a CL conjunction."""
+        if not node.children:
+            out.append(pad + "(and)")
+            return
+        
+        out.append(pad + "(and\n")
+        self._write_cl_lines(node.children, pad + "  ", out)
+        out.append(")")
+    
+    def _write_cl_or(self, node, pad, out):
+        """Write a CL disjunction."""
+        if not node.children:
+            out.append(pad + "(or)")
+            return
+        
+        out.append(pad + "(or\n")
+        self._write_cl_lines(node.children, pad + "  ", out)
+        out.append(")")
+    
+    def _write_cl_if(self, node, pad, out):
+        """Write a CL implication."""
+        if len(node.children) < 2:
+            out.append(pad + "(if)")
+            return
+        
+        out.append(pad + "(if\n")
+        self._write_cl_lines(node.children[:2], pad + "  ", out)
+        out.append(")")
+    
+    def _write_cl_iff(self, node, pad, out):
+        """Write a CL biconditional."""
+        if len(node.children) < 2:
+            out.append(pad + "(iff)")
+            return
+        
+        out.append(pad + "(iff\n")
+        self._write_cl_lines(node.children[:2], pad + "  ", out)
+        out.append(")")
+    
+    def _write_cl_equals(self, node, pad, out):
+        """Write a CL equation; a side may be a term rather than a node."""
+        if len(node.children) < 2:
+            out.append(pad + "(=)")
+            return
+        
+        left, right = node.children[:2]
+        out.append(f"{pad}(= {self._cl_term(left)} {self._cl_term(right)})")
+
+# Shared instance, for callers that do not need their own. translate()
+# resets all per-call state, so one instance serves any number of calls.
+TRANSLATOR = Translator()
@@ -0,0 +1,110 @@
+import unittest
+from parser_module.cgif_parser import CGIFLexer, CGIFParser
+from parser_module.common import NODE_CONCEPT, NODE_RELATION, NODE_QUANTIFIER, NODE_NEGATION, NODE_CONTEXT, NODE_FUNCTION, QUANTIFIER_EXISTENTIAL, ERROR_REFERENCE, MAX_ERRORS
+
+class TestCGIFLexer(unittest.TestCase):
+    def setUp(self):
+        self.lexer = CGIFLexer()
+
+    def test_tokenize_concept_and_relation(self):
+        """Tests token types, values and (line, column) positions for a simple graph."""
+        token_types, token_values, token_lines, token_columns = self.lexer.tokenize("[Cat: *x]\n(On ?x Mat)")
+        self.assertEqual(list(zip(token_types, token_values, zip(token_lines, token_columns))), [
+            (CGIFLexer.TOKEN_LBRACKET, '[', (1, 1)),
+            (CGIFLexer.TOKEN_IDENTIFIER, 'Cat', (1, 2)),
+            (CGIFLexer.TOKEN_COLON, ':', (1, 5)),
+            (CGIFLexer.TOKEN_DEFINING_LABEL, '*x', (1, 7)),
+            (CGIFLexer.TOKEN_RBRACKET, ']', (1, 9)),
+            (CGIFLexer.TOKEN_LPAREN, '(', (2, 1)),
+            (CGIFLexer.TOKEN_IDENTIFIER, 'On', (2, 2)),
+            (CGIFLexer.TOKEN_BOUND_LABEL, '?x', (2, 5)),
+            (CGIFLexer.TOKEN_IDENTIFIER, 'Mat', (2, 8)),
+            (CGIFLexer.TOKEN_RPAREN, ')', (2, 11)),
+        ])
+
+    def test_tokenize_universal_and_invalid_characters(self):
+        """Tests '@every', a bare sigil, and characters outside the grammar."""
+        token_types, token_values, _, _ = self.lexer.tokenize("@every * $")
+        self.assertEqual(list(zip(token_types, token_values)), [
+            (CGIFLexer.TOKEN_UNIVERSAL, '@every'),
+            (CGIFLexer.TOKEN_ERROR, '*'),
+            (CGIFLexer.TOKEN_ERROR, '$'),
+        ])
+
+    def test_tokenize_batches_invalid_character_runs(self):
+        """Tests that consecutive invalid characters form a single ERROR token."""
+        token_types, token_values, _, token_columns = self.lexer.tokenize("[Cat$#%] *")
+        self.assertEqual(list(zip(token_types, token_values, token_columns)), [
+            (CGIFLexer.TOKEN_LBRACKET, '[', 1),
+            (CGIFLexer.TOKEN_IDENTIFIER, 'Cat', 2),
+            (CGIFLexer.TOKEN_ERROR, '$#%', 5),
+            (CGIFLexer.TOKEN_RBRACKET, ']', 8),
+            (CGIFLexer.TOKEN_ERROR, '*', 10),
+        ])
+
+class TestCGIFParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = CGIFParser()
+
+    def test_parse_defining_concept_and_relation(self):
+        """Tests '[Cat: *x] (On ?x Mat)'."""
+        result = self.parser.parse("[Cat: *x] (On ?x Mat)")
+        self.assertTrue(result.success)
+        quantifier, relation = result.ast.children
+
+        self.assertEqual(quantifier.node_type, NODE_QUANTIFIER)
+        self.assertEqual(quantifier.value, QUANTIFIER_EXISTENTIAL)
+        concept = quantifier.children[0]
+        self.assertEqual(concept.node_type, NODE_CONCEPT)
+        self.assertEqual(concept.value.type_label, "Cat")
+        self.assertEqual(concept.value.defining_label, "*x")
+
+        self.assertEqual(relation.node_type, NODE_RELATION)
+        self.assertEqual(relation.value.type, "On")
+        self.assertEqual(relation.value.args, ["?x", "Mat"])
+
+    def test_parse_negated_context_and_function(self):
+        """Tests a negated context and an actor with an output."""
+        result = self.parser.parse("~[ (Add 1 2 | *r) ]")
+        self.assertTrue(result.success)
+        negation = result.ast.children[0]
+        self.assertEqual(negation.node_type, NODE_NEGATION)
+        context = negation.children[0]
+        self.assertEqual(context.node_type, NODE_CONTEXT)
+        function = context.children[0]
+        self.assertEqual(function.node_type, NODE_FUNCTION)
+        self.assertEqual(function.value.type, "Add")
+        self.assertEqual(function.value.args, ["1", "2"])
+        self.assertEqual(function.value.results, ["*r"])
+
+    def test_parse_reports_syntax_errors(self):
+        """Tests that an unclosed concept is reported with its position."""
+        result = self.parser.parse("[Cat: *x")
+        self.assertFalse(result.success)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("Expected ']'", result.errors[0].message)
+
+    def test_parse_reports_unresolved_bound_label(self):
+        """Tests that a bound label without a defining label is a reference error, reported on request."""
+        self.assertTrue(self.parser.parse("[Cat: *x] (On ?x ?y)").success)
+        self.parser.check_references()
+        errors = self.parser.build_errors()
+        self.assertEqual([e.error_type for e in errors], [ERROR_REFERENCE])
+        self.assertIn("'?y'", errors[0].message)
+
+    def test_parse_caps_reported_errors(self):
+        """Tests that an error storm is cut off at MAX_ERRORS plus one summary error."""
+        result = self.parser.parse("$ " * (MAX_ERRORS + 20))
+        self.assertFalse(result.success)
+        self.assertEqual(len(result.errors), MAX_ERRORS + 1)
+        self.assertEqual(result.errors[0].position, (1, 1))
+        self.assertIn("20 more errors", result.errors[-1].message)
+
+    def test_actor_output_defines_label(self):
+        """Tests that a defining label in an actor's output can be referenced."""
+        self.assertTrue(self.parser.parse("(Add 1 2 | *r) [Num: ?r]").success)
+        self.parser.check_references()
+        self.assertEqual(self.parser.build_errors(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from parser_module.cl_parser import CLLexer, CLParser
+from parser_module.common import NODE_RELATION, NODE_QUANTIFIER, NODE_NEGATION, QUANTIFIER_EXISTENTIAL, ERROR_SEMANTIC, MAX_ERRORS
+
+class TestCLLexer(unittest.TestCase):
+    def setUp(self):
+        self.lexer = CLLexer()
+
+    def test_tokenize_atomic_sentence(self):
+        """Tests token types, values, offsets and line starts for '(On x\\n y)'."""
+        token_types, token_values, token_offsets, line_starts = self.lexer.tokenize("(On x\n y)")
+        self.assertEqual(list(zip(token_types, token_values, token_offsets)), [
+            (CLLexer.TOKEN_LPAREN, '(', 0),
+            (CLLexer.TOKEN_IDENTIFIER, 'On', 1),
+            (CLLexer.TOKEN_IDENTIFIER, 'x', 4),
+            (CLLexer.TOKEN_IDENTIFIER, 'y', 7),
+            (CLLexer.TOKEN_RPAREN, ')', 8),
+        ])
+        self.assertEqual(list(line_starts), [0, 6])
+
+    def test_keywords_are_whole_words(self):
+        """Tests that keywords are recognized only as whole identifiers."""
+        token_types, _, _, _ = self.lexer.tokenize("iff if order notable forall exists_1 = $")
+        self.assertEqual(list(token_types), [
+            CLLexer.TOKEN_IFF,
+            CLLexer.TOKEN_IF,
+            CLLexer.TOKEN_IDENTIFIER,
+            CLLexer.TOKEN_IDENTIFIER,
+            CLLexer.TOKEN_FORALL,
+            CLLexer.TOKEN_IDENTIFIER,
+            CLLexer.TOKEN_EQUALS,
+            CLLexer.TOKEN_ERROR,
+        ])
+
+class TestCLParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = CLParser()
+
+    def test_parse_quantified_sentence(self):
+        """Tests '(exists (x y) (and (Cat x) (not (On x y))))'."""
+        result = self.parser.parse("(exists (x y) (and (Cat x) (not (On x y))))")
+        self.assertTrue(result.success)
+        quantifier = result.ast.children[0]
+        self.assertEqual(quantifier.node_type, NODE_QUANTIFIER)
+        self.assertEqual(quantifier.value.type, QUANTIFIER_EXISTENTIAL)
+        self.assertEqual(quantifier.value.variables, ["x", "y"])
+
+        conjunction = quantifier.children[0]
+        self.assertEqual(conjunction.node_type, "AND")
+        relation, negation = conjunction.children
+        self.assertEqual(relation.node_type, NODE_RELATION)
+        self.assertEqual(relation.value.type, "Cat")
+        self.assertEqual(relation.value.args, ("x",))
+        self.assertEqual(negation.node_type, NODE_NEGATION)
+
+    def test_parse_iff_and_keyword_prefixed_predicate(self):
+        """Tests that 'iff' and a predicate such as 'order' are parsed as written."""
+        result = self.parser.parse("(iff (order x) (notable x))")
+        self.assertTrue(result.success)
+        iff = result.ast.children[0]
+        self.assertEqual(iff.node_type, "IFF")
+        self.assertEqual([child.value.type for child in iff.children], ["order", "notable"])
+
+    def test_parse_records_line_and_column_positions(self):
+        """Tests that sentence positions are resolved from token offsets."""
+        result = self.parser.parse("(Cat x)\n\n  (On x\n y)")
+        self.assertTrue(result.success)
+        self.assertEqual([node.position for node in result.ast.children], [(1, 1), (3, 3)])
+
+    def test_parse_fast_omits_node_positions(self):
+        """Tests that parse_fast builds the same tree without node positions."""
+        result = self.parser.parse_fast("(Cat x)\n(not (On x y))")
+        self.assertTrue(result.success)
+        self.assertEqual([node.node_type for node in result.ast.children], [NODE_RELATION, NODE_NEGATION])
+        self.assertEqual([node.position for node in result.ast.children], [None, None])
+        self.assertEqual(self.parser.parse("(Cat x)").ast.children[0].position, (1, 1))
+        self.assertEqual(self.parser.parse_fast("(Cat x").errors[0].position, None)
+        self.assertEqual(self.parser.parse_fast("(Cat x) y").errors[0].position, (1, 9))
+
+    def test_parse_reports_duplicate_quantified_variable(self):
+        """Tests that a variable listed twice in one quantifier is a semantic error."""
+        result = self.parser.parse("(forall (x (y Thing) (x Cat)) (On x y))")
+        self.assertFalse(result.success)
+        self.assertEqual([e.error_type for e in result.errors], [ERROR_SEMANTIC])
+        self.assertEqual(result.errors[0].position, (1, 23))
+        self.assertTrue(self.parser.parse("(forall (x) (exists (x) (Cat x)))").success)
+
+    def test_parse_reports_syntax_errors(self):
+        """Tests that an unclosed sentence is reported."""
+        result = self.parser.parse("(Cat x")
+        self.assertFalse(result.success)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("Expected ')'", result.errors[0].message)
+
+    def test_parse_stops_after_max_errors(self):
+        """Tests that parsing stops at MAX_ERRORS errors plus one summary error."""
+        result = self.parser.parse("x " * (MAX_ERRORS + 5))
+        self.assertEqual(len(result.errors), MAX_ERRORS + 1)
+        self.assertEqual(result.errors[1].position, (1, 3))
+        self.assertIn("parsing stopped", result.errors[-1].message)
+
+    def test_parse_honours_max_errors_argument(self):
+        """Tests that a parser built with max_errors stops at that many errors."""
+        result = CLParser(max_errors=2).parse("x (Cat y) z w")
+        self.assertEqual([error.position for error in result.errors], [(1, 1), (1, 11), None])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,26 @@ class TestModelAndLogic(unittest.TestCase):
         c2 = self.editor.add_cut(c1)
         self.assertEqual(self.editor.get_parent_context(c2), c1)
 
+    def test_parent_context_after_direct_move(self):
+        """Tests that a parent found earlier is not reported once the object is moved."""
+        c1 = self.editor.add_cut()
+        p = self.editor.add_predicate('P', 1, parent_id=c1)
+        self.assertEqual(self.editor.get_parent_context(p), c1)
+        self.model.get_object(c1).children.remove(p)
+        self.model.sheet_of_assertion.children.add(p)
+        self.assertEqual(self.editor.get_parent_context(p), 'SA')
+        self.assertIsNone(self.editor.get_parent_context('SA'))
+
+    def test_add_objects(self):
+        """Tests that objects are added together, or not at all if an id is taken."""
+        line1, line2 = LineOfIdentity(), LineOfIdentity()
+        self.model.add_objects([line1, line2])
+        self.assertIs(self.model.get_object(line2.id), line2)
+        line3 = LineOfIdentity()
+        with self.assertRaises(ValueError):
+            self.model.add_objects([line3, LineOfIdentity(obj_id=line1.id)])
+        self.assertIsNone(self.model.get_object(line3.id))
+
     def test_ligature_creation_and_merge(self):
         """Tests the core logic of creating and merging Lines of Identity."""
         p1 = self.editor.add_predicate('P', 1)
@@ -71,4 +71,14 @@ class TestClifParser(unittest.TestCase):
         new_clif_string = new_translator.translate()
         
         # 5. Assert that the round-trip result is identical
-        self.assertEqual(clif_string, new_clif_string)
\ No newline at end of file
+        self.assertEqual(clif_string, new_clif_string)
+
+    def test_parse_deeply_nested_negation(self):
+        """Tests that nesting deeper than the recursion limit still builds every cut."""
+        depth = 1500
+        self.parser.parse('(not ' * depth + '(P ?x)' + ')' * depth)
+
+        cuts = [obj for obj in self.editor.model.objects.values() if isinstance(obj, Cut)]
+        self.assertEqual(len(cuts), depth)
+        preds = [obj for obj in self.editor.model.objects.values() if isinstance(obj, Predicate)]
+        self.assertEqual(len(preds), 1)
@@ -63,4 +63,10 @@ class TestTranslation(unittest.TestCase):
         self.editor.connect([(r_id, 1), (q_id, 1)])
         
         expected = "(exists (?v1) (and (R ?v1) (not (Q ?v1))))"
-        self.assertEqual(self.translator.translate(), expected)
\ No newline at end of file
+        self.assertEqual(self.translator.translate(), expected)
+
+    def test_partially_connected_binary_predicate(self):
+        """Unconnected hooks are skipped without disturbing argument order."""
+        r_id = self.editor.add_predicate('R', 2)
+        self.editor.connect([(r_id, 2)])
+        self.assertEqual(self.translator.translate(), "(exists (?v1) (R ?v1))")
\ No newline at end of file
@@ -0,0 +1,155 @@
+import unittest
+from parser_module.cgif_parser import CGIFParser
+from parser_module.cl_parser import CLParser
+from parser_module.common import Node, NODE_RELATION, NODE_QUANTIFIER, NODE_NEGATION, NODE_CONCEPT, NODE_CONTEXT, NODE_FUNCTION
+from parser_module.translator import Translator
+
+class TestTranslator(unittest.TestCase):
+    def setUp(self):
+        self.translator = Translator()
+
+    def cgif_to_cl(self, text):
+        return self.translator.translate(CGIFParser().parse(text).ast, Translator.CGIF_TO_CL)
+
+    def cl_to_cgif(self, text):
+        return self.translator.translate(CLParser().parse(text).ast, Translator.CL_TO_CGIF)
+
+    def test_cgif_to_cl_maps_bound_labels(self):
+        """Tests that a bound label becomes the variable of its defining label."""
+        ast = self.cgif_to_cl("[Cat: *x] (On ?x Mat)")
+        quantifier, relation = ast.children
+        self.assertEqual(quantifier.node_type, NODE_QUANTIFIER)
+        self.assertEqual(list(quantifier.value.variables), ["x0"])
+        self.assertEqual(relation.node_type, NODE_RELATION)
+        self.assertEqual(list(relation.value.args), ["x0", "Mat"])
+
+    def test_cgif_to_cl_label_used_before_definition(self):
+        """Tests that a bound label appearing before its defining concept is still mapped."""
+        ast = self.cgif_to_cl("~[ (P ?k) ] [K: *k]")
+        negation, quantifier = ast.children
+        self.assertEqual(list(negation.children[0].value.args), ["x0"])
+        self.assertEqual(list(quantifier.value.variables), ["x0"])
+
+    def test_cl_to_cgif_variable_used_before_quantifier(self):
+        """Tests that a variable used before its quantifier becomes a bound label."""
+        ast = self.cl_to_cgif("(P x) (R x y) (exists (x) (Q x))")
+        concept, relation = ast.children[:2]
+        self.assertEqual(concept.value.bound_label, "?v0")
+        self.assertEqual(list(relation.value.args), ["?v0", "y"])
+
+    def test_cl_to_cgif_negation(self):
+        """Tests that a CL negation becomes a negated CGIF context."""
+        ast = self.cl_to_cgif("(not (Cat a))")
+        negation = ast.children[0]
+        self.assertEqual(negation.node_type, NODE_NEGATION)
+        concept = negation.children[0].children[0]
+        self.assertEqual(concept.node_type, NODE_CONCEPT)
+        self.assertEqual(concept.value.type_label, "Cat")
+
+    def test_cl_to_cgif_nested_conjunction(self):
+        """Tests that a conjunction under a negation or an implication is spliced into the context."""
+        negation = self.cl_to_cgif("(not (and (P a) (Q b)))").children[0]
+        self.assertEqual([c.value.type_label for c in negation.children[0].children], ["P", "Q"])
+
+        implication = self.cl_to_cgif("(if (P a) (and (Q b) (R c)))").children[0]
+        antecedent, neg_consequent = implication.children[0].children
+        self.assertEqual(antecedent.value.type_label, "P")
+        consequent = neg_consequent.children[0]
+        self.assertEqual(consequent.node_type, NODE_CONTEXT)
+        self.assertEqual([c.value.type_label for c in consequent.children], ["Q", "R"])
+
+    def test_cl_to_cgif_negated_operands_reparse(self):
+        """Tests that each negated operand of OR and IF is a context, so the CGIF output parses again."""
+        for text in ("(or (and (P a b)) (Q c d))", "(or (P a) (Q b))", "(if (P a) (Q b))", "(iff (P a) (Q b))"):
+            cgif = self.translator.format_output(self.cl_to_cgif(text), "CGIF")
+            self.assertTrue(CGIFParser().parse(cgif).success, cgif)
+
+        negation = self.cl_to_cgif("(or (P a) (Q b))").children[0]
+        for operand in negation.children[0].children:
+            self.assertEqual(operand.node_type, NODE_NEGATION)
+            self.assertEqual(operand.children[0].node_type, NODE_CONTEXT)
+
+    def test_cl_to_cgif_equals(self):
+        """Tests that an equation between variables becomes an Equals relation."""
+        relation = self.cl_to_cgif("(exists (x) (= x y))").children[1]
+        self.assertEqual(relation.node_type, NODE_RELATION)
+        self.assertEqual(relation.value.type, "Equals")
+        self.assertEqual(list(relation.value.args), ["?v0", "y"])
+
+        relation = self.cl_to_cgif("(= w w)").children[0]
+        self.assertEqual(list(relation.value.args), ["w", "w"])
+
+    def test_cl_to_cgif_equals_function_term(self):
+        """Tests that an equation with a function term becomes an actor for the function."""
+        function = self.cl_to_cgif("(exists (x y) (= x (f y)))").children[2]
+        self.assertEqual(function.node_type, NODE_FUNCTION)
+        self.assertEqual(function.value.type, "f")
+        self.assertEqual(list(function.value.args), ["?v1"])
+        self.assertEqual(list(function.value.results), ["?v0"])
+
+    def test_cl_to_cgif_nested_function_term(self):
+        """Tests that a function term inside a relation gets a label and an actor."""
+        concept, function, relation = self.cl_to_cgif("(P (f x) y)").children
+        self.assertEqual(concept.value.defining_label, "*v0")
+        self.assertEqual(list(function.value.args), ["x"])
+        self.assertEqual(list(function.value.results), ["?v0"])
+        self.assertEqual(list(relation.value.args), ["?v0", "y"])
+
+    def test_cl_to_cgif_sentence_as_term(self):
+        """Tests that a sentence used as an argument is rejected rather than taken for a function term."""
+        for text in ("(P (not (Q a)))", "(P (and (Q a)))", "(P (= x y))", "(P (exists (x) (Q x)))", "(= x (not (Q a)))"):
+            with self.assertRaises(ValueError):
+                self.cl_to_cgif(text)
+
+    def test_formatter_for(self):
+        """Tests that formatter_for returns the formatter used by format_output."""
+        ast = self.cgif_to_cl("[Cat: *x] (On ?x Mat)")
+        self.assertEqual(self.translator.formatter_for("CL")(ast), self.translator.format_output(ast, "CL"))
+        with self.assertRaises(ValueError):
+            self.translator.formatter_for("KIF")
+
+    def test_format_cl(self):
+        """Tests the CL text of nested sentences, each level indented two more spaces."""
+        ast = CLParser().parse("(forall (x) (if (On x m) (not (and (P x) (Q x)))))").ast
+        self.assertEqual(self.translator.format_output(ast, "CL"),
+                         "(forall (x)\n"
+                         "  (if\n"
+                         "    (On x m)\n"
+                         "    (not\n"
+                         "      (and\n"
+                         "        (P x)\n"
+                         "        (Q x)))))")
+
+    def test_format_cl_nested_terms(self):
+        """Tests that nested function terms are written as CL terms."""
+        ast = CLParser().parse("(P (f (g x)) y) (= x (f y z))").ast
+        self.assertEqual(self.translator.format_output(ast, "CL"), "(P (f (g x)) y)\n(= x (f y z))")
+        with self.assertRaises(ValueError):
+            self.translator.format_output(ast, "CGIF")
+
+    def test_format_cgif(self):
+        """Tests the CGIF text of concepts, a negated context and an actor."""
+        ast = CGIFParser().parse("[Cat: *x] ~[ (On ?x Mat) (Add 1 2 | *r) ]").ast
+        self.assertEqual(self.translator.format_output(ast, "CGIF"),
+                         "[Cat: *x]\n"
+                         "~[\n"
+                         "  (On ?x Mat)\n"
+                         "  (Add 1 2 | *r)\n"
+                         "]")
+
+    def test_unknown_node_type(self):
+        """Tests that a node type without a handler is rejected in both directions."""
+        node = Node("EXPRESSION", None, [Node("BOGUS")])
+        with self.assertRaises(ValueError):
+            self.translator.translate(node, Translator.CGIF_TO_CL)
+        with self.assertRaises(ValueError):
+            self.translator.translate(node, Translator.CL_TO_CGIF)
+
+    def test_format_unknown_node_type(self):
+        """Tests that a node type without a writer is formatted as a placeholder."""
+        node = Node("EXPRESSION", None, [Node("BOGUS")])
+        self.assertEqual(self.translator.format_output(node, "CGIF"), "<Unknown node type: BOGUS>")
+        self.assertEqual(self.translator.format_output(node, "CL"), "<Unknown node type: BOGUS>")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+from parser_module.parser import Parser
+from parser_module.common import Node, Error, ERROR_SYNTAX
+
+class TestParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = Parser()
+
+    def test_parse_routes_by_expression_type(self):
+        """Tests that CGIF and CL text reach their own parsers."""
+        self.assertTrue(self.parser.parse("[Cat: *x] (On ?x Mat)", Parser.TYPE_CGIF).success)
+        self.assertTrue(self.parser.parse("(exists (x) (Cat x))", Parser.TYPE_CL).success)
+
+    def test_parse_rejects_unknown_expression_type(self):
+        """Tests that an unknown type gets an invalid-type result naming the type."""
+        result = self.parser.parse("(exists (x) (Cat x))", "KIF")
+        self.assertFalse(result.success)
+        self.assertEqual(result.errors[0]["error_type"], "INVALID_TYPE")
+        self.assertEqual(result.errors[0]["message"], "Invalid expression type: KIF")
+
+    def test_for_type_returns_specialized_parse_function(self):
+        """Tests that for_type hands back the parser for one expression type."""
+        parse_cl = self.parser.for_type(Parser.TYPE_CL)
+        self.assertTrue(parse_cl("(Cat x)").success)
+        self.assertFalse(parse_cl("[Cat: *x]").success)
+        self.assertEqual(self.parser.for_type("KIF")("(Cat x)").errors, self.parser.parse("(Cat x)", "KIF").errors)
+
+    def test_parse_blank_text_returns_empty_expression(self):
+        """Tests that blank text yields an empty expression without parsing."""
+        for expression_type in (Parser.TYPE_CGIF, Parser.TYPE_CL):
+            result = self.parser.parse(" \n\t", expression_type)
+            self.assertTrue(result.success)
+            self.assertEqual(result.ast.node_type, "EXPRESSION")
+            self.assertEqual(len(result.ast.children), 0)
+        self.assertIsNone(self.parser._cl_parser)
+
+    def test_parse_caches_results(self):
+        """Tests that a repeated parse returns the cached, immutable result."""
+        first = self.parser.parse("(Cat x", Parser.TYPE_CL)
+        self.assertIs(self.parser.parse("(Cat x", Parser.TYPE_CL), first)
+        self.assertEqual(len(first.errors), 1)
+        with self.assertRaises(AttributeError):
+            first.success = True
+
+        self.parser.parse("(Cat x)", Parser.TYPE_CL)
+        self.assertIn((Parser.TYPE_CL, "(Cat x)"), self.parser._cache)
+        self.parser.clear_cache()
+        self.assertNotIn((Parser.TYPE_CL, "(Cat x)"), self.parser._cache)
+
+    def test_parse_returns_own_ast(self):
+        """Tests that modifying a parsed AST does not change a later parse of the same text."""
+        for text in ("(On x (f y))", ""):
+            ast = self.parser.parse(text, Parser.TYPE_CL).ast
+            ast.add_child(Node("BOGUS"))
+            again = self.parser.parse(text, Parser.TYPE_CL).ast
+            self.assertIsNot(again, ast)
+            self.assertEqual([child.node_type for child in again.children], ["RELATION"] if text else [])
+
+        ast = self.parser.parse("(On x (f y))", Parser.TYPE_CL).ast
+        ast.children[0].value.args[1].value = None
+        term = self.parser.parse("(On x (f y))", Parser.TYPE_CL).ast.children[0].value.args[1]
+        self.assertEqual(term.value.type, "f")
+
+    def test_suggest_corrections_is_cached_by_message(self):
+        """Tests that suggestions are computed once per expression type, error type and message."""
+        calls = []
+        def suggest(error):
+            calls.append(error)
+            return ["Close the concept"]
+        self.parser._suggest_dispatch[Parser.TYPE_CGIF] = suggest
+        first = Error(ERROR_SYNTAX, "Expected ']'", (1, 5))
+        second = Error(ERROR_SYNTAX, "Expected ']'", (3, 2))
+        self.assertEqual(self.parser.suggest_corrections(first, Parser.TYPE_CGIF), ["Close the concept"])
+        suggestions = self.parser.suggest_corrections(second, Parser.TYPE_CGIF)
+        self.assertEqual(suggestions, ["Close the concept"])
+        self.assertEqual(calls, [first])
+        suggestions.clear()
+        self.assertEqual(self.parser.suggest_corrections(second, Parser.TYPE_CGIF), ["Close the concept"])
+        self.assertEqual(self.parser.suggest_corrections(first, "KIF"), [])
+
+    def test_parse_cl_collapses_repeated_validation_errors(self):
+        """Tests that identical validator errors are reported once, in order."""
+        unbound = Error(ERROR_SYNTAX, "Unbound name 'y'", (1, 8))
+        other = Error(ERROR_SYNTAX, "Unknown predicate 'Cat'", (1, 2))
+        class Validator:
+            def validate(self, ast):
+                return [unbound, other, Error(ERROR_SYNTAX, "Unbound name 'y'", (1, 8))]
+        self.parser.cl_parser  # Load the CL components before replacing the validator
+        self.parser._cl_validator = Validator()
+        result = self.parser.parse_cl("(Cat y)")
+        self.assertFalse(result.success)
+        self.assertEqual(result.errors, (unbound, other))
+
+if __name__ == '__main__':
+    unittest.main()